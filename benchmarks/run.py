@@ -0,0 +1,267 @@
+"""
+성능 벤치마크 실행기
+
+합성 트리를 만들어 주요 작업의 실행 시간, 최대 메모리, 초당 파일 수를 측정하고
+JSON 기준값(baseline)과 비교한다. 작업마다 새 FileManager 를 만들어 측정하므로
+스냅샷 캐시 없이 폴더를 처음 선택했을 때의 비용이 측정된다.
+
+사용 예:
+    python -m benchmarks.run --depth 5 --fanout 4 -o benchmarks/baseline.json
+    python -m benchmarks.run --depth 5 --fanout 4 --baseline benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic_tree import TreeShape, generate_tree
+from src.core.command_executor import CommandExecutor
+from src.core.file_manager import FileManager
+from src.core.merger import FileMerger
+from src.core.tree_generator import TreeGenerator
+
+# 결과 파일 형식 버전 (항목이 바뀌면 올림)
+RESULT_VERSION = 1
+
+# 병렬 스캔 작업에 쓸 스레드 수
+PARALLEL_SCAN_WORKERS = 8
+
+
+def _file_manager(root: str) -> FileManager:
+    """캐시 없는 새 파일 관리자 (.gitignore 규칙 적용)"""
+    file_manager = FileManager(root)
+    file_manager.set_use_gitignore(True)
+    return file_manager
+
+
+def _merge(root: str, extensions: List[str], output_path: str) -> None:
+    """병합 실행 (실패하면 측정 결과를 믿을 수 없으므로 중단)"""
+    if FileMerger(root, _file_manager(root)).merge_files(extensions, output_path=output_path) is None:
+        raise RuntimeError("병합에 실패했습니다.")
+
+
+def build_benchmarks(root: str, output_dir: str, extensions: List[str]) -> Dict[str, Callable[[], object]]:
+    """측정할 작업 목록
+
+    Args:
+        root (str): 합성 트리 경로
+        output_dir (str): 병합 결과를 저장할 폴더 (트리 밖)
+        extensions (List[str]): 트리 출력과 병합에 쓸 확장자
+
+    Returns:
+        Dict[str, Callable[[], object]]: 작업 이름 → 실행 함수
+    """
+    merged = str(Path(output_dir) / 'merged.md')
+    return {
+        'analyze_extensions': lambda: _file_manager(root).analyze_extensions(),
+        'get_file_list': lambda: _file_manager(root).get_file_list(),
+        'get_file_list_parallel': lambda: _file_manager(root).get_file_list(workers=PARALLEL_SCAN_WORKERS),
+        'generate_ascii_tree': lambda: TreeGenerator(root, _file_manager(root)).generate_ascii_tree(extensions),
+        'ps_tree': lambda: CommandExecutor(root, _file_manager(root)).ps_tree(),
+        'cmd_tree': lambda: CommandExecutor(root, _file_manager(root)).cmd_tree(io.StringIO()),
+        'merge_files': lambda: _merge(root, extensions, merged),
+    }
+
+
+def measure(func: Callable[[], object], repeat: int, file_count: int) -> Dict[str, float]:
+    """작업 하나의 실행 시간과 최대 메모리 측정
+
+    시간은 tracemalloc 없이 repeat 번 측정해 최솟값을 쓰고, 메모리는 한 번 더
+    실행하며 tracemalloc 으로 Python 할당의 최댓값을 잰다.
+
+    Args:
+        func (Callable[[], object]): 측정할 작업
+        repeat (int): 반복 횟수
+        file_count (int): 초당 파일 수 계산에 쓸 트리의 파일 수
+
+    Returns:
+        Dict[str, float]: wall_s(최소), median_s, peak_mb, files_per_s
+    """
+    times = []
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        'wall_s': round(best, 6),
+        'median_s': round(statistics.median(times), 6),
+        'peak_mb': round(peak / (1024 * 1024), 3),
+        'files_per_s': round(file_count / best, 1) if best > 0 else 0.0,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """기준값보다 threshold 비율 이상 느려지거나 메모리를 더 쓴 항목 찾기
+
+    Args:
+        results (Dict[str, Dict[str, float]]): 이번 측정 결과
+        baseline (Dict[str, Dict[str, float]]): 기준 측정 결과
+        threshold (float): 허용 비율 (0.2 면 20% 까지 허용)
+
+    Returns:
+        List[str]: 회귀 설명 목록 (없으면 빈 목록)
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key, label in (('wall_s', '실행 시간'), ('peak_mb', '최대 메모리')):
+            if base.get(key) and result[key] > base[key] * (1 + threshold):
+                regressions.append(f"{name}: {label} {base[key]} → {result[key]} "
+                                   f"(+{(result[key] / base[key] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _format_table(results: Dict[str, Dict[str, float]],
+                  baseline: Optional[Dict[str, Dict[str, float]]]) -> str:
+    """결과 표 (기준값이 있으면 비율 포함)"""
+    lines = [f"{'작업':<22}{'시간(s)':>10}{'중앙값(s)':>11}{'메모리(MB)':>12}{'파일/s':>12}{'기준 대비':>10}"]
+    for name, result in results.items():
+        ratio = ''
+        base = (baseline or {}).get(name)
+        if base and base.get('wall_s'):
+            ratio = f"{result['wall_s'] / base['wall_s']:.2f}x"
+        lines.append(f"{name:<22}{result['wall_s']:>10.3f}{result['median_s']:>11.3f}"
+                     f"{result['peak_mb']:>12.2f}{result['files_per_s']:>12.0f}{ratio:>10}")
+    return "\n".join(lines)
+
+
+def _prepare_tree(workdir: Path, shape: TreeShape) -> Dict[str, int]:
+    """작업 폴더에 합성 트리 준비 (같은 모양으로 만든 트리가 있으면 재사용)"""
+    marker = workdir / 'shape.json'
+    tree = workdir / 'tree'
+    if marker.exists() and tree.is_dir():
+        saved = json.loads(marker.read_text(encoding='utf-8'))
+        if saved.get('shape') == shape.to_dict():
+            return saved['stats']
+        shutil.rmtree(tree)
+
+    stats = generate_tree(tree, shape)
+    marker.write_text(json.dumps({'shape': shape.to_dict(), 'stats': stats}), encoding='utf-8')
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서 생성"""
+    defaults = TreeShape()
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+                                     description='합성 트리로 스캔/트리/병합 성능 측정')
+    shape = parser.add_argument_group('합성 트리 모양')
+    shape.add_argument('--depth', type=int, default=defaults.depth, help='폴더 깊이')
+    shape.add_argument('--fanout', type=int, default=defaults.fanout, help='폴더마다 하위 폴더 수')
+    shape.add_argument('--files-per-dir', type=int, default=defaults.files_per_dir, help='폴더마다 파일 수')
+    shape.add_argument('--min-size', type=int, default=defaults.min_file_size, help='파일 최소 크기 (바이트)')
+    shape.add_argument('--max-size', type=int, default=defaults.max_file_size, help='파일 최대 크기 (바이트)')
+    shape.add_argument('--ext-mix', default=defaults.to_dict()['extension_mix'],
+                       help="확장자별 비중 (예: '.py:5,.md:2,none:1')")
+    shape.add_argument('--gitignore-rules', type=int, default=defaults.gitignore_rules,
+                       help='루트 .gitignore 규칙 수')
+    shape.add_argument('--nested-gitignores', type=int, default=defaults.nested_gitignores,
+                       help='하위 폴더 .gitignore 수')
+    shape.add_argument('--binary-ratio', type=float, default=defaults.binary_ratio,
+                       help='바이너리 파일 비율 (0~1)')
+    shape.add_argument('--seed', type=int, default=defaults.seed, help='난수 시드')
+
+    parser.add_argument('--repeat', type=int, default=3, help='작업마다 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='측정할 작업만 지정')
+    parser.add_argument('--workdir', help='합성 트리를 만들 폴더 (지정하면 같은 모양의 트리를 재사용)')
+    parser.add_argument('-o', '--output', help='결과를 JSON 으로 저장할 경로 (기준값으로 사용 가능)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='허용할 회귀 비율 (기본: 0.2 = 20%%)')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 시작점
+
+    Returns:
+        int: 종료 코드 (기준값 대비 회귀가 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+    shape = TreeShape(args.depth, args.fanout, args.files_per_dir, args.min_size, args.max_size,
+                      args.ext_mix, args.gitignore_rules, args.nested_gitignores,
+                      args.binary_ratio, args.seed)
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        if baseline.get('shape') != shape.to_dict():
+            print("경고: 기준 결과와 합성 트리 모양이 다릅니다.", file=sys.stderr)
+
+    temporary = args.workdir is None
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix='file-merger-bench-'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    try:
+        print(f"합성 트리 준비 중: 폴더 {shape.directory_count}개, 파일 {shape.file_count}개", file=sys.stderr)
+        stats = _prepare_tree(workdir, shape)
+        output_dir = workdir / 'out'
+        output_dir.mkdir(exist_ok=True)
+
+        extensions = [ext or 'No Extension' for ext in shape.extension_mix]
+        benchmarks = build_benchmarks(str(workdir / 'tree'), str(output_dir), extensions)
+        names = args.only or list(benchmarks)
+        unknown = [name for name in names if name not in benchmarks]
+        if unknown:
+            print(f"알 수 없는 작업: {', '.join(unknown)} (가능: {', '.join(benchmarks)})", file=sys.stderr)
+            return 2
+
+        results = {}
+        for name in names:
+            print(f"측정 중: {name}", file=sys.stderr)
+            results[name] = measure(benchmarks[name], args.repeat, stats['files'])
+    finally:
+        if temporary:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(_format_table(results, baseline['results'] if baseline else None))
+
+    if args.output:
+        report = {
+            'version': RESULT_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'shape': shape.to_dict(),
+            'tree': stats,
+            'results': results,
+        }
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n",
+                                     encoding='utf-8')
+
+    if baseline:
+        regressions = compare(results, baseline['results'], args.threshold)
+        if regressions:
+            print(f"\n기준값 대비 {args.threshold * 100:.0f}% 넘게 나빠진 항목:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n기준값 대비 회귀 없음 (허용 {args.threshold * 100:.0f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
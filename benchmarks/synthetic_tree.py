@@ -0,0 +1,183 @@
+"""
+벤치마크용 합성 디렉토리 트리 생성기
+
+같은 모양(TreeShape)과 시드로 만들면 항상 같은 트리가 생성되므로
+다른 시점/브랜치의 측정 결과를 비교할 수 있다.
+"""
+
+import random
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Tuple, Union
+
+# 텍스트 파일 내용을 채울 때 반복하는 줄
+_TEXT_LINES = (
+    "def handler(request, *args, **kwargs):\n",
+    "    # 요청을 처리하고 결과를 반환\n",
+    "    return {'status': 'ok', 'items': [1, 2, 3]}\n",
+    "\n",
+    "class Service:\n",
+    "    name = 'synthetic'\n",
+)
+
+
+class TreeShape:
+    """합성 트리의 모양"""
+
+    def __init__(self,
+                 depth: int = 4,
+                 fanout: int = 4,
+                 files_per_dir: int = 8,
+                 min_file_size: int = 256,
+                 max_file_size: int = 16 * 1024,
+                 extension_mix: Union[str, Dict[str, int], None] = None,
+                 gitignore_rules: int = 20,
+                 nested_gitignores: int = 2,
+                 binary_ratio: float = 0.05,
+                 seed: int = 1):
+        """초기화
+
+        Args:
+            depth (int, optional): 루트 아래 폴더 깊이. Defaults to 4.
+            fanout (int, optional): 폴더마다 만들 하위 폴더 수. Defaults to 4.
+            files_per_dir (int, optional): 폴더마다 만들 파일 수. Defaults to 8.
+            min_file_size (int, optional): 파일 최소 크기 (바이트). Defaults to 256.
+            max_file_size (int, optional): 파일 최대 크기 (바이트). Defaults to 16 KB.
+            extension_mix (Union[str, Dict[str, int], None], optional): 확장자별 비중.
+                '.py:5,.md:2' 형식의 문자열도 가능. Defaults to .py/.md/.txt/.json/확장자 없음.
+            gitignore_rules (int, optional): 루트 .gitignore 규칙 수. Defaults to 20.
+            nested_gitignores (int, optional): 하위 폴더에 둘 .gitignore 수. Defaults to 2.
+            binary_ratio (float, optional): 바이너리 파일 비율 (0~1). Defaults to 0.05.
+            seed (int, optional): 난수 시드. Defaults to 1.
+        """
+        self.depth = depth
+        self.fanout = fanout
+        self.files_per_dir = files_per_dir
+        self.min_file_size = min_file_size
+        self.max_file_size = max(min_file_size, max_file_size)
+        if isinstance(extension_mix, str):
+            extension_mix = self.parse_extension_mix(extension_mix)
+        self.extension_mix = extension_mix or {'.py': 5, '.md': 2, '.txt': 1, '.json': 1, '': 1}
+        self.gitignore_rules = gitignore_rules
+        self.nested_gitignores = nested_gitignores
+        self.binary_ratio = binary_ratio
+        self.seed = seed
+
+    @staticmethod
+    def parse_extension_mix(text: str) -> Dict[str, int]:
+        """'.py:5,.md:2,none:1' 형식의 문자열을 확장자별 비중으로 변환 ('none' 은 확장자 없음)"""
+        mix = {}
+        for item in text.split(','):
+            ext, _, weight = item.strip().partition(':')
+            ext = '' if ext == 'none' else ext if ext.startswith('.') else f'.{ext}'
+            mix[ext] = int(weight or 1)
+        return mix
+
+    @property
+    def directory_count(self) -> int:
+        """생성될 폴더 수 (루트 포함)"""
+        return sum(self.fanout ** level for level in range(self.depth + 1))
+
+    @property
+    def file_count(self) -> int:
+        """생성될 파일 수 (.gitignore 제외)"""
+        return self.directory_count * self.files_per_dir
+
+    def to_dict(self) -> Dict[str, object]:
+        """결과 파일에 기록할 설정값"""
+        return {
+            'depth': self.depth,
+            'fanout': self.fanout,
+            'files_per_dir': self.files_per_dir,
+            'min_file_size': self.min_file_size,
+            'max_file_size': self.max_file_size,
+            'extension_mix': ','.join(f"{ext or 'none'}:{weight}"
+                                      for ext, weight in self.extension_mix.items()),
+            'gitignore_rules': self.gitignore_rules,
+            'nested_gitignores': self.nested_gitignores,
+            'binary_ratio': self.binary_ratio,
+            'seed': self.seed,
+        }
+
+
+def _gitignore_lines(count: int, rng: random.Random) -> List[str]:
+    """이름/경로/와일드카드/재포함 규칙이 섞인 .gitignore 내용"""
+    kinds = (
+        lambda i: f"*.tmp{i}",
+        lambda i: f"build{i}/",
+        lambda i: f"/generated{i}",
+        lambda i: f"**/cache{i}/**",
+        lambda i: f"secret{i}.txt",
+        lambda i: f"!keep{i}.tmp{i}",
+        lambda i: f"d{i % 4}/f{i}_*.log",
+    )
+    return [rng.choice(kinds)(i) + "\n" for i in range(count)]
+
+
+def _text_content(size: int, rng: random.Random) -> bytes:
+    """지정한 크기에 맞춘 텍스트 파일 내용"""
+    lines = []
+    total = 0
+    while total < size:
+        line = rng.choice(_TEXT_LINES)
+        lines.append(line)
+        total += len(line.encode('utf-8'))
+    # 잘린 멀티바이트 문자는 버려 항상 올바른 UTF-8 로 만듦
+    return ''.join(lines).encode('utf-8')[:size].decode('utf-8', 'ignore').encode('utf-8')
+
+
+def generate_tree(root: Union[str, Path], shape: TreeShape) -> Dict[str, int]:
+    """합성 트리 생성
+
+    Args:
+        root (Union[str, Path]): 트리를 만들 폴더 (없으면 만듦, 비어 있어야 함)
+        shape (TreeShape): 트리 모양
+
+    Returns:
+        Dict[str, int]: 생성한 폴더/파일/바이너리 파일 수와 전체 바이트 수
+    """
+    rng = random.Random(shape.seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    extensions = list(shape.extension_mix)
+    weights = [shape.extension_mix[ext] for ext in extensions]
+    stats = {'dirs': 0, 'files': 0, 'binary_files': 0, 'bytes': 0}
+
+    (root / '.gitignore').write_text(''.join(_gitignore_lines(shape.gitignore_rules, rng)),
+                                     encoding='utf-8')
+
+    # (폴더 경로, 깊이) 를 폭 우선으로 생성
+    queue: Deque[Tuple[Path, int]] = deque([(root, 0)])
+    directories: List[Path] = []
+    while queue:
+        directory, level = queue.popleft()
+        directories.append(directory)
+        stats['dirs'] += 1
+
+        for i in range(shape.files_per_dir):
+            ext = rng.choices(extensions, weights)[0]
+            size = rng.randint(shape.min_file_size, shape.max_file_size)
+            if rng.random() < shape.binary_ratio:
+                content = b'\x89PNG\r\n\x1a\n' + rng.randbytes(max(0, size - 8))
+                stats['binary_files'] += 1
+            else:
+                content = _text_content(size, rng)
+            (directory / f"f{i}{ext}").write_bytes(content)
+            stats['files'] += 1
+            stats['bytes'] += len(content)
+
+        if level < shape.depth:
+            for i in range(shape.fanout):
+                child = directory / f"d{i}"
+                child.mkdir()
+                queue.append((child, level + 1))
+
+    # 하위 폴더의 .gitignore 는 위에서부터 고르게 배치
+    nested = [d for d in directories if d != root][:shape.nested_gitignores]
+    for directory in nested:
+        (directory / '.gitignore').write_text(
+            ''.join(_gitignore_lines(max(1, shape.gitignore_rules // 4), rng)), encoding='utf-8')
+
+    return stats
+
@@ -0,0 +1,329 @@
+"""
+File Manager CLI
+
+GUI 없이 병합, 트리 출력, 확장자 분석, 파일 수 집계를 실행하는 명령줄 진입점.
+tkinter 를 가져오지 않으므로 화면이 없는 빌드 서버에서도 사용할 수 있다.
+
+사용 예:
+    python -m src merge <폴더> --ext .py .md --gitignore
+    python -m src tree <폴더> --format list
+    python -m src tree <폴더> --format graph
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+from src.core.estimator import MergeEstimator, STRATEGIES, STRATEGY_SMALLEST
+from src.core.file_manager import FileManager
+from src.core.merge_output import COMPRESSIONS
+from src.core.merger import FileMerger, MAX_IN_FLIGHT_BYTES
+from src.core.sniffer import DEFAULT_ENCODINGS
+from src.core.tree_generator import TreeGenerator
+from src.utils.helpers import format_size
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser, with_excludes: bool = True) -> None:
+    """하위 명령어 공통 인자 추가"""
+    parser.add_argument('root', help='대상 폴더 경로')
+    parser.add_argument('--gitignore', action='store_true',
+                        help='.gitignore 규칙 적용')
+    parser.add_argument('--max-depth', type=int, metavar='N',
+                        help='루트 아래로 내려갈 최대 폴더 깊이 (기본: 제한 없음)')
+    parser.add_argument('--no-follow-symlinks', action='store_true',
+                        help='심볼릭 링크를 건너뜀 (기본: 따라가되 순환 링크는 내려가지 않음)')
+    parser.add_argument('--scan-workers', type=int, default=0, metavar='N',
+                        help='디렉토리 목록을 동시에 읽을 스레드 수 (네트워크 드라이브용, 기본: 0 = 순차)')
+    parser.add_argument('--stats', action='store_true',
+                        help='단계별 소요 시간, 카운터, 파일 시스템 호출(scandir/stat) 수를 표준 에러로 출력')
+    parser.add_argument('--metrics', metavar='FILE',
+                        help='단계별 소요 시간, 카운터, 파일 시스템 호출 수를 JSON 으로 저장')
+    if with_excludes:
+        parser.add_argument('--exclude-file', action='append', default=[], metavar='NAME',
+                            help='제외할 파일 이름 (여러 번 지정 가능)')
+        parser.add_argument('--exclude-folder', action='append', default=[], metavar='PATH',
+                            help='제외할 폴더 (루트 기준 상대 경로, 여러 번 지정 가능)')
+
+
+def _add_extension_argument(parser: argparse.ArgumentParser, required: bool = False) -> None:
+    """확장자 인자 추가"""
+    parser.add_argument('--ext', nargs='+', required=required, metavar='EXT',
+                        help='포함할 확장자 (예: .py .md). 확장자 없는 파일은 "No Extension"')
+
+
+def _normalize_extensions(extensions: Optional[List[str]]) -> Optional[List[str]]:
+    """'py' 처럼 점 없이 입력한 확장자를 '.py' 로 보정"""
+    if not extensions:
+        return None
+    return [ext if ext == 'No Extension' or ext.startswith('.') else f'.{ext}'
+            for ext in extensions]
+
+
+def _normalize_folders(folders: List[str]) -> List[str]:
+    """GUI 입력 형식('/폴더')과 같이 앞의 '/' 를 제거"""
+    return [folder.lstrip('/').replace('\\', '/') for folder in folders]
+
+
+def _create_file_manager(args: argparse.Namespace) -> FileManager:
+    """인자로부터 FileManager 생성"""
+    file_manager = FileManager(args.root)
+    file_manager.set_use_gitignore(args.gitignore)
+    file_manager.set_traversal_options(args.max_depth, not args.no_follow_symlinks)
+    file_manager.set_scan_workers(args.scan_workers)
+    args.file_manager = file_manager  # --stats 출력용
+    return file_manager
+
+
+def _print_stats(file_manager: FileManager) -> None:
+    """단계별 소요 시간/카운터와 파일 시스템 호출 수 출력"""
+    snapshot = file_manager.snapshot
+    summary = file_manager.metrics.summary()
+    if summary:
+        print(f"metrics: {summary}", file=sys.stderr)
+    print(f"syscalls: {snapshot.syscall_count} "
+          f"(scandir {snapshot.scandir_calls}, stat {snapshot.stat_calls}, "
+          f"sniff {snapshot.sniff_calls})", file=sys.stderr)
+
+
+def _write_metrics(file_manager: FileManager, path: str) -> None:
+    """단계별 소요 시간/카운터와 파일 시스템 호출 수를 JSON 으로 저장"""
+    Path(path).write_text(json.dumps(file_manager.metrics_report(), ensure_ascii=False, indent=2) + "\n",
+                          encoding='utf-8')
+
+
+def _add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    """예산 선택 인자 추가"""
+    parser.add_argument('--budget-bytes', type=int, metavar='BYTES',
+                        help='내용을 포함할 파일 크기 합의 상한 (넘는 파일은 이름만 표시)')
+    parser.add_argument('--budget-tokens', type=int, metavar='TOKENS',
+                        help='내용을 포함할 파일의 추정 토큰 합의 상한')
+    parser.add_argument('--strategy', choices=STRATEGIES, default=STRATEGY_SMALLEST,
+                        help='예산 안에서 파일을 고르는 순서 (기본: smallest, 작은 파일부터)')
+    parser.add_argument('--priority', nargs='+', default=[], metavar='PATH',
+                        help='directory 방식에서 먼저 포함할 폴더 (앞에 쓸수록 우선)')
+
+
+def _select_budget(args: argparse.Namespace, file_manager: FileManager,
+                   extensions: List[str], exclude_folders: List[str]) -> Optional[Set[str]]:
+    """예산이 지정되었으면 포함할 파일 경로 집합 반환"""
+    if not (args.budget_bytes or args.budget_tokens):
+        return None
+    estimate = MergeEstimator(file_manager).estimate(
+        extensions, args.exclude_file, exclude_folders, getattr(args, 'max_file_size', None))
+    selected, skipped = MergeEstimator.select_within_budget(
+        estimate.entries, args.budget_bytes, args.budget_tokens,
+        args.strategy, _normalize_folders(args.priority))
+    print(f"예산 선택: 파일 {len(selected)}개 포함, {len(skipped)}개 제외", file=sys.stderr)
+    return {entry.path for entry in selected}
+
+
+def _cmd_merge(args: argparse.Namespace) -> int:
+    """파일 병합"""
+    file_manager = _create_file_manager(args)
+    extensions = _normalize_extensions(args.ext)
+    exclude_folders = _normalize_folders(args.exclude_folder)
+    include_paths = _select_budget(args, file_manager, extensions, exclude_folders)
+
+    merger = FileMerger(args.root, file_manager)
+    try:
+        output_path = merger.merge_files(
+            extensions,
+            args.exclude_file,
+            exclude_folders,
+            encoding=args.encoding,
+            fallback_encodings=args.fallback_encodings,
+            workers=args.workers,
+            max_in_flight_bytes=args.max_in_flight,
+            use_cache=args.cache,
+            output_path=args.output,
+            max_file_size=args.max_file_size,
+            split_bytes=args.split_bytes,
+            split_tokens=args.split_tokens,
+            compression=args.compress,
+            compression_level=args.compress_level,
+            output_dir=args.output_dir,
+            include_paths=include_paths
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f'파일 병합 중 오류가 발생했습니다: {e}', file=sys.stderr)
+        return 1
+    if not output_path:
+        print('파일 병합 중 오류가 발생했습니다.', file=sys.stderr)
+        return 1
+
+    print(output_path)
+    if args.split_bytes or args.split_tokens:
+        for path in merger.last_output_paths:
+            if path != output_path:
+                print(f"  {path}", file=sys.stderr)
+    if merger.last_cache_stats:
+        print(merger.last_cache_stats, file=sys.stderr)
+    return 0
+
+
+def _cmd_tree(args: argparse.Namespace) -> int:
+    """트리 구조 출력 (결과를 모으지 않고 바로 기록)"""
+    file_manager = _create_file_manager(args)
+    extensions = _normalize_extensions(args.ext)
+    exclude_folders = _normalize_folders(args.exclude_folder)
+
+    outfile = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        if args.format == 'list':
+            file_list = file_manager.get_file_list(extensions, args.exclude_file, exclude_folders)
+            outfile.writelines(f"{path}\n" for path, _ in file_list)
+        else:
+            file_manager.prefetch(exclude_folders=exclude_folders)
+            tree_generator = TreeGenerator(args.root, file_manager)
+            tree_generator.mark_binary = args.mark_binary
+            write_tree = (tree_generator.write_graph_tree if args.format == 'graph'
+                          else tree_generator.write_ascii_tree)
+            write_tree(outfile, extensions, args.exclude_file, exclude_folders)
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    if args.output:
+        print(args.output)
+    return 0
+
+
+def _cmd_estimate(args: argparse.Namespace) -> int:
+    """병합 크기 추정 (바이너리 확인용 앞부분 외에는 파일을 읽지 않음)"""
+    file_manager = _create_file_manager(args)
+    extensions = _normalize_extensions(args.ext)
+    exclude_folders = _normalize_folders(args.exclude_folder)
+    estimate = MergeEstimator(file_manager).estimate(
+        extensions, args.exclude_file, exclude_folders, directory_depth=args.depth)
+    print(estimate.format())
+
+    if args.budget_bytes or args.budget_tokens:
+        selected, skipped = MergeEstimator.select_within_budget(
+            estimate.entries, args.budget_bytes, args.budget_tokens,
+            args.strategy, _normalize_folders(args.priority))
+        print(f"\n예산 선택 ({args.strategy}): 파일 {len(selected)}개 "
+              f"({format_size(sum(e.size for e in selected))}) 포함, {len(skipped)}개 제외")
+        for entry in skipped:
+            print(f"  - {entry.rel_path} ({format_size(entry.size)})")
+    return 0
+
+
+def _cmd_extensions(args: argparse.Namespace) -> int:
+    """확장자 분석 결과 출력"""
+    file_manager = _create_file_manager(args)
+    extensions, has_no_extension = file_manager.analyze_extensions()
+    for ext in sorted(extensions):
+        print(ext)
+    if has_no_extension:
+        print('No Extension')
+    return 0
+
+
+def _cmd_count(args: argparse.Namespace) -> int:
+    """파일/폴더 수 출력"""
+    file_manager = _create_file_manager(args)
+    file_count, folder_count = file_manager.count(_normalize_extensions(args.ext))
+    print(f"files: {file_count}")
+    print(f"folders: {folder_count}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='파일 시스템 탐색 및 파일 병합 도구 (CLI)'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    merge_parser = subparsers.add_parser('merge', help='선택한 확장자의 파일을 하나의 마크다운으로 병합')
+    _add_common_arguments(merge_parser)
+    _add_extension_argument(merge_parser, required=True)
+    merge_parser.add_argument('-o', '--output', help='출력 파일 경로 (기본: 출력 폴더의 <날짜>-<폴더명>-merged.md)')
+    merge_parser.add_argument('--output-dir', help='기본 이름으로 저장할 출력 폴더 (기본: 대상 폴더)')
+    merge_parser.add_argument('--encoding', default='utf-8', help='파일 인코딩 (기본: utf-8)')
+    merge_parser.add_argument('--fallback-encodings', nargs='*', default=list(DEFAULT_ENCODINGS[1:]),
+                              metavar='ENC',
+                              help='--encoding 으로 읽을 수 없을 때 시도할 인코딩 '
+                                   f'(기본: {" ".join(DEFAULT_ENCODINGS[1:])}, 값 없이 쓰면 사용 안 함). '
+                                   'BOM 과 파일 앞부분으로 먼저 감지함')
+    merge_parser.add_argument('--workers', type=int, default=0,
+                              help='파일을 미리 읽을 스레드 수 (기본: 0, 순차 처리)')
+    merge_parser.add_argument('--max-in-flight', type=int, default=MAX_IN_FLIGHT_BYTES,
+                              metavar='BYTES', help='미리 읽어 둘 최대 바이트 수')
+    merge_parser.add_argument('--max-file-size', type=int, metavar='BYTES',
+                              help='내용을 포함할 최대 파일 크기 (초과하면 이름과 크기만 표시)')
+    merge_parser.add_argument('--split-bytes', type=int, metavar='BYTES',
+                              help='출력 파일 하나의 최대 크기. 넘으면 -part-N.md 로 나누고 -index.md 에 목록 기록')
+    merge_parser.add_argument('--split-tokens', type=int, metavar='TOKENS',
+                              help='출력 파일 하나의 최대 토큰 수 (4문자 = 1토큰으로 어림)')
+    merge_parser.add_argument('--compress', choices=sorted(COMPRESSIONS),
+                              help='결과를 압축 스트림으로 바로 기록 (.gz/.bz2/.xz 가 붙음)')
+    merge_parser.add_argument('--compress-level', type=int, metavar='LEVEL',
+                              help='압축 수준 (gzip/bz2 1-9, xz 0-9, 기본: gzip 6, bz2 9, xz 6)')
+    merge_parser.add_argument('--cache', action='store_true',
+                              help='변경되지 않은 파일은 병합 캐시 사용')
+    _add_budget_arguments(merge_parser)
+    merge_parser.set_defaults(func=_cmd_merge)
+
+    estimate_parser = subparsers.add_parser('estimate', help='병합 결과 크기(바이트/줄/토큰) 추정')
+    _add_common_arguments(estimate_parser)
+    _add_extension_argument(estimate_parser, required=True)
+    estimate_parser.add_argument('--depth', type=int, default=1,
+                                 help='폴더별 집계에 쓸 경로 깊이 (기본: 1, 최상위 폴더)')
+    _add_budget_arguments(estimate_parser)
+    estimate_parser.set_defaults(func=_cmd_estimate)
+
+    tree_parser = subparsers.add_parser('tree', help='트리 구조 출력')
+    _add_common_arguments(tree_parser)
+    _add_extension_argument(tree_parser)
+    tree_parser.add_argument('--format', choices=('ascii', 'graph', 'list'), default='ascii',
+                             help='출력 형식 (기본: ascii, graph 는 Windows tree /F 형식)')
+    tree_parser.add_argument('--mark-binary', action='store_true',
+                             help='파일 앞부분을 읽어 바이너리 파일에 (바이너리) 표시 (ascii/graph 형식)')
+    tree_parser.add_argument('-o', '--output', help='결과를 저장할 파일 경로 (기본: 표준 출력)')
+    tree_parser.set_defaults(func=_cmd_tree)
+
+    ext_parser = subparsers.add_parser('extensions', help='포함된 파일 확장자 목록 출력')
+    _add_common_arguments(ext_parser, with_excludes=False)
+    ext_parser.set_defaults(func=_cmd_extensions)
+
+    count_parser = subparsers.add_parser('count', help='파일/폴더 수 출력')
+    _add_common_arguments(count_parser, with_excludes=False)
+    _add_extension_argument(count_parser)
+    count_parser.set_defaults(func=_cmd_count)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 시작점
+
+    Args:
+        argv (Optional[List[str]], optional): 명령줄 인자. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not Path(args.root).is_dir():
+        parser.error(f"폴더를 찾을 수 없습니다: {args.root}")
+
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        file_manager = getattr(args, 'file_manager', None)
+        if file_manager is not None:
+            if args.stats:
+                _print_stats(file_manager)
+            if args.metrics:
+                _write_metrics(file_manager, args.metrics)
@@ -1,7 +1,9 @@
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, TextIO
 from src.core.file_manager import FileManager
+from src.core.progress import Progress
+from src.core.tree_generator import TreeGenerator
 import platform
 import os
 
@@ -16,42 +18,41 @@ class CommandExecutor:
         """gitignore 규칙 적용 여부 설정"""
         self.file_manager.set_use_gitignore(use_gitignore)
 
-    def execute_command(self, command: str) -> tuple[str, str]:
-        """명령어 실행
+    def cmd_tree(self,
+                 outfile: TextIO,
+                 progress: Optional[Progress] = None,
+                 mark_binary: bool = False) -> int:
+        """CMD `tree /F` 형식으로 트리 구조 출력
+
+        셸에서 tree 명령을 실행하지 않고 TreeGenerator 로 같은 형식을 만들므로
+        운영체제와 관계없이 동작하며 .gitignore 규칙도 적용된다. 결과를 문자열로
+        모으지 않고 줄 묶음 단위로 outfile 에 바로 기록한다.
 
         Args:
-            command (str): 실행할 명령어
+            outfile (TextIO): 기록할 텍스트 파일 객체 (출력 영역 스트림 가능)
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+            mark_binary (bool, optional): 바이너리 파일 표시 여부. Defaults to False.
 
         Returns:
-            tuple[str, str]: (표준 출력, 표준 에러)
+            int: 기록한 줄 수
         """
-        try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                shell=True
-            )
-            return result.stdout, result.stderr
-        except Exception as e:
-            return "", str(e)
-
-    def cmd_tree(self) -> tuple[str, str]:
-        """CMD tree 명령어로 트리 구조 출력"""
-        command = f'tree "{self.root_path}" /F'
-        return self.execute_command(command)
+        tree_generator = TreeGenerator(str(self.root_path), self.file_manager)
+        tree_generator.mark_binary = mark_binary
+        return tree_generator.write_graph_tree(outfile, progress=progress)
 
-    def ps_tree(self) -> tuple[str, str]:
+    def ps_tree(self, progress: Optional[Progress] = None) -> tuple[str, str]:
         """PowerShell로 트리 구조 출력"""
         # .gitignore 적용된 파일 목록 가져오기
-        file_list = self.file_manager.get_file_list()
+        file_list = self.file_manager.get_file_list(progress=progress)
         output = "\n".join([path for path, is_dir in file_list])
         return output, ""
 
-    def ps_tree_extensions(self, extensions: Optional[List[str]] = None) -> tuple[str, str]:
+    def ps_tree_extensions(self,
+                           extensions: Optional[List[str]] = None,
+                           progress: Optional[Progress] = None) -> tuple[str, str]:
         """PowerShell로 선택된 확장자의 파일만 출력"""
         # .gitignore 적용된 파일 목록 가져오기 (확장자 필터링)
-        file_list = self.file_manager.get_file_list(extensions=extensions)
+        file_list = self.file_manager.get_file_list(extensions=extensions, progress=progress)
         output = "\n".join([path for path, is_dir in file_list])
         return output, ""
 
@@ -0,0 +1,188 @@
+import posixpath
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from src.core.file_manager import FileManager
+from src.core.progress import Progress
+from src.core.snapshot import ScanEntry
+from src.utils.helpers import CHARS_PER_TOKEN, estimate_tokens, format_size
+
+# 줄 수를 어림할 때 쓰는 한 줄의 평균 바이트 수 (소스 코드 기준)
+AVG_LINE_BYTES = 40
+# 병합 출력에서 파일 하나마다 붙는 헤더와 코드 블록 표시의 대략적인 크기 (경로 길이 제외)
+SECTION_OVERHEAD_BYTES = 24
+
+# 예산 선택 방식
+STRATEGY_SMALLEST = 'smallest'    # 작은 파일부터 (가장 많은 파일 포함)
+STRATEGY_DIRECTORY = 'directory'  # 우선순위 폴더의 파일부터, 같은 순위에서는 작은 파일부터
+STRATEGIES = (STRATEGY_SMALLEST, STRATEGY_DIRECTORY)
+
+
+class EstimateRow:
+    """확장자 또는 폴더 하나의 집계"""
+
+    __slots__ = ('key', 'files', 'bytes', 'lines')
+
+    def __init__(self, key: str):
+        self.key = key
+        self.files = 0
+        self.bytes = 0
+        self.lines = 0  # 추정 줄 수 (내용이 있는 파일은 최소 1줄)
+
+    def add(self, size: int) -> None:
+        self.files += 1
+        self.bytes += size
+        self.lines += -(-size // AVG_LINE_BYTES)
+
+    @property
+    def tokens(self) -> int:
+        """추정 토큰 수"""
+        return estimate_tokens(self.bytes)
+
+    def format(self) -> str:
+        return (f"{self.key:<24} 파일 {self.files:>6}개  {format_size(self.bytes):>9}  "
+                f"약 {self.lines:>8}줄  약 {self.tokens:>9}토큰")
+
+
+class MergeEstimate:
+    """병합 전 크기 추정 결과"""
+
+    def __init__(self):
+        self.total = EstimateRow('합계')
+        self.by_extension: Dict[str, EstimateRow] = {}
+        self.by_directory: Dict[str, EstimateRow] = {}
+        self.output_bytes = 0  # 헤더와 코드 블록 표시를 포함한 예상 출력 크기
+        self.entries: List[ScanEntry] = []
+        self.binary_files = 0  # 병합 시 이름만 기록되는 바이너리 파일 수
+
+    def add(self, entry: ScanEntry, directory: str, overhead: int) -> None:
+        """파일 하나를 집계에 추가"""
+        ext = entry.extension or 'No Extension'
+        self.total.add(entry.size)
+        self.by_extension.setdefault(ext, EstimateRow(ext)).add(entry.size)
+        self.by_directory.setdefault(directory, EstimateRow(directory)).add(entry.size)
+        self.output_bytes += entry.size + overhead
+        self.entries.append(entry)
+
+    def add_binary(self, overhead: int) -> None:
+        """내용 없이 이름만 기록될 바이너리 파일 하나를 집계에 추가"""
+        self.binary_files += 1
+        self.output_bytes += overhead
+
+    def format(self) -> str:
+        """보고서 문자열"""
+        lines = ["[확장자별]"]
+        lines.extend(row.format() for row in
+                     sorted(self.by_extension.values(), key=lambda r: r.bytes, reverse=True))
+        lines.append("")
+        lines.append("[폴더별]")
+        lines.extend(row.format() for row in
+                     sorted(self.by_directory.values(), key=lambda r: r.bytes, reverse=True))
+        lines.append("")
+        lines.append(self.total.format())
+        if self.binary_files:
+            lines.append(f"바이너리 파일 {self.binary_files}개는 내용 없이 이름만 기록되어 합계에서 제외됨")
+        lines.append(f"예상 출력 크기: {format_size(self.output_bytes)} "
+                     f"(약 {estimate_tokens(self.output_bytes)}토큰)")
+        return "\n".join(lines)
+
+
+class MergeEstimator:
+    """파일 내용을 읽지 않고 스캔 결과의 크기만으로 병합 결과 크기를 추정하는 클래스
+
+    바이너리 여부만 파일 앞부분으로 확인하며, 결과는 스냅샷에 캐시되어 병합 때 다시 읽지 않는다.
+    """
+
+    def __init__(self, file_manager: FileManager):
+        self.file_manager = file_manager
+
+    def estimate(self,
+                 extensions: List[str],
+                 exclude_files: Optional[List[str]] = None,
+                 exclude_folders: Optional[List[str]] = None,
+                 max_file_size: Optional[int] = None,
+                 directory_depth: int = 1,
+                 progress: Optional[Progress] = None) -> MergeEstimate:
+        """병합될 파일의 바이트, 줄, 토큰 수를 확장자별/폴더별로 추정
+
+        Args:
+            extensions (List[str]): 병합할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            max_file_size (Optional[int], optional): 병합 시 내용을 포함할 최대 파일 크기
+            directory_depth (int, optional): 폴더별 집계에 쓸 경로 깊이 (1 이면 최상위 폴더). Defaults to 1.
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            MergeEstimate: 추정 결과 (entries 에 내용이 포함될 파일 목록, 바이너리 파일 제외)
+        """
+        estimate = MergeEstimate()
+        root = str(self.file_manager.root_path)
+        snapshot = self.file_manager.snapshot
+        with self.file_manager.metrics.phase('estimate'):
+            for entry in self.file_manager.iter_files(extensions, exclude_files, exclude_folders, progress):
+                if max_file_size is not None and entry.size > max_file_size:
+                    continue
+                overhead = SECTION_OVERHEAD_BYTES + len(root) + len(entry.rel_path)
+                if snapshot.is_binary(entry):
+                    # 병합과 같은 규칙으로 바이너리 파일은 내용 크기와 예산 후보에서 뺌
+                    estimate.add_binary(overhead)
+                    continue
+                parent = posixpath.dirname(entry.rel_path)
+                directory = '/'.join(parent.split('/')[:directory_depth]) if parent else '.'
+                estimate.add(entry, directory, overhead)
+        return estimate
+
+    @staticmethod
+    def select_within_budget(entries: Iterable[ScanEntry],
+                             budget_bytes: Optional[int] = None,
+                             budget_tokens: Optional[int] = None,
+                             strategy: str = STRATEGY_SMALLEST,
+                             directory_priority: Optional[Sequence[str]] = None
+                             ) -> Tuple[List[ScanEntry], List[ScanEntry]]:
+        """예산 안에 들어가는 파일을 우선순위대로 선택
+
+        Args:
+            entries (Iterable[ScanEntry]): 후보 파일
+            budget_bytes (Optional[int], optional): 선택한 파일 크기 합의 상한
+            budget_tokens (Optional[int], optional): 선택한 파일 추정 토큰 합의 상한
+            strategy (str, optional): 'smallest' 또는 'directory'. Defaults to 'smallest'.
+            directory_priority (Optional[Sequence[str]], optional): 'directory' 방식에서
+                먼저 포함할 폴더 목록 (앞에 있을수록 우선, 루트 기준 상대 경로)
+
+        Returns:
+            Tuple[List[ScanEntry], List[ScanEntry]]: (선택한 파일, 예산 초과로 제외한 파일)
+
+        Raises:
+            ValueError: 알 수 없는 선택 방식인 경우
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"알 수 없는 선택 방식: {strategy}")
+
+        limit = None
+        if budget_bytes:
+            limit = budget_bytes
+        if budget_tokens:
+            token_limit = budget_tokens * CHARS_PER_TOKEN  # 토큰 예산을 바이트로 환산
+            limit = min(limit, token_limit) if limit else token_limit
+
+        priorities = [folder.strip('/').replace('\\', '/') for folder in directory_priority or []]
+
+        def rank(entry: ScanEntry) -> int:
+            for i, folder in enumerate(priorities):
+                if entry.rel_path.startswith(folder + '/') or not folder:
+                    return i
+            return len(priorities)
+
+        if strategy == STRATEGY_DIRECTORY:
+            ordered = sorted(entries, key=lambda e: (rank(e), e.size, e.rel_path))
+        else:
+            ordered = sorted(entries, key=lambda e: (e.size, e.rel_path))
+
+        selected, skipped = [], []
+        used = 0
+        for entry in ordered:
+            if limit is None or used + entry.size <= limit:
+                selected.append(entry)
+                used += entry.size
+            else:
+                skipped.append(entry)
+        return selected, skipped
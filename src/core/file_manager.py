@@ -1,8 +1,14 @@
+import time
 from pathlib import Path
-from typing import Set, List, Tuple, Optional
-import os
-from src.utils.helpers import normalize_path, get_file_extension
+from typing import Dict, Iterable, Iterator, Set, List, Sequence, Tuple, Optional
+from src.utils.helpers import normalize_path
 from .gitignore_parser import GitignoreParser
+from .merge_output import is_merge_output
+from .metrics import Metrics
+from .path_trie import FolderTrie
+from .progress import Progress
+from .snapshot import DirectorySnapshot, ScanEntry, SnapshotDelta
+from .sniffer import detect_encoding, read_head
 
 
 class FileManager:
@@ -10,111 +16,420 @@ class FileManager:
 
     def __init__(self, root_path: str):
         self.root_path = Path(root_path)
-        self.gitignore_parser = GitignoreParser(root_path)
+        self.snapshot = DirectorySnapshot(root_path)
+        self.gitignore_parser = GitignoreParser(root_path, self.snapshot)
         self.use_gitignore = False  # 기본값 False로 변경
+        self.scan_workers = 0  # 디렉토리 목록을 동시에 읽을 스레드 수 (0 이면 순차 스캔)
 
+    @property
+    def metrics(self) -> Metrics:
+        """스냅샷을 공유하는 모든 작업의 단계별 시간과 카운터"""
+        return self.snapshot.metrics
+
+    def reset_metrics(self) -> None:
+        """작업 단위 측정을 위해 단계별 시간, 카운터, 시스템 호출 수 초기화"""
+        self.snapshot.metrics.reset()
+        self.snapshot.reset_counters()
+
+    def metrics_report(self) -> Dict[str, Dict[str, float]]:
+        """단계별 시간, 카운터, 시스템 호출 수 (JSON 으로 내보내기용)"""
+        return self.metrics.to_dict({
+            'scandir': self.snapshot.scandir_calls,
+            'stat': self.snapshot.stat_calls,
+            'sniff': self.snapshot.sniff_calls,
+        })
+
+    def refresh(self) -> None:
+        """파일 시스템 변경 후 스냅샷과 .gitignore 규칙을 다시 로드"""
+        self.snapshot.invalidate()
+        self.gitignore_parser.load_gitignore()
+        self.snapshot.scan()
+
+    def apply_changes(self, rel_dirs: Iterable[str]) -> SnapshotDelta:
+        """감시기가 알려준 디렉토리만 다시 읽어 스냅샷에 반영
+
+        Args:
+            rel_dirs (Iterable[str]): 내용이 바뀐 디렉토리의 루트 기준 상대 경로
+
+        Returns:
+            SnapshotDelta: 추가/삭제/수정된 항목 (.gitignore 가 바뀌었으면 규칙도 다시 로드됨)
+        """
+        delta = self.snapshot.apply_changes(rel_dirs)
+        if delta.gitignore_changed:
+            self.gitignore_parser.load_gitignore()
+        return delta
 
     def set_use_gitignore(self, use_gitignore: bool):
         self.use_gitignore = use_gitignore
 
+    def set_traversal_options(self, max_depth: Optional[int] = None,
+                              follow_symlinks: bool = True) -> None:
+        """탐색 깊이와 심볼릭 링크 처리 방식 설정 (모든 탐색/트리/병합에 적용)
+
+        Args:
+            max_depth (Optional[int], optional): 루트 아래로 내려갈 최대 폴더 깊이. None 이면 제한 없음.
+            follow_symlinks (bool, optional): 폴더 심볼릭 링크를 따라갈지 여부.
+                따라가더라도 상위 폴더를 가리키는 링크(순환)는 내려가지 않는다.
+        """
+        self.snapshot.set_traversal_options(max_depth, follow_symlinks)
+
+    def set_scan_workers(self, workers: int) -> None:
+        """디렉토리 목록을 동시에 읽을 스레드 수 설정
+
+        네트워크 드라이브(NFS/SMB)처럼 디렉토리 하나를 읽는 데 왕복 지연이 있는 경우
+        여러 디렉토리를 동시에 읽어 탐색 시간을 줄인다. 결과 순서는 순차 스캔과 같다.
+
+        Args:
+            workers (int): 스레드 수. 0 또는 1 이면 순차 스캔.
+        """
+        self.scan_workers = max(0, workers)
+
+    def prefetch(self,
+                 workers: Optional[int] = None,
+                 use_gitignore: Optional[bool] = None,
+                 exclude_folders: Optional[List[str]] = None,
+                 progress: Optional[Progress] = None) -> int:
+        """탐색 전에 하위 디렉토리 목록을 스레드 풀로 미리 읽어 스냅샷에 캐시
+
+        순회할 때 내려가지 않을 폴더(.gitignore, 제외 폴더)는 읽지 않는다.
+        규칙 확인 결과는 실제 순회에서 다시 기록되므로 여기서는 카운터에 남기지 않는다.
+
+        Args:
+            workers (Optional[int], optional): 스레드 수. Defaults to scan_workers.
+            use_gitignore (Optional[bool], optional): .gitignore 규칙 적용 여부.
+                Defaults to use_gitignore 토글.
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 취소 확인용 객체
+
+        Returns:
+            int: 새로 읽은 디렉토리 수 (스레드 수가 1 이하면 읽지 않고 0)
+        """
+        workers = self.scan_workers if workers is None else workers
+        if workers <= 1:
+            return 0
+        use_gitignore = self.use_gitignore if use_gitignore is None else use_gitignore
+        excluded = FolderTrie(exclude_folders)
+
+        def prune(entry: ScanEntry) -> bool:
+            if use_gitignore and self.gitignore_parser.match(entry.rel_path, entry.is_dir):
+                return True
+            return excluded.contains(entry.rel_path)
+
+        with self.metrics.phase('scan'):
+            return self.snapshot.prefetch('', workers, prune, progress)
+
     def should_ignore(self, path: str) -> bool:
         """파일/폴더를 무시해야 하는지 확인"""
         return self.use_gitignore and self.gitignore_parser.should_ignore(path)
 
-    def analyze_extensions(self) -> Tuple[Set[str], bool]:
+    def is_ignored(self, entry: ScanEntry) -> bool:
+        """순회 중인 스냅샷 항목을 무시해야 하는지 확인
+
+        상위 폴더는 순회 과정에서 이미 걸러졌으므로 항목 자신만 검사한다.
+        """
+        return self.use_gitignore and self._match_gitignore(entry)
+
+    def _match_gitignore(self, entry: ScanEntry) -> bool:
+        """.gitignore 규칙 확인 (소요 시간과 제외된 항목 수를 기록)"""
+        started = time.perf_counter()
+        ignored = self.gitignore_parser.match(entry.rel_path, entry.is_dir)
+        self.metrics.add_time('gitignore', time.perf_counter() - started)
+        if ignored:
+            self.metrics.add('ignored_gitignore')
+        return ignored
+
+    def count(self,
+              extensions: Optional[List[str]] = None,
+              progress: Optional[Progress] = None) -> Tuple[int, int]:
+        """파일과 폴더 수 계산 (.gitignore 적용 시 무시된 폴더는 탐색하지 않음)
+
+        Args:
+            extensions (Optional[List[str]], optional): 셀 파일 확장자 목록. Defaults to None.
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            Tuple[int, int]: (파일 수, 폴더 수)
+        """
+        with self.metrics.phase('count'):
+            return self.snapshot.count(extensions,
+                                       prune=self.is_ignored if self.use_gitignore else None,
+                                       progress=progress)
+
+    def analyze_extensions(self,
+                           progress: Optional[Progress] = None,
+                           workers: Optional[int] = None) -> Tuple[Set[str], bool]:
         """디렉토리 내의 모든 파일 확장자를 분석
 
+        Args:
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+            workers (Optional[int], optional): 디렉토리 목록을 동시에 읽을 스레드 수.
+                Defaults to scan_workers.
+
         Returns:
             Tuple[Set[str], bool]: (확장자 집합, 확장자 없는 파일 존재 여부)
         """
-        extensions = set()
-        has_no_extension = False
+        counts = self.extension_counts(progress, workers)
+        return {ext for ext in counts if ext}, '' in counts
 
-        for root, _, files in os.walk(self.root_path):
-            # .gitignore 규칙 확인
-            if self.gitignore_parser.should_ignore(root):
-                continue
+    def extension_counts(self,
+                         progress: Optional[Progress] = None,
+                         workers: Optional[int] = None) -> Dict[str, int]:
+        """확장자별 파일 수 (.gitignore 규칙은 항상 적용)
+
+        변경 감시로 파일이 추가/삭제될 때 count_changes 결과를 더해 확장자 목록을
+        다시 탐색하지 않고 갱신할 수 있도록 개수까지 센다.
+
+        Args:
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+            workers (Optional[int], optional): 디렉토리 목록을 동시에 읽을 스레드 수.
+                Defaults to scan_workers.
+
+        Returns:
+            Dict[str, int]: 확장자 → 파일 수 ('' 는 확장자 없는 파일)
+        """
+        counts: Dict[str, int] = {}
+        self.prefetch(workers, use_gitignore=True, progress=progress)
+
+        # .gitignore 규칙에 걸린 폴더는 하위로 내려가지 않음
+        with self.metrics.phase('analyze'):
+            for _, _, files in self.snapshot.walk(prune=self._match_gitignore, progress=progress):
+                for entry in files:
+                    counts[entry.extension] = counts.get(entry.extension, 0) + 1
+
+        return counts
+
+    def count_changes(self,
+                      delta: SnapshotDelta,
+                      extensions: Optional[List[str]] = None,
+                      progress: Optional[Progress] = None
+                      ) -> Optional[Tuple[Dict[str, int], int, int]]:
+        """스냅샷 변경 내역만으로 확장자별 파일 수와 파일/폴더 수의 증감 계산
+
+        extension_counts(.gitignore 항상 적용)와 count(토글에 따름)를 다시 실행한 결과와
+        같아지도록 항목마다 상위 폴더까지 규칙을 확인하며, 새로 생긴 폴더는 그 하위만 읽는다.
+
+        Args:
+            delta (SnapshotDelta): apply_changes 가 반환한 변경 내역
+            extensions (Optional[List[str]], optional): 파일 수를 셀 확장자 목록 (count 와 같음)
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
 
-            for file in files:
-                file_path = os.path.join(root, file)
-                if self.gitignore_parser.should_ignore(file_path):
+        Returns:
+            Optional[Tuple[Dict[str, int], int, int]]: (확장자별 파일 수 증감, 파일 수 증감, 폴더 수 증감).
+                .gitignore 가 바뀌었거나 최대 깊이가 설정되어 있어 다시 세야 하면 None
+        """
+        if delta.gitignore_changed or self.snapshot.max_depth is not None:
+            return None
+
+        extension_changes: Dict[str, int] = {}
+        file_change = 0
+        folder_change = 0
+        visible: Dict[str, bool] = {}  # 상위 폴더 → 무시되지 않았는지 여부
+
+        def selected(entry: ScanEntry) -> bool:
+            return not extensions or entry.extension in extensions or (
+                entry.extension == '' and 'No Extension' in extensions)
+
+        def tally(entry: ScanEntry, sign: int) -> None:
+            nonlocal file_change, folder_change
+            if self._is_counted(entry, True, visible):
+                if not entry.is_dir:
+                    extension_changes[entry.extension] = extension_changes.get(entry.extension, 0) + sign
+                elif sign > 0:
+                    # 새 폴더는 아직 읽지 않았으므로 하위까지 읽어 셈
+                    for _, _, files in self.snapshot.walk(entry.rel_path, prune=self._match_gitignore,
+                                                          progress=progress):
+                        for child in files:
+                            extension_changes[child.extension] = extension_changes.get(child.extension, 0) + 1
+            if self._is_counted(entry, self.use_gitignore, visible):
+                if not entry.is_dir:
+                    file_change += sign if selected(entry) else 0
+                    return
+                folder_change += sign
+                if sign > 0:
+                    for _, dirs, files in self.snapshot.walk(
+                            entry.rel_path, prune=self.is_ignored if self.use_gitignore else None,
+                            progress=progress):
+                        folder_change += len(dirs)
+                        file_change += sum(1 for child in files if selected(child))
+
+        with self.metrics.phase('count'):
+            # 삭제된 폴더의 하위 항목은 removed 에 함께 들어 있으므로 항목별로 뺌
+            for entry in delta.removed:
+                tally(entry, -1)
+            for entry in delta.added:
+                tally(entry, 1)
+
+        return ({ext: change for ext, change in extension_changes.items() if change},
+                file_change, folder_change)
+
+    def _is_counted(self, entry: ScanEntry, use_gitignore: bool, visible: Dict[str, bool]) -> bool:
+        """항목이 루트부터 순회했을 때 나오는 항목인지 확인 (상위 폴더 포함)
+
+        상위 폴더부터 차례로 확인하므로 .gitignore 규칙은 이미 순회된 폴더에 대해서만 조회된다.
+
+        Args:
+            entry (ScanEntry): 확인할 항목
+            use_gitignore (bool): .gitignore 규칙 적용 여부
+            visible (Dict[str, bool]): 상위 폴더별 .gitignore 확인 결과 캐시
+
+        Returns:
+            bool: 순회 대상이면 True
+        """
+        if entry.is_symlink and not self.snapshot.follow_symlinks:
+            return False
+        if not use_gitignore:
+            return True
+
+        parts = entry.rel_path.split('/')
+        for i in range(1, len(parts)):
+            folder = '/'.join(parts[:i])
+            if folder not in visible:
+                visible[folder] = not self.gitignore_parser.match(folder, True)
+            if not visible[folder]:
+                return False
+        return not self.gitignore_parser.match(entry.rel_path, entry.is_dir)
+
+    def _walk_filtered(self,
+                       extensions: Optional[List[str]],
+                       exclude_files: Optional[List[str]],
+                       exclude_folders: Optional[List[str]],
+                       progress: Optional[Progress],
+                       force_gitignore: bool
+                       ) -> Iterator[Tuple[List[ScanEntry], List[ScanEntry]]]:
+        """제외 조건과 확장자를 적용하며 스냅샷 순회
+
+        Args:
+            extensions (Optional[List[str]]): 포함할 확장자 목록
+            exclude_files (Optional[List[str]]): 제외할 파일 목록
+            exclude_folders (Optional[List[str]]): 제외할 폴더 목록
+            progress (Optional[Progress]): 진행 상황 기록 및 취소 확인용 객체
+            force_gitignore (bool): True 면 토글과 관계없이 .gitignore 규칙 적용
+
+        Yields:
+            Tuple[List[ScanEntry], List[ScanEntry]]: 디렉토리별 (폴더 목록, 조건에 맞는 파일 목록)
+        """
+        exclude_files = set(exclude_files or [])
+        excluded = FolderTrie(exclude_folders)
+        use_gitignore = force_gitignore or self.use_gitignore
+
+        metrics = self.metrics
+
+        def prune(entry: ScanEntry) -> bool:
+            # .gitignore 규칙 확인 (무시된 폴더는 하위로 내려가지 않음)
+            if use_gitignore and self._match_gitignore(entry):
+                return True
+            # 제외 폴더 확인
+            if entry.is_dir and excluded.contains(entry.rel_path):
+                metrics.add('excluded_folder')
+                return True
+            return False
+
+        for _, dirs, files in self.snapshot.walk(prune=prune, progress=progress):
+            selected = []
+            for entry in files:
+                if entry.name in exclude_files:
+                    metrics.add('excluded_file')
                     continue
 
-                _, ext = os.path.splitext(file)
-                if ext:
-                    extensions.add(ext)
-                else:
-                    has_no_extension = True
+                if extensions:
+                    ext = entry.extension
+                    if ext not in extensions and not (ext == '' and 'No Extension' in extensions):
+                        metrics.add('filtered_extension')
+                        continue
 
-        return extensions, has_no_extension
+                selected.append(entry)
+            yield dirs, selected
 
     def get_file_list(self,
                       extensions: Optional[List[str]] = None,
                       exclude_files: Optional[List[str]] = None,
-                      exclude_folders: Optional[List[str]] = None) -> List[Tuple[str, bool]]:
+                      exclude_folders: Optional[List[str]] = None,
+                      progress: Optional[Progress] = None,
+                      workers: Optional[int] = None) -> List[Tuple[str, bool]]:
         """조건에 맞는 파일 목록을 반환
 
         Args:
             extensions (Optional[List[str]], optional): 포함할 확장자 목록
             exclude_files (Optional[List[str]], optional): 제외할 파일 목록
             exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+            workers (Optional[int], optional): 디렉토리 목록을 동시에 읽을 스레드 수.
+                Defaults to scan_workers.
 
         Returns:
             List[Tuple[str, bool]]: (파일 경로, 디렉토리 여부) 목록
         """
         result = []
-        exclude_files = set(exclude_files or [])
-        exclude_folders = set(exclude_folders or [])
+        self.prefetch(workers, use_gitignore=True, exclude_folders=exclude_folders, progress=progress)
+        with self.metrics.phase('file_list'):
+            for dirs, files in self._walk_filtered(extensions, exclude_files, exclude_folders,
+                                                   progress, force_gitignore=True):
+                # 디렉토리 추가
+                for entry in dirs:
+                    result.append((normalize_path(entry.path), True))
 
-        for root, dirs, files in os.walk(self.root_path):
-            # .gitignore 규칙 확인
-            if self.gitignore_parser.should_ignore(root):
-                continue
-
-            rel_path = Path(root).relative_to(self.root_path)
-            str_rel_path = str(rel_path).replace('\\', '/')
+                # 파일 추가
+                for entry in files:
+                    result.append((normalize_path(entry.path), False))
 
-            # 제외 폴더 확인
-            if any(str_rel_path.startswith(f) for f in exclude_folders):
-                continue
-
-            # 디렉토리 추가
-            if str_rel_path != '.':
-                result.append((normalize_path(root), True))
-
-            # 파일 추가
-            for file in files:
-                if file in exclude_files:
-                    continue
+        return sorted(result, key=lambda x: (not x[1], x[0].lower()))
 
-                file_path = os.path.join(root, file)
-                if self.gitignore_parser.should_ignore(file_path):
-                    continue
+    def iter_files(self,
+                   extensions: Optional[List[str]] = None,
+                   exclude_files: Optional[List[str]] = None,
+                   exclude_folders: Optional[List[str]] = None,
+                   progress: Optional[Progress] = None) -> Iterator[ScanEntry]:
+        """병합 대상과 같은 조건(.gitignore 토글 포함)으로 파일 항목을 생성
 
-                if extensions:
-                    ext = get_file_extension(file)
-                    if ext not in extensions and not (ext == '' and 'No Extension' in extensions):
-                        continue
+        get_file_list 와 같은 필터를 쓰지만 .gitignore 는 토글이 켜진 경우에만 적용하고,
+        병합기처럼 이전 병합 결과 파일은 건너뛰며, 경로 문자열 대신 크기와 수정 시각이
+        담긴 스냅샷 항목을 돌려준다.
 
-                result.append((normalize_path(file_path), False))
+        Args:
+            extensions (Optional[List[str]], optional): 포함할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
 
-        return sorted(result, key=lambda x: (not x[1], x[0].lower()))
+        Yields:
+            ScanEntry: 조건에 맞는 파일 항목
+        """
+        for _, files in self._walk_filtered(extensions, exclude_files, exclude_folders,
+                                            progress, force_gitignore=False):
+            for entry in files:
+                if not is_merge_output(entry.name):
+                    yield entry
 
-    def read_file_content(self, file_path: str, encoding: str = 'utf-8') -> Optional[str]:
+    def read_file_content(self, file_path: str, encoding: str = 'utf-8',
+                          fallback_encodings: Optional[Sequence[str]] = None) -> Optional[str]:
         """파일 내용을 읽어서 반환
 
         Args:
             file_path (str): 파일 경로
             encoding (str, optional): 인코딩. Defaults to 'utf-8'.
+            fallback_encodings (Optional[Sequence[str]], optional): encoding 으로 읽을 수 없을 때
+                차례로 시도할 인코딩 목록. 지정하면 BOM 과 파일 앞부분으로 먼저 감지한다.
 
         Returns:
             Optional[str]: 파일 내용, 실패시 None
         """
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            return None
+        encodings = list(dict.fromkeys([encoding, *(fallback_encodings or [])]))
+        if len(encodings) > 1:
+            try:
+                head, complete = read_head(file_path)
+            except OSError:
+                head, complete = b'', True
+            detected = detect_encoding(head, encodings, complete)
+            if detected:
+                encodings = [detected] + [e for e in encodings if e != detected]
+
+        for candidate in encodings:
+            try:
+                with open(file_path, 'r', encoding=candidate) as f:
+                    return f.read()
+            except UnicodeDecodeError:
+                continue
+        return None
 
     def write_file(self, file_path: str, content: str, encoding: str = 'utf-8') -> bool:
         """파일에 내용을 기록
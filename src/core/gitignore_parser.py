@@ -1,91 +1,357 @@
 import os
 import re
 from pathlib import Path
-from typing import List, Pattern
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+from .snapshot import DirectorySnapshot
+
+# glob 특수 문자 (이 문자가 없는 패턴은 문자열 비교로 처리)
+_GLOB_CHARS = re.compile(r'[*?\[\\]')
+
+
+class _RuleGroup:
+    """부호(무시/재포함)가 같은 연속된 규칙을 하나로 합친 그룹"""
+
+    __slots__ = ('negate', 'names', 'dir_names', 'paths', 'dir_paths', 'regex', 'dir_regex')
+
+    def __init__(self, negate: bool):
+        self.negate = negate
+        # 와일드카드가 없는 규칙은 집합 조회로 처리
+        self.names: Set[str] = set()       # 이름만으로 비교하는 규칙
+        self.dir_names: Set[str] = set()   # 이름 + 디렉토리 전용 규칙
+        self.paths: Set[str] = set()       # 루트 기준 경로 규칙
+        self.dir_paths: Set[str] = set()   # 루트 기준 경로 + 디렉토리 전용 규칙
+        # 나머지는 하나의 정규식 alternation 으로 합침
+        self.regex: Optional[Pattern] = None
+        self.dir_regex: Optional[Pattern] = None
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """그룹 내 규칙 중 하나라도 일치하는지 확인"""
+        if name in self.names or rel_path in self.paths:
+            return True
+        if is_dir and (name in self.dir_names or rel_path in self.dir_paths):
+            return True
+        if self.regex is not None and self.regex.match(rel_path):
+            return True
+        return is_dir and self.dir_regex is not None and self.dir_regex.match(rel_path) is not None
+
+
+class IgnoreRules:
+    """한 기준 디렉토리의 gitignore 규칙을 컴파일한 매처
+
+    gitignore 는 마지막으로 일치한 규칙이 결과를 결정하므로, 부호가 같은
+    연속 규칙을 그룹으로 묶고 뒤쪽 그룹부터 검사한다. 그룹마다 와일드카드 없는
+    이름/경로는 집합으로, 나머지는 정규식 하나로 합쳐 경로당 검사 횟수를
+    규칙 수가 아닌 그룹 수로 줄인다.
+    """
+
+    def __init__(self, lines: List[str]):
+        """규칙 컴파일
+
+        Args:
+            lines (List[str]): gitignore 파일의 각 줄
+        """
+        self._groups: List[_RuleGroup] = []
+        self.rule_count = 0
+
+        regexes: List[Tuple[List[str], List[str]]] = []
+        for line in lines:
+            parsed = self._parse_line(line)
+            if parsed is None:
+                continue
+            pattern, negate, dir_only, anchored = parsed
+
+            regex = None
+            if _GLOB_CHARS.search(pattern):
+                regex = self._convert_glob_to_regex(pattern, anchored)
+                try:
+                    re.compile(regex)
+                except re.error:
+                    continue  # 잘못된 패턴은 무시
+
+            if not self._groups or self._groups[-1].negate != negate:
+                self._groups.append(_RuleGroup(negate))
+                regexes.append(([], []))
+            group = self._groups[-1]
+            self.rule_count += 1
+
+            if regex is None:
+                # 와일드카드 없는 규칙
+                if anchored:
+                    (group.dir_paths if dir_only else group.paths).add(pattern)
+                else:
+                    (group.dir_names if dir_only else group.names).add(pattern)
+            else:
+                regexes[-1][1 if dir_only else 0].append(regex)
+
+        for group, (any_parts, dir_parts) in zip(self._groups, regexes):
+            if any_parts:
+                group.regex = re.compile('|'.join(f'(?:{p})' for p in any_parts))
+            if dir_parts:
+                group.dir_regex = re.compile('|'.join(f'(?:{p})' for p in dir_parts))
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Tuple[str, bool, bool, bool]]:
+        """gitignore 한 줄을 해석
+
+        Args:
+            line (str): gitignore 파일의 한 줄
+
+        Returns:
+            Optional[Tuple[str, bool, bool, bool]]:
+                (패턴, 재포함 여부, 디렉토리 전용 여부, 루트 고정 여부), 규칙이 아니면 None
+        """
+        pattern = line.rstrip('\r\n')
+        # 이스케이프되지 않은 뒤쪽 공백 제거
+        stripped = pattern.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(pattern):
+            stripped += ' '
+        pattern = stripped
+
+        if not pattern or pattern.startswith('#'):
+            return None
+
+        negate = False
+        if pattern.startswith('!'):
+            negate = True
+            pattern = pattern[1:]
+        elif pattern.startswith(('\\!', '\\#')):
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return None
+
+        # 중간 또는 앞에 '/' 가 있으면 기준 디렉토리에 고정된 패턴
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        if not pattern:
+            return None
+
+        return pattern, negate, dir_only, anchored
+
+    @staticmethod
+    def _convert_glob_to_regex(pattern: str, anchored: bool) -> str:
+        """Glob 패턴을 정규식으로 변환
+
+        Args:
+            pattern (str): Glob 패턴
+            anchored (bool): 기준 디렉토리에 고정된 패턴인지 여부
+
+        Returns:
+            str: 상대 경로 전체와 비교할 정규식 패턴
+        """
+        parts = []
+        i, n = 0, len(pattern)
+        while i < n:
+            c = pattern[i]
+            if c == '*':
+                if pattern.startswith('**', i):
+                    at_start = i == 0 or pattern[i - 1] == '/'
+                    if at_start and pattern.startswith('**/', i):
+                        parts.append('(?:.*/)?')  # 0개 이상의 디렉토리
+                        i += 3
+                        continue
+                    if at_start and i + 2 == n:
+                        parts.append('.*')  # 하위의 모든 항목
+                        i += 2
+                        continue
+                    i += 2
+                    parts.append('[^/]*')
+                    continue
+                parts.append('[^/]*')  # 단일 경로 내의 모든 문자
+            elif c == '?':
+                parts.append('[^/]')  # 단일 문자
+            elif c == '[':
+                # 여는 괄호(와 부정 기호) 바로 뒤의 ']' 는 닫는 괄호가 아니라 문자
+                start = i + 1
+                negate = start < n and pattern[start] in '!^'
+                if negate:
+                    start += 1
+                end = start + 1 if start < n and pattern[start] == ']' else start
+                while end < n and pattern[end] != ']':
+                    end += 2 if pattern[end] == '\\' else 1
+                if end >= n:
+                    parts.append(r'\[')
+                else:
+                    parts.append(f"[{'^' if negate else ''}{IgnoreRules._convert_bracket(pattern[start:end])}]")
+                    i = end
+            elif c == '\\' and i + 1 < n:
+                i += 1
+                parts.append(re.escape(pattern[i]))
+            else:
+                parts.append(re.escape(c))
+            i += 1
+
+        body = ''.join(parts)
+        if anchored:
+            return f'{body}$'
+        return f'(?:.*/)?{body}$'
+
+    @staticmethod
+    def _convert_bracket(body: str) -> str:
+        """Glob 문자 클래스의 내용을 정규식 문자 클래스 내용으로 변환
+
+        범위를 나타내는 '-' 는 그대로 두고, 정규식 문자 클래스에서 특별한 의미가 있는
+        ']', '[', '^', '\\' 는 이스케이프한다 (glob 의 '\\x' 는 문자 x).
+
+        Args:
+            body (str): 괄호와 부정 기호를 뺀 문자 클래스 내용
+
+        Returns:
+            str: 정규식 문자 클래스에 넣을 내용
+        """
+        parts = []
+        i, n = 0, len(body)
+        while i < n:
+            c = body[i]
+            if c == '\\' and i + 1 < n:
+                i += 1
+                c = body[i]
+            parts.append('\\' + c if c in '][^\\' else c)
+            i += 1
+        return ''.join(parts)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """경로에 대한 규칙 판정
+
+        Args:
+            rel_path (str): 기준 디렉토리에 대한 '/' 구분 상대 경로
+            is_dir (bool): 디렉토리 여부
+
+        Returns:
+            Optional[bool]: 무시하면 True, '!' 규칙으로 재포함되면 False, 일치하는 규칙이 없으면 None
+        """
+        name = rel_path.rsplit('/', 1)[-1]
+        for group in reversed(self._groups):
+            if group.matches(rel_path, name, is_dir):
+                return not group.negate
+        return None
+
+
+# (기준 디렉토리 상대 경로, 컴파일된 규칙) 목록. 뒤쪽일수록 우선순위가 높음
+RuleStack = Tuple[Tuple[str, IgnoreRules], ...]
 
 
 class GitignoreParser:
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, snapshot: Optional[DirectorySnapshot] = None):
         """GitIgnore 파서 초기화
 
         Args:
             root_path (str): 프로젝트 루트 경로
+            snapshot (Optional[DirectorySnapshot], optional): 공유 스냅샷.
+                있으면 하위 .gitignore 존재 여부를 파일 시스템 대신 스냅샷에서 확인.
         """
         self.root_path = Path(root_path)
-        self.ignore_patterns: List[Pattern] = []
+        self._root = str(self.root_path)
+        self._snapshot = snapshot
+        self._stacks: Dict[str, RuleStack] = {}
         self.load_gitignore()
 
+    def _read_rules(self, file_path: str) -> Optional[IgnoreRules]:
+        """규칙 파일 하나를 읽어 컴파일
+
+        Args:
+            file_path (str): 규칙 파일 경로
+
+        Returns:
+            Optional[IgnoreRules]: 컴파일된 규칙, 파일이 없거나 규칙이 없으면 None
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                rules = IgnoreRules(f.readlines())
+        except OSError:
+            return None
+        return rules if rules.rule_count else None
+
+    def _has_gitignore(self, rel_dir: str) -> bool:
+        """디렉토리에 .gitignore 파일이 있는지 확인"""
+        if self._snapshot is not None:
+            return any(entry.name == '.gitignore' and not entry.is_dir
+                       for entry in self._snapshot.children(rel_dir))
+        return os.path.isfile(os.path.join(self._root, rel_dir, '.gitignore'))
+
     def load_gitignore(self) -> None:
-        """GitIgnore 파일을 로드하고 패턴을 컴파일"""
-        gitignore_path = self.root_path / '.gitignore'
-        if not gitignore_path.exists():
-            return
-
-        with open(gitignore_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                pattern = line.strip()
-                if pattern and not pattern.startswith('#'):
-                    # 기본 glob 패턴을 정규식으로 변환
-                    regex_pattern = self._convert_glob_to_regex(pattern)
-                    try:
-                        compiled_pattern = re.compile(regex_pattern)
-                        self.ignore_patterns.append(compiled_pattern)
-                    except re.error:
-                        continue  # 잘못된 패턴은 무시
-
-    def _convert_glob_to_regex(self, pattern: str) -> str:
-        """Glob 패턴을 정규식으로 변환
+        """루트 규칙(.git/info/exclude, .gitignore)을 로드하고 캐시를 초기화
+
+        하위 디렉토리의 .gitignore 는 해당 디렉토리가 처음 조회될 때 로드된다.
+        """
+        self._stacks.clear()
+
+        stack = []
+        for rule_file in (os.path.join(self._root, '.git', 'info', 'exclude'),
+                          os.path.join(self._root, '.gitignore')):
+            rules = self._read_rules(rule_file)
+            if rules is not None:
+                stack.append(('', rules))
+        self._stacks[''] = tuple(stack)
+
+    def rules_for(self, rel_dir: str) -> RuleStack:
+        """디렉토리에 적용되는 규칙 스택 반환 (디렉토리별로 한 번만 컴파일)
 
         Args:
-            pattern (str): Glob 패턴
+            rel_dir (str): '/' 로 구분된 루트 기준 상대 경로 ('' 는 루트)
 
         Returns:
-            str: 정규식 패턴
+            RuleStack: 상위 디렉토리 규칙 + 이 디렉토리의 .gitignore 규칙
         """
-        # 시작 부분 처리
-        if pattern.startswith('/'):
-            pattern = pattern[1:]  # 루트 상대 경로
-        elif pattern.startswith('**/'):
-            pattern = f'.*?{pattern[3:]}'  # 모든 하위 디렉토리
+        stack = self._stacks.get(rel_dir)
+        if stack is not None:
+            return stack
+
+        parent = rel_dir.rsplit('/', 1)[0] if '/' in rel_dir else ''
+        stack = self.rules_for(parent)
+        if self._has_gitignore(rel_dir):
+            rules = self._read_rules(os.path.join(self._root, rel_dir, '.gitignore'))
+            if rules is not None:
+                stack = stack + ((rel_dir, rules),)
+
+        self._stacks[rel_dir] = stack
+        return stack
 
-        # 패턴 변환
-        pattern = pattern.replace('.', r'\.')  # 점을 이스케이프
-        pattern = pattern.replace('**', '.*?')  # 모든 하위 경로
-        pattern = pattern.replace('*', '[^/]*')  # 단일 경로 내의 모든 문자
-        pattern = pattern.replace('?', '[^/]')  # 단일 문자
+    def match(self, rel_path: str, is_dir: bool) -> bool:
+        """루트 기준 상대 경로가 무시 대상인지 확인
 
-        # 끝 부분 처리
-        if pattern.endswith('/'):
-            pattern = f'{pattern}.*'  # 디렉토리 내의 모든 파일
+        상위 디렉토리는 이미 검사된 것으로 가정한다 (순회 중 무시된 폴더는
+        하위로 내려가지 않으므로). 가장 깊은 .gitignore 의 규칙이 우선한다.
+
+        Args:
+            rel_path (str): '/' 로 구분된 루트 기준 상대 경로
+            is_dir (bool): 디렉토리 여부
 
-        return f'^{pattern}$'
+        Returns:
+            bool: 무시해야 하면 True
+        """
+        parent = rel_path.rsplit('/', 1)[0] if '/' in rel_path else ''
+        for base, rules in reversed(self.rules_for(parent)):
+            result = rules.match(rel_path[len(base) + 1:] if base else rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
 
-    def should_ignore(self, path: str) -> bool:
+    def should_ignore(self, path: str, is_dir: Optional[bool] = None) -> bool:
         """주어진 경로가 gitignore 규칙에 따라 무시되어야 하는지 확인
 
         Args:
             path (str): 검사할 파일/디렉토리 경로
+            is_dir (Optional[bool], optional): 디렉토리 여부. None 이면 파일 시스템에서 확인.
 
         Returns:
             bool: 무시해야 하면 True, 아니면 False
         """
-        if not self.ignore_patterns:
-            return False
-
         try:
             relative_path = str(Path(path).relative_to(self.root_path)).replace('\\', '/')
-
-            # 각 패턴에 대해 검사
-            for pattern in self.ignore_patterns:
-                if pattern.search(relative_path):
-                    return True
-
-                # 디렉토리 경로도 검사
-                dir_path = f"{relative_path}/"
-                if pattern.search(dir_path):
-                    return True
-
+        except ValueError:
+            return False  # 상대 경로를 만들 수 없는 경우
+        if relative_path == '.':
             return False
 
-        except ValueError:
-            return False  # 상대 경로를 만들 수 없는 경우
\ No newline at end of file
+        # 상위 디렉토리가 무시되면 하위 항목도 모두 무시
+        parts = relative_path.split('/')
+        for i in range(1, len(parts)):
+            if self.match('/'.join(parts[:i]), True):
+                return True
+
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
+        return self.match(relative_path, is_dir)
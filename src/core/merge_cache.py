@@ -0,0 +1,149 @@
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Union
+from src.utils.config import get_cache_dir
+
+
+class CacheStats:
+    """병합 캐시 적중 통계"""
+
+    __slots__ = ('hits', 'misses', 'uncached')
+
+    def __init__(self):
+        self.hits = 0       # 캐시된 섹션을 재사용한 파일 수
+        self.misses = 0     # 새로 읽고 캐시에 저장한 파일 수
+        self.uncached = 0   # 너무 커서 캐시하지 않은 파일 수
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 대상 파일 중 적중 비율 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (f"캐시 적중률 {self.hit_rate:.0%} "
+                f"(적중 {self.hits}개, 갱신 {self.misses}개, 캐시 제외 {self.uncached}개)")
+
+
+class MergeCache:
+    """파일별로 렌더링된 병합 섹션을 저장하는 영구 캐시 (SQLite)
+
+    파일 경로와 인코딩을 키로 크기, 수정 시각, 내용 해시, 렌더링된 섹션을 저장한다.
+    크기와 수정 시각이 같으면 파일을 읽지 않고 저장된 섹션을 사용하고,
+    수정 시각만 바뀐 경우에는 내용 해시가 같으면 디코딩을 생략한다.
+    """
+
+    # 이 크기보다 큰 파일은 캐시하지 않고 매번 스트리밍으로 복사
+    MAX_FILE_SIZE = 1024 * 1024
+    # 이 기간 동안 사용되지 않은 항목은 캐시를 열 때 삭제
+    EXPIRE_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """캐시 열기
+
+        Args:
+            db_path (Optional[Union[str, Path]], optional): 캐시 DB 경로.
+                Defaults to 캐시 디렉토리의 merge-cache.sqlite3.
+        """
+        if db_path is None:
+            db_path = get_cache_dir() / 'merge-cache.sqlite3'
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.stats = CacheStats()
+        self._now = time.time()
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sections ("
+            " path TEXT NOT NULL,"
+            " encoding TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " body TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (path, encoding))"
+        )
+        self._conn.execute("DELETE FROM sections WHERE last_used < ?",
+                           (self._now - self.EXPIRE_SECONDS,))
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """파일 내용 해시 계산"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def is_cacheable(self, size: int) -> bool:
+        """캐시 대상 크기인지 확인"""
+        return size <= self.MAX_FILE_SIZE
+
+    def lookup(self, path: str, encoding: str, size: int, mtime: float) -> Optional[str]:
+        """크기와 수정 시각이 같은 캐시 섹션 조회 (파일을 읽지 않음)
+
+        Args:
+            path (str): 파일 경로
+            encoding (str): 병합에 사용한 인코딩
+            size (int): 현재 파일 크기
+            mtime (float): 현재 파일 수정 시각
+
+        Returns:
+            Optional[str]: 캐시된 섹션, 없거나 파일이 바뀌었으면 None
+        """
+        row = self._conn.execute(
+            "SELECT body FROM sections WHERE path = ? AND encoding = ? AND size = ? AND mtime = ?",
+            (path, encoding, size, mtime)
+        ).fetchone()
+        return row[0] if row else None
+
+    def store(self, path: str, encoding: str, size: int, mtime: float,
+              digest: str, body: str) -> str:
+        """새로 읽은 파일의 섹션을 저장
+
+        내용 해시가 캐시와 같으면 저장된 섹션을 재사용하고 적중으로 집계한다.
+
+        Args:
+            path (str): 파일 경로
+            encoding (str): 병합에 사용한 인코딩
+            size (int): 파일 크기
+            mtime (float): 파일 수정 시각
+            digest (str): 파일 내용 해시
+            body (str): 새로 렌더링한 섹션
+
+        Returns:
+            str: 출력에 사용할 섹션
+        """
+        row = self._conn.execute(
+            "SELECT body FROM sections WHERE path = ? AND encoding = ? AND digest = ?",
+            (path, encoding, digest)
+        ).fetchone()
+        if row:
+            self.stats.hits += 1
+            body = row[0]
+        else:
+            self.stats.misses += 1
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, encoding, size, mtime, digest, body, self._now)
+        )
+        return body
+
+    def touch(self, path: str, encoding: str) -> None:
+        """적중한 항목의 마지막 사용 시각 갱신"""
+        self.stats.hits += 1
+        self._conn.execute(
+            "UPDATE sections SET last_used = ? WHERE path = ? AND encoding = ?",
+            (self._now, path, encoding)
+        )
+
+    def close(self) -> None:
+        """변경 사항을 저장하고 캐시 닫기"""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> 'MergeCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
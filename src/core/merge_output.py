@@ -0,0 +1,266 @@
+import bz2
+import gzip
+import lzma
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple, Union
+from src.utils.helpers import CHARS_PER_TOKEN, format_size, normalize_path
+
+
+def _open_gzip(path: Path, encoding: str, errors: str, level: int) -> TextIO:
+    return gzip.open(path, 'wt', compresslevel=level, encoding=encoding, errors=errors)
+
+
+def _open_bz2(path: Path, encoding: str, errors: str, level: int) -> TextIO:
+    return bz2.open(path, 'wt', compresslevel=level, encoding=encoding, errors=errors)
+
+
+def _open_xz(path: Path, encoding: str, errors: str, level: int) -> TextIO:
+    return lzma.open(path, 'wt', preset=level, encoding=encoding, errors=errors)
+
+
+# 압축 형식: 이름 → (파일 확장자, 기본 압축 수준, 쓰기용 텍스트 스트림을 여는 함수)
+COMPRESSIONS: Dict[str, Tuple[str, int, Callable[[Path, str, str, int], TextIO]]] = {
+    'gzip': ('.gz', 6, _open_gzip),
+    'bz2': ('.bz2', 9, _open_bz2),
+    'xz': ('.xz', 6, _open_xz),
+}
+
+# 기본 이름으로 저장된 병합 결과 (<yymmdd-HHMM>-<폴더명>-merged[-N][-part-N|-index].md[.gz|.bz2|.xz])
+MERGE_OUTPUT_PATTERN = re.compile(r'^\d{6}-\d{4}-.+-merged(-\d+)?(-part-\d+|-index)?\.md(\.gz|\.bz2|\.xz)?$')
+# 작성 중인 임시 파일 이름의 끝 (닫을 때 최종 이름으로 바뀜)
+TEMP_SUFFIX = '.merging'
+
+
+def is_merge_output(name: str) -> bool:
+    """파일 이름이 이전 병합 결과이거나 작성 중인 임시 파일인지 확인
+
+    Args:
+        name (str): 파일 이름
+
+    Returns:
+        bool: 병합 대상에서 제외해야 할 출력 파일이면 True
+    """
+    return name.endswith(TEMP_SUFFIX) or MERGE_OUTPUT_PATTERN.match(name) is not None
+
+
+class MergeOutput:
+    """병합 결과를 기록하는 출력 파일
+
+    크기 제한이 없으면 지정한 경로 하나에 그대로 기록한다. max_bytes 또는
+    max_tokens 를 지정하면 제한에 닿을 때 <이름>-part-N<확장자> 로 넘어가며
+    여러 파일로 나눠 기록하고, 어떤 원본 파일이 어느 파트에 들어갔는지
+    <이름>-index<확장자> 에 함께 기록한다. 파일 섹션은 begin_section() 단위로만
+    나뉘므로 섹션 하나가 제한보다 큰 경우를 빼면 코드 블록이 잘리지 않는다.
+
+    compression 을 지정하면 출력 파일(각 파트)을 압축 스트림으로 기록하고 이름 끝에
+    .gz/.bz2/.xz 를 붙인다. 목록 파일은 압축하지 않으며, 파트 크기 제한은 압축 전 기준이다.
+    압축 스트림은 되돌릴 수 없으므로 seekable() 이 False 가 된다.
+
+    모든 파일은 같은 폴더의 임시 파일(.<이름>.<무작위>.merging)에 먼저 기록하고
+    close() 에서 최종 이름으로 바꾸므로, 작성 중이거나 실패한 결과가 기존 파일을 덮어쓰지 않는다.
+    """
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 encoding: str = 'utf-8',
+                 errors: str = 'strict',
+                 max_bytes: Optional[int] = None,
+                 max_tokens: Optional[int] = None,
+                 compression: Optional[str] = None,
+                 compression_level: Optional[int] = None):
+        """초기화
+
+        Args:
+            path (Union[str, Path]): 출력 파일 경로 (나눠 기록할 때는 파트 이름의 기준)
+            encoding (str, optional): 출력 파일 인코딩. Defaults to 'utf-8'.
+            errors (str, optional): 인코딩 오류 처리 방식. Defaults to 'strict'.
+            max_bytes (Optional[int], optional): 파트 하나의 최대 바이트 수
+            max_tokens (Optional[int], optional): 파트 하나의 최대 토큰 수 (문자 수로 어림)
+            compression (Optional[str], optional): 압축 형식 ('gzip', 'bz2', 'xz'). Defaults to None (압축 안 함).
+            compression_level (Optional[int], optional): 압축 수준 (gzip/bz2 1-9, xz 0-9).
+                Defaults to 형식별 기본값.
+
+        Raises:
+            ValueError: 알 수 없는 압축 형식이거나 압축 수준이 범위를 벗어난 경우
+        """
+        self.path = Path(path)
+        self.compression = compression
+        self.compression_level = compression_level
+        self._suffix = ''
+        self._opener: Optional[Callable[[Path, str, str, int], TextIO]] = None
+        if compression:
+            if compression not in COMPRESSIONS:
+                raise ValueError(f"알 수 없는 압축 형식: {compression}")
+            self._suffix, default_level, self._opener = COMPRESSIONS[compression]
+            self.compression_level = default_level if compression_level is None else compression_level
+            lowest = 0 if compression == 'xz' else 1
+            if not lowest <= self.compression_level <= 9:
+                raise ValueError(f"{compression} 압축 수준은 {lowest}-9 사이여야 합니다: {self.compression_level}")
+            if self.path.suffix == self._suffix:
+                # 'merged.md.gz' 처럼 압축 확장자까지 지정한 경우 기준 이름에서 제외
+                self.path = self.path.with_suffix('')
+        self.encoding = encoding
+        self.errors = errors
+        self.max_bytes = max_bytes
+        self.max_chars = max_tokens * CHARS_PER_TOKEN if max_tokens else None
+        self.split = bool(max_bytes or max_tokens)
+        self.paths: List[str] = []  # 생성한 출력 파일 (파트 순서)
+        self.index_path: Optional[str] = None
+
+        self._file: Optional[TextIO] = None
+        self._index: Optional[TextIO] = None
+        self._pending: List[Tuple[Path, Path]] = []  # 닫을 때 바꿀 (임시 경로, 최종 경로)
+        self._bytes = 0  # 현재 파트에 기록한 바이트 수
+        self._chars = 0  # 현재 파트에 기록한 문자 수
+        self._marks: Dict[int, Tuple[int, int]] = {}  # tell() 위치 → (바이트 수, 문자 수)
+
+    @property
+    def result_path(self) -> str:
+        """호출자에게 알려줄 결과 경로 (나눠 기록했다면 목록 파일)"""
+        if self.split and self.index_path:
+            return self.index_path
+        return self.paths[0] if self.paths else str(self.path.with_name(self.path.name + self._suffix))
+
+    def _part_path(self, number: int) -> Path:
+        """N 번째 파트 경로"""
+        return self.path.with_name(f"{self.path.stem}-part-{number}{self.path.suffix}{self._suffix}")
+
+    def _temp_path(self, path: Path) -> Path:
+        """최종 경로에 대응하는 임시 파일 경로를 만들고 교체 목록에 등록"""
+        temp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}{TEMP_SUFFIX}")
+        self._pending.append((temp, path))
+        return temp
+
+    def _open_part(self) -> None:
+        """다음 파트 파일 열기"""
+        if self._file is not None:
+            self._file.close()
+
+        if not self.split:
+            path = self.path.with_name(self.path.name + self._suffix)
+        else:
+            path = self._part_path(len(self.paths) + 1)
+            if self._index is None:
+                index_path = self.path.with_name(f"{self.path.stem}-index{self.path.suffix}")
+                self.index_path = str(index_path)
+                self._index = open(self._temp_path(index_path), 'w', encoding='utf-8')
+                self._index.write(f"# 병합 결과 목록: {normalize_path(self.path)}\n")
+            self._index.write(f"\n## part-{len(self.paths) + 1}: {path.name}\n\n")
+
+        temp = self._temp_path(path)
+        if self._opener is not None:
+            self._file = self._opener(temp, self.encoding, self.errors, self.compression_level)
+        else:
+            self._file = open(temp, 'w', encoding=self.encoding, errors=self.errors)
+        self.paths.append(str(path))
+        self._bytes = 0
+        self._chars = 0
+        self._marks.clear()
+
+    def _over_budget(self, extra_bytes: int, extra_chars: int) -> bool:
+        """현재 파트에 더 쓰면 제한을 넘는지 확인"""
+        if self.max_bytes and self._bytes + extra_bytes > self.max_bytes:
+            return True
+        return bool(self.max_chars and self._chars + extra_chars > self.max_chars)
+
+    def begin_section(self, estimated_size: int, source: Optional[str] = None) -> None:
+        """나눌 수 없는 섹션(파일 하나의 헤더와 코드 블록) 시작
+
+        현재 파트에 이미 내용이 있고 섹션을 더하면 제한을 넘으면 새 파트로 넘어간다.
+
+        Args:
+            estimated_size (int): 섹션의 예상 크기 (바이트 또는 문자 수)
+            source (Optional[str], optional): 목록 파일에 기록할 원본 파일 경로
+        """
+        if self._file is None:
+            self._open_part()
+        elif self.split and self._chars and self._over_budget(estimated_size, estimated_size):
+            self._open_part()
+
+        if self._index is not None and source is not None:
+            self._index.write(f"- {normalize_path(source)}\n")
+
+    def write_block(self, text: str) -> int:
+        """나눌 수 없는 짧은 문자열(디렉토리 헤더 등)을 크기를 재서 기록"""
+        if self.split:
+            self.begin_section(self.measure(text))
+        return self.write(text)
+
+    def measure(self, text: str) -> int:
+        """문자열을 출력 인코딩으로 기록했을 때의 바이트 수"""
+        return len(text.encode(self.encoding, self.errors))
+
+    def write(self, text: str) -> int:
+        """문자열 기록"""
+        if self._file is None:
+            self._open_part()
+        if self.split:
+            if self.max_bytes:
+                self._bytes += len(text.encode(self.encoding, self.errors))
+            self._chars += len(text)
+        return self._file.write(text)
+
+    def seekable(self) -> bool:
+        # 압축 스트림은 쓰기 중 뒤로 이동할 수 없음
+        return self._file is not None and self._opener is None and self._file.seekable()
+
+    def tell(self) -> int:
+        position = self._file.tell()
+        if self.split:
+            self._marks[position] = (self._bytes, self._chars)
+        return position
+
+    def seek(self, position: int) -> int:
+        """tell() 로 얻은 위치로 되돌림 (현재 파트 안에서만 가능)"""
+        if position in self._marks:
+            self._bytes, self._chars = self._marks[position]
+        return self._file.seek(position)
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        return self._file.truncate(size)
+
+    def close(self) -> None:
+        """열린 파일을 모두 닫고 임시 파일을 최종 이름으로 교체"""
+        if self._file is None:
+            self._open_part()  # 기록한 내용이 없어도 빈 출력 파일은 만듦
+        self._file.close()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        for temp, path in self._pending:
+            os.replace(temp, path)
+        self._pending.clear()
+
+    def discard(self) -> None:
+        """파일을 닫고 지금까지 쓴 임시 파일을 모두 삭제 (취소 또는 실패 시 사용)"""
+        if self._file is not None:
+            self._file.close()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        for temp, _ in self._pending:
+            temp.unlink(missing_ok=True)
+        self._pending.clear()
+
+    def summary(self) -> str:
+        """생성한 파일 요약 (나눠 기록한 경우에만 의미 있음)"""
+        sizes = []
+        for path in self.paths:
+            try:
+                sizes.append(format_size(Path(path).stat().st_size))
+            except OSError:
+                sizes.append('?')
+        return f"{len(self.paths)}개 파트로 나눠 저장 ({', '.join(sizes)})"
+
+    def __enter__(self) -> 'MergeOutput':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # 예외로 끝나면 최종 이름으로 바꾸지 않고 임시 파일만 정리
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
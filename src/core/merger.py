@@ -1,124 +1,679 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, TextIO
+from typing import Collection, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
-import os
 from src.core.file_manager import FileManager
-from src.utils.helpers import normalize_path, get_file_extension
+from src.core.merge_cache import CacheStats, MergeCache
+from src.core.merge_output import COMPRESSIONS, MergeOutput, is_merge_output
+from src.core.metrics import Metrics
+from src.core.progress import OperationCancelled, Progress
+from src.core.path_trie import FolderTrie, TrieNode
+from src.core.snapshot import ENTER, LEAVE, ScanEntry
+from src.core.sniffer import SNIFF_SIZE, detect_encoding, is_binary_content, read_head
+from src.utils.helpers import format_size, normalize_path
+
+# 병합 출력 항목: 그대로 기록할 문자열, 또는 내용을 포함할 파일
+MergeItem = Union[str, ScanEntry]
+# 미리 읽어 렌더링한 파일: (내용 해시, 코드 블록 또는 읽기 실패 안내, 바이너리면 None)
+PrefetchResult = Tuple[Optional[str], Optional[str]]
+
+# 파일을 읽을 때 시도할 인코딩 순서 (첫 번째가 기본 인코딩이자 출력 파일 인코딩)
+EncodingChain = Tuple[str, ...]
+
+# 병렬 병합 시 미리 읽어 둘 수 있는 기본 최대 바이트 수
+MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
 
 class FileMerger:
     """파일 병합 기능을 처리하는 클래스"""
 
-    def __init__(self, root_path: str, file_manager: FileManager):
+    # 파일 내용을 복사할 때 한 번에 읽는 문자 수
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root_path: str, file_manager: FileManager,
+                 cache_path: Optional[str] = None):
         self.root_path = Path(root_path)
         self.file_manager = file_manager
+        self.cache_path = cache_path  # None 이면 기본 캐시 위치 사용
+        self.last_cache_stats: Optional[CacheStats] = None
+        self.last_output_paths: List[str] = []  # 마지막 병합으로 생성된 파일 (파트, 목록 파일)
+        self._cache: Optional[MergeCache] = None
+        self._progress: Optional[Progress] = None
+        # 파일별로 감지한 인코딩: 경로 → (크기, 수정 시각, 인코딩 순서, 인코딩)
+        self._detected: Dict[str, Tuple[int, float, EncodingChain, str]] = {}
 
     def merge_files(self,
                     selected_extensions: List[str],
                     exclude_files: Optional[List[str]] = None,
                     exclude_folders: Optional[List[str]] = None,
-                    encoding: str = 'utf-8') -> Optional[str]:
+                    encoding: str = 'utf-8',
+                    fallback_encodings: Optional[Sequence[str]] = None,
+                    workers: int = 0,
+                    max_in_flight_bytes: int = MAX_IN_FLIGHT_BYTES,
+                    use_cache: bool = False,
+                    output_path: Optional[str] = None,
+                    max_file_size: Optional[int] = None,
+                    split_bytes: Optional[int] = None,
+                    split_tokens: Optional[int] = None,
+                    include_paths: Optional[Collection[str]] = None,
+                    compression: Optional[str] = None,
+                    compression_level: Optional[int] = None,
+                    output_dir: Optional[str] = None,
+                    scan_workers: Optional[int] = None,
+                    progress: Optional[Progress] = None) -> Optional[str]:
         """선택된 파일들을 하나의 마크다운 파일로 병합
 
         Args:
             selected_extensions (List[str]): 병합할 파일 확장자 목록
             exclude_files (Optional[List[str]], optional): 제외할 파일 목록
             exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
-            encoding (str, optional): 파일 인코딩. Defaults to 'utf-8'.
+            encoding (str, optional): 파일 인코딩이자 출력 파일 인코딩. Defaults to 'utf-8'.
+            fallback_encodings (Optional[Sequence[str]], optional): encoding 으로 읽을 수 없을 때
+                시도할 인코딩 순서 (예: ['cp949']). 지정하면 파일마다 BOM 과 앞부분으로 인코딩을
+                먼저 감지하고, 감지 결과는 파일이 바뀌기 전까지 재사용한다. Defaults to None.
+            workers (int, optional): 파일을 미리 읽어 둘 스레드 수. 0 이면 순차 처리. Defaults to 0.
+            max_in_flight_bytes (int, optional): 미리 읽어 메모리에 둘 수 있는 최대 바이트 수.
+                이보다 큰 파일은 미리 읽지 않고 순서가 되었을 때 스트리밍으로 복사한다.
+            use_cache (bool, optional): 변경되지 않은 파일은 캐시된 섹션을 재사용할지 여부.
+                결과 통계는 last_cache_stats 에 기록된다. Defaults to False.
+            output_path (Optional[str], optional): 출력 파일 경로.
+                Defaults to output_dir 의 <yymmdd-HHMM>-<폴더명>-merged.md
+                (같은 이름이 이미 있으면 -merged-2.md, -merged-3.md ...).
+            max_file_size (Optional[int], optional): 내용을 포함할 최대 파일 크기 (바이트).
+                이보다 큰 파일은 "크기 초과로 생략됨" 으로 이름과 크기만 표시. Defaults to None (제한 없음).
+            split_bytes (Optional[int], optional): 출력 파일 하나의 최대 바이트 수.
+                지정하면 <이름>-part-N.md 로 나눠 기록하고 <이름>-index.md 에 파트별 파일 목록을 남긴다.
+            split_tokens (Optional[int], optional): 출력 파일 하나의 최대 토큰 수 (문자 수로 어림).
+                split_bytes 와 함께 지정하면 먼저 닿는 제한에서 나눈다.
+            include_paths (Optional[Collection[str]], optional): 내용을 포함할 파일 경로 집합
+                (MergeEstimator.select_within_budget 결과 등). 지정하면 나머지 파일은
+                "예산 초과로 생략됨" 으로 이름만 표시한다.
+            compression (Optional[str], optional): 출력 압축 형식 ('gzip', 'bz2', 'xz').
+                지정하면 별도 압축 단계 없이 압축 스트림으로 바로 기록하고 파일 이름 끝에
+                .gz/.bz2/.xz 를 붙인다. Defaults to None (압축 안 함).
+            compression_level (Optional[int], optional): 압축 수준. Defaults to 형식별 기본값.
+            output_dir (Optional[str], optional): output_path 를 지정하지 않았을 때 결과를 저장할 폴더
+                (없으면 만듦). Defaults to 루트 폴더.
+            scan_workers (Optional[int], optional): 병합 전에 디렉토리 목록을 동시에 읽을 스레드 수.
+                Defaults to FileManager.scan_workers.
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
 
         Returns:
-            Optional[str]: 생성된 파일 경로, 실패시 None
+            Optional[str]: 생성된 파일 경로 (나눠 기록했다면 목록 파일 경로), 실패시 None.
+                생성된 모든 파일은 last_output_paths 에 기록된다. 결과는 임시 파일에 쓴 뒤
+                완료되었을 때만 최종 이름으로 바뀌며, 기본 이름 형식의 이전 병합 결과는
+                병합 대상에서 자동으로 제외된다.
+
+        Raises:
+            OperationCancelled: progress 로 취소된 경우 (작성 중이던 출력 파일은 삭제됨)
+            ValueError: 알 수 없는 압축 형식이거나 압축 수준이 범위를 벗어난 경우
         """
         if not selected_extensions:
             return None
 
-        # 출력 파일명 생성
-        now = datetime.now()
-        date_time = now.strftime("%y%m%d-%H%M")
-        folder_name = self.root_path.name
-        file_name = f"{date_time}-{folder_name}-merged.md"
-        output_path = self.root_path / file_name
+        # 출력 파일명 생성 (출력 폴더를 만들 수 없으면 다른 쓰기 실패와 같이 None 반환)
+        if output_path is None:
+            directory = Path(output_dir) if output_dir else self.root_path
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                output_path = self._default_output_path(directory, compression)
+            except OSError:
+                return None
+
+        # 다른 인코딩에서 읽은 문자를 출력 인코딩으로 표현할 수 없으면 대체 문자로 기록
+        encodings: EncodingChain = tuple(dict.fromkeys([encoding, *(fallback_encodings or [])]))
+        errors = 'strict' if len(encodings) == 1 else 'replace'
+        output = MergeOutput(output_path, encoding, errors, split_bytes, split_tokens,
+                             compression, compression_level)
+
+        exclude_files = exclude_files or []
+        excluded = FolderTrie(exclude_folders).root
+        metrics = self.file_manager.metrics
+        # 네트워크 드라이브 등에서는 디렉토리 목록을 먼저 동시에 읽어 둠 (순서는 그대로)
+        self.file_manager.prefetch(scan_workers, exclude_folders=exclude_folders, progress=progress)
 
+        if progress is not None:
+            # 남은 시간 계산을 위해 병합할 전체 크기를 미리 집계 (스냅샷만 조회)
+            with metrics.phase('walk'):
+                progress.total_bytes = sum(
+                    item.size for item in self._iter_directory_content(
+                        '', selected_extensions, exclude_files, excluded, max_file_size,
+                        include_paths, count=False)
+                    if not isinstance(item, str)
+                )
+
+        self.last_cache_stats = None
+        self.last_output_paths = []
+        self._progress = progress
+        if use_cache:
+            try:
+                self._cache = MergeCache(self.cache_path)
+            except Exception:
+                self._cache = None  # 캐시를 열 수 없으면 캐시 없이 병합
+
+        started = time.perf_counter()
         try:
-            with open(output_path, 'w', encoding=encoding) as outfile:
-                self._write_directory_content(
-                    self.root_path,
-                    outfile,
+            with output as outfile:
+                items = self._timed_walk(self._iter_directory_content(
+                    '',
                     selected_extensions,
-                    exclude_files or [],
-                    exclude_folders or [],
-                    encoding
-                )
-            return str(output_path)
+                    exclude_files,
+                    excluded,
+                    max_file_size,
+                    include_paths
+                ), metrics)
+                if workers > 0:
+                    self._write_directory_content_parallel(
+                        items, outfile, encodings, workers, max_in_flight_bytes)
+                else:
+                    self._write_directory_content(items, outfile, encodings)
+            metrics.add('bytes_written', self._output_size(output))
+            # 새로 생성된 출력 파일이 보이도록 출력 폴더 목록만 다시 읽게 함
+            self._invalidate_output_dir(output.path.parent)
+            self.last_output_paths = output.paths + ([output.index_path] if output.index_path else [])
+            return output.result_path
+        except OperationCancelled:
+            # 취소된 경우 작성 중이던 출력 파일 정리
+            output.discard()
+            raise
         except Exception:
+            output.discard()
             return None
+        finally:
+            metrics.add_time('merge', time.perf_counter() - started)
+            self._progress = None
+            if self._cache is not None:
+                self.last_cache_stats = self._cache.stats
+                self._cache.close()
+                self._cache = None
 
-    def _write_directory_content(self,
-                                 directory: Path,
-                                 outfile: TextIO,
-                                 selected_extensions: List[str],
-                                 exclude_files: List[str],
-                                 exclude_folders: List[str],
-                                 encoding: str,
-                                 level: int = 0) -> None:
-        """디렉토리 내용을 재귀적으로 파일에 기록"""
-        # .gitignore 규칙 확인
-        if self.file_manager.should_ignore(str(directory)):
-            return
+    def _default_output_path(self, directory: Path, compression: Optional[str]) -> Path:
+        """겹치지 않는 기본 출력 파일 경로 (같은 분에 여러 번 병합해도 덮어쓰지 않음)
 
-        # 경로 정규화 및 상대 경로 계산
-        normalized_directory = normalize_path(directory)
-        try:
-            relative_directory = str(Path(directory).relative_to(self.root_path)).replace('\\', '/')
-            # 제외 폴더 확인
-            if any(relative_directory.startswith(folder) for folder in exclude_folders):
+        Args:
+            directory (Path): 출력 폴더
+            compression (Optional[str]): 압축 형식 (압축 확장자가 붙은 이름까지 확인)
+
+        Returns:
+            Path: <yymmdd-HHMM>-<폴더명>-merged[-N].md
+        """
+        date_time = datetime.now().strftime("%y%m%d-%H%M")
+        base = f"{date_time}-{self.root_path.name}-merged"
+        suffix = COMPRESSIONS[compression][0] if compression in COMPRESSIONS else ''
+        number = 1
+        while True:
+            stem = base if number == 1 else f"{base}-{number}"
+            names = (f"{stem}.md{suffix}", f"{stem}-part-1.md{suffix}", f"{stem}-index.md")
+            if not any((directory / name).exists() for name in names):
+                return directory / f"{stem}.md"
+            number += 1
+
+    @staticmethod
+    def _timed_walk(items: Iterator[MergeItem], metrics: Metrics) -> Iterator[MergeItem]:
+        """병합 항목을 만드는 데(순회, .gitignore 확인, 필터링) 걸린 시간을 'walk' 단계로 기록"""
+        while True:
+            started = time.perf_counter()
+            item = next(items, None)
+            metrics.add_time('walk', time.perf_counter() - started)
+            if item is None:
                 return
-        except ValueError:
+            yield item
+
+    @staticmethod
+    def _output_size(output: MergeOutput) -> int:
+        """디스크에 기록된 출력 파일 크기의 합 (압축했다면 압축 후 크기)"""
+        total = 0
+        for path in output.paths + ([output.index_path] if output.index_path else []):
+            try:
+                total += Path(path).stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _invalidate_output_dir(self, directory: Path) -> None:
+        """출력 폴더가 루트 안에 있으면 스냅샷에서 그 폴더 목록만 무효화"""
+        try:
+            rel = directory.resolve().relative_to(self.root_path.resolve())
+        except (OSError, ValueError):
+            return  # 루트 밖에 저장한 경우
+        rel_dir = rel.as_posix()
+        self.file_manager.snapshot.invalidate('' if rel_dir == '.' else rel_dir, recursive=False)
+
+    def _iter_directory_content(self,
+                                rel_dir: str,
+                                selected_extensions: List[str],
+                                exclude_files: List[str],
+                                excluded: Optional[TrieNode],
+                                max_file_size: Optional[int] = None,
+                                include_paths: Optional[Collection[str]] = None,
+                                count: bool = True) -> Iterator[MergeItem]:
+        """스냅샷을 깊이 우선으로 순회하며 출력할 항목을 순서대로 생성
+
+        재귀 대신 스냅샷의 스택 기반 순회(traverse)를 사용하므로 트리 깊이에 제한이 없다.
+
+        Args:
+            rel_dir (str): 루트 기준 시작 디렉토리 상대 경로 ('' 는 루트)
+            selected_extensions (List[str]): 병합할 파일 확장자 목록
+            exclude_files (List[str]): 제외할 파일 목록
+            excluded (Optional[TrieNode]): 시작 디렉토리에 해당하는 제외 폴더 트라이 노드
+                (None 이면 하위에 제외 폴더 없음)
+            max_file_size (Optional[int], optional): 내용을 포함할 최대 파일 크기 (바이트).
+                이보다 큰 파일은 이름과 크기만 표시한다.
+            include_paths (Optional[Collection[str]], optional): 내용을 포함할 파일 경로 집합.
+                지정하면 나머지 파일은 이름만 표시한다.
+            count (bool, optional): 제외/필터링된 항목 수를 metrics 에 기록할지 여부
+                (크기만 미리 집계할 때는 False). Defaults to True.
+
+        Yields:
+            MergeItem: 그대로 기록할 문자열 또는 내용을 포함할 파일 항목
+        """
+        # 제외 폴더 확인
+        if excluded is not None and excluded.terminal:
             return
 
         # 디렉토리 헤더 작성
-        outfile.write(f"{'#'} 디렉토리: {normalized_directory}\n\n")
+        directory = self.root_path / rel_dir if rel_dir else self.root_path
+        yield f"{'#'} 디렉토리: {normalize_path(directory)}\n\n"
 
-        # 항목 정렬
-        entries = sorted(os.scandir(directory), key=lambda e: (not e.is_dir(), e.name.lower()))
+        # 깊이별 제외 폴더 트라이 노드 (인덱스 d 는 깊이 d 항목의 부모 기준)
+        nodes = [excluded]
+        entered: List[str] = []  # 하위로 내려간 폴더 (닫는 개행 출력용)
+        # 미리 집계할 때는 제외 수를 세지 않도록 버리는 Metrics 사용
+        metrics = self.file_manager.metrics if count else Metrics()
 
-        for entry in entries:
-            # .gitignore 규칙 확인
-            if self.file_manager.should_ignore(entry.path):
-                continue
+        def descend(entry: ScanEntry) -> bool:
+            # 방금 추가한 폴더의 노드가 제외 대상이면 하위로 내려가지 않음
+            node = nodes[-1]
+            if node is not None and node.terminal:
+                metrics.add('excluded_folder')
+                return False
+            return True
 
-            if entry.is_dir():
-                # 재귀적으로 하위 디렉토리 처리 (제외 폴더가 아닌 경우에만)
-                rel_path = str(Path(entry.path).relative_to(self.root_path)).replace('\\', '/')
-                if not any(rel_path.startswith(folder) for folder in exclude_folders):
-                    self._write_directory_content(
-                        Path(entry.path),
-                        outfile,
-                        selected_extensions,
-                        exclude_files,
-                        exclude_folders,
-                        encoding,
-                        level + 1
-                    )
+        # 항목은 스냅샷에서 (폴더 우선, 이름순) 정렬된 상태로 제공됨
+        snapshot = self.file_manager.snapshot
+        for event, entry, depth, _ in snapshot.traverse(
+                rel_dir, prune=self.file_manager.is_ignored, descend=descend,
+                progress=self._progress):
+            if event == ENTER:
+                entered.append(entry.rel_path)
+                yield f"{'#'} 디렉토리: {normalize_path(self.root_path / entry.rel_path)}\n\n"
+            elif event == LEAVE:
+                if entered and entered[-1] == entry.rel_path:
+                    entered.pop()
+                    # 디렉토리 구분을 위한 추가 개행
+                    yield "\n"
+            elif entry.is_dir:
+                del nodes[depth + 1:]
+                parent = nodes[depth]
+                nodes.append(parent.child(entry.name) if parent is not None else None)
             else:
+                # 이전 병합 결과와 작성 중인 임시 파일은 다시 병합하지 않음
+                if is_merge_output(entry.name):
+                    continue
+
                 # 파일명이 제외 목록에 있는지 확인
                 if entry.name in exclude_files:
                     # 제외된 파일은 이름만 표시
-                    outfile.write(f"{'##'} 파일 (내용 생략됨): {normalize_path(entry.path)}\n\n")
+                    metrics.add('excluded_file')
+                    yield f"{'##'} 파일 (내용 생략됨): {normalize_path(entry.path)}\n\n"
                     continue
 
                 # 파일 확장자 확인
-                ext = get_file_extension(entry.name)
+                ext = entry.extension
                 if ext in selected_extensions or (ext == '' and 'No Extension' in selected_extensions):
-                    # 파일 내용 포함
-                    outfile.write(f"{'##'} 파일: {normalize_path(entry.path)}\n")
-                    try:
-                        with open(entry.path, 'r', encoding=encoding) as infile:
-                            content = infile.read()
-                        outfile.write(f"```{ext[1:] if ext else ''}\n")  # 확장자에 따른 코드 블록
-                        outfile.write(content)
-                        outfile.write("\n```\n\n")
-                    except UnicodeDecodeError:
-                        outfile.write(f"(이 파일은 {encoding} 인코딩으로 읽을 수 없습니다.)\n\n")
+                    if max_file_size is not None and entry.size > max_file_size:
+                        # 크기 제한을 넘는 파일은 이름과 크기만 표시
+                        yield (f"{'##'} 파일 (크기 초과로 생략됨, {format_size(entry.size)}): "
+                               f"{normalize_path(entry.path)}\n\n")
+                        continue
+                    if include_paths is not None and entry.path not in include_paths:
+                        yield f"{'##'} 파일 (예산 초과로 생략됨): {normalize_path(entry.path)}\n\n"
+                        continue
+                    # 파일 내용 포함 (바이너리 여부는 기록할 때 캐시 조회 후 확인)
+                    yield entry
+                else:
+                    metrics.add('filtered_extension')
 
         # 디렉토리 구분을 위한 추가 개행
-        outfile.write("\n")
\ No newline at end of file
+        yield "\n"
+
+    def _write_directory_content(self,
+                                 items: Iterable[MergeItem],
+                                 outfile: MergeOutput,
+                                 encodings: EncodingChain) -> None:
+        """병합 항목을 순서대로 읽어 출력 파일에 기록"""
+        for item in items:
+            if isinstance(item, str):
+                self._write_block(outfile, item)
+            else:
+                self._write_file_section(item, outfile, encodings)
+
+    def _write_directory_content_parallel(self,
+                                          items: Iterable[MergeItem],
+                                          outfile: MergeOutput,
+                                          encodings: EncodingChain,
+                                          workers: int,
+                                          max_in_flight_bytes: int) -> None:
+        """스레드 풀로 파일을 미리 읽어 두고, 기록은 순차 처리와 같은 순서로 수행
+
+        읽기 작업은 여러 스레드에서 동시에 진행되지만 출력 파일에 쓰는 것은
+        호출한 스레드 하나뿐이다. 미리 읽은 파일 크기의 합이 max_in_flight_bytes 를
+        넘지 않도록 앞쪽 항목을 먼저 기록하며 진행한다.
+        """
+        # (항목, 미리 읽기 작업, 파일 크기) 의 대기열. 기록 순서는 항상 입력 순서와 같음
+        pending: Deque[Tuple[MergeItem, Optional[Future], int]] = deque()
+        in_flight = 0
+        max_pending = workers * 64
+
+        def write_next() -> int:
+            item, future, size = pending.popleft()
+            if isinstance(item, str):
+                self._write_block(outfile, item)
+            else:
+                self._write_file_section(item, outfile, encodings,
+                                         future.result() if future else None)
+            return size
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                for item in items:
+                    if (isinstance(item, str) or item.size > max_in_flight_bytes
+                            or self._lookup_cache(item, encodings, count=False) is not None):
+                        # 문자열, 큰 파일, 캐시된 파일은 기록할 차례에 처리
+                        pending.append((item, None, 0))
+                    else:
+                        while pending and in_flight + item.size > max_in_flight_bytes:
+                            in_flight -= write_next()
+                        future = pool.submit(self._render_file_body, item, encodings,
+                                             self._cache is not None)
+                        pending.append((item, future, item.size))
+                        in_flight += item.size
+
+                    while len(pending) > max_pending:
+                        in_flight -= write_next()
+
+                while pending:
+                    in_flight -= write_next()
+            except BaseException:
+                # 취소 또는 오류 시 아직 시작하지 않은 읽기 작업은 버림
+                for _, future, _ in pending:
+                    if future is not None:
+                        future.cancel()
+                raise
+
+    def _write_block(self, outfile: MergeOutput, text: str) -> None:
+        """디렉토리 헤더 등 짧은 문자열 기록 ('write' 단계 시간 기록)"""
+        started = time.perf_counter()
+        outfile.write_block(text)
+        self.file_manager.metrics.add_time('write', time.perf_counter() - started)
+
+    def _write_file_section(self,
+                            entry: ScanEntry,
+                            outfile: MergeOutput,
+                            encodings: EncodingChain,
+                            prefetched: Optional[PrefetchResult] = None) -> None:
+        """파일 하나의 섹션(헤더와 코드 블록)을 기록
+
+        Args:
+            entry (ScanEntry): 기록할 파일
+            outfile (MergeOutput): 출력 파일
+            encodings (EncodingChain): 시도할 인코딩 순서
+            prefetched (Optional[PrefetchResult], optional): 미리 읽은 결과.
+                없으면 파일을 스트리밍으로 복사한다.
+        """
+        ext = entry.extension
+        header = f"{'##'} 파일: {normalize_path(entry.path)}\n"
+
+        metrics = self.file_manager.metrics
+        # 캐시에 있는 파일은 바뀌지 않았으므로 바이너리 확인 없이 그대로 사용
+        body = self._lookup_cache(entry, encodings)
+        binary = False
+        head: Optional[bytes] = None  # 바이너리 확인 때 읽은 앞부분 (스트리밍 복사 시)
+        if body is None:
+            cacheable = self._cache is not None and self._cache.is_cacheable(entry.size)
+            if self._cache is not None and not cacheable:
+                self._cache.stats.uncached += 1
+            if prefetched is None and cacheable:
+                prefetched = self._render_file_body(entry, encodings, True)
+            if prefetched is not None:
+                # 전체를 읽은 경우 바이너리 여부도 읽은 내용으로 이미 확인됨
+                digest, body = prefetched
+                binary = body is None
+                if cacheable and not binary:
+                    body = self._cache.store(entry.path, ','.join(encodings), entry.size, entry.mtime,
+                                             digest, body)
+            else:
+                # 스트리밍으로 복사할 파일은 앞부분만 읽어 확인하고, 읽은 앞부분은 인코딩 감지에 재사용
+                binary = self.file_manager.snapshot.is_binary(entry, keep_head=True)
+                head, entry.head = entry.head, None
+                if not binary and head is not None and len(head) == entry.size < SNIFF_SIZE:
+                    # 앞부분에 파일 전체가 들어 있으면 다시 열지 않음
+                    with metrics.phase('read'):
+                        metrics.add('bytes_read', len(head))
+                        body = self._render_data(entry, encodings, head)
+
+        if binary:
+            # 바이너리 파일은 전체를 읽지 않고 이름만 표시
+            self._write_block(outfile,
+                              f"{'##'} 파일 (바이너리, 내용 생략됨): {normalize_path(entry.path)}\n\n")
+            if self._progress is not None:
+                self._progress.add_written(entry.size)
+            return
+
+        metrics.add('files_merged')
+        started = time.perf_counter()
+
+        # 나눠 기록할 때 섹션이 파트 경계에 걸리지 않도록 예상 크기를 먼저 알림.
+        # 미리 읽기나 캐시 여부와 관계없이 같은 위치에서 나뉘도록 파일 크기로 어림한다
+        outfile.begin_section(outfile.measure(header) + entry.size + len(ext) + 9, entry.path)
+        outfile.write(header)
+
+        if body is not None:
+            outfile.write(body)
+            metrics.add_time('write', time.perf_counter() - started)
+        else:
+            metrics.add_time('write', time.perf_counter() - started)
+            for candidate in self._encoding_order(entry, encodings, head, complete=False):
+                if self._copy_file_content(entry.path, outfile, ext, candidate):
+                    self._remember_encoding(entry, encodings, candidate)
+                    break
+                metrics.add('decode_failures')
+            else:
+                metrics.add('unreadable_files')
+                outfile.write(self._unreadable_note(encodings))
+
+        if self._progress is not None:
+            self._progress.add_written(entry.size)
+
+    def _lookup_cache(self, entry: ScanEntry, encodings: EncodingChain,
+                      count: bool = True) -> Optional[str]:
+        """파일이 바뀌지 않았으면 캐시된 섹션 반환
+
+        Args:
+            entry (ScanEntry): 조회할 파일
+            encodings (EncodingChain): 시도할 인코딩 순서 (캐시 키의 일부)
+            count (bool, optional): 적중 통계에 반영할지 여부. Defaults to True.
+
+        Returns:
+            Optional[str]: 캐시된 섹션, 캐시를 쓰지 않거나 없으면 None
+        """
+        if self._cache is None or not self._cache.is_cacheable(entry.size):
+            return None
+        key = ','.join(encodings)
+        body = self._cache.lookup(entry.path, key, entry.size, entry.mtime)
+        if body is not None and count:
+            self._cache.touch(entry.path, key)
+        return body
+
+    def _encoding_order(self, entry: ScanEntry, encodings: EncodingChain,
+                        head: Optional[bytes] = None, complete: bool = True) -> List[str]:
+        """파일에 시도할 인코딩 순서 (감지한 인코딩을 맨 앞에 둠)
+
+        인코딩이 하나뿐이면 감지하지 않는다. 감지 결과는 파일 크기와 수정 시각이
+        같은 동안 재사용되므로 반복 병합 시에는 파일 앞부분을 다시 읽지 않는다.
+
+        Args:
+            entry (ScanEntry): 대상 파일
+            encodings (EncodingChain): 시도할 인코딩 순서
+            head (Optional[bytes], optional): 이미 읽은 파일 내용 (바이너리 확인 때 읽은 앞부분 등).
+                없으면 파일 앞부분을 읽는다.
+            complete (bool, optional): head 가 파일 전체인지 여부. Defaults to True.
+
+        Returns:
+            List[str]: 시도할 인코딩 순서
+        """
+        if len(encodings) == 1:
+            return list(encodings)
+
+        cached = self._detected.get(entry.path)
+        if cached is not None and cached[:3] == (entry.size, entry.mtime, encodings):
+            detected: Optional[str] = cached[3]
+        else:
+            if head is None:
+                try:
+                    head, complete = read_head(entry.path)
+                except OSError:
+                    head, complete = b'', True
+            detected = detect_encoding(head, encodings, complete)
+
+        if detected is None:
+            return list(encodings)
+        return [detected] + [e for e in encodings if e != detected]
+
+    def _remember_encoding(self, entry: ScanEntry, encodings: EncodingChain, encoding: str) -> None:
+        """파일을 실제로 읽은 인코딩을 기록 (다음 병합에서 감지 생략)"""
+        if len(encodings) > 1:
+            self._detected[entry.path] = (entry.size, entry.mtime, encodings, encoding)
+
+    def _render_file_body(self, entry: ScanEntry, encodings: EncodingChain,
+                          with_digest: bool = False) -> PrefetchResult:
+        """파일 전체를 읽어 코드 블록으로 렌더링 (작업 스레드에서도 호출됨)
+
+        Args:
+            entry (ScanEntry): 읽을 파일
+            encodings (EncodingChain): 시도할 인코딩 순서
+            with_digest (bool, optional): 내용 해시도 계산할지 여부. Defaults to False.
+
+        Returns:
+            PrefetchResult: (내용 해시, 코드 블록 또는 읽기 실패 안내).
+                앞부분으로 바이너리로 판별되면 (None, None)
+        """
+        metrics = self.file_manager.metrics
+        with metrics.phase('read'):
+            with open(entry.path, 'rb') as infile:
+                # 바이너리 판별은 따로 열지 않고 먼저 읽은 앞부분으로 하며, 바이너리면 나머지는 읽지 않음
+                data = infile.read(SNIFF_SIZE)
+                entry.binary = is_binary_content(data)
+                if not entry.binary:
+                    data += infile.read()
+            metrics.add('bytes_read', len(data))
+            if entry.binary:
+                return None, None
+            digest = MergeCache.digest(data) if with_digest else None
+            return digest, self._render_data(entry, encodings, data)
+
+    def _render_data(self, entry: ScanEntry, encodings: EncodingChain, data: bytes) -> str:
+        """이미 읽은 파일 전체 내용을 코드 블록으로 렌더링
+
+        Args:
+            entry (ScanEntry): 파일 항목
+            encodings (EncodingChain): 시도할 인코딩 순서
+            data (bytes): 파일 전체 내용
+
+        Returns:
+            str: 코드 블록 또는 읽기 실패 안내
+        """
+        metrics = self.file_manager.metrics
+        ext = entry.extension
+        for candidate in self._encoding_order(entry, encodings, data):
+            try:
+                content = data.decode(candidate)
+            except UnicodeDecodeError:
+                metrics.add('decode_failures')
+                continue
+            self._remember_encoding(entry, encodings, candidate)
+            break
+        else:
+            metrics.add('unreadable_files')
+            return self._unreadable_note(encodings)
+
+        # 텍스트 모드로 읽을 때와 같은 줄바꿈 변환
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return f"```{ext[1:] if ext else ''}\n{content}\n```\n\n"
+
+    @staticmethod
+    def _unreadable_note(encodings: EncodingChain) -> str:
+        """지정한 인코딩으로 읽을 수 없는 파일에 대한 안내 문구"""
+        return f"(이 파일은 {', '.join(encodings)} 인코딩으로 읽을 수 없습니다.)\n\n"
+
+    def _copy_file_content(self, file_path: str, outfile: MergeOutput, ext: str, encoding: str) -> bool:
+        """파일 내용을 코드 블록으로 감싸 청크 단위로 출력 파일에 복사
+
+        파일 전체를 메모리에 올리지 않고 CHUNK_SIZE 씩 디코딩하며 기록한다.
+        중간에 디코딩 오류가 나면 이미 쓴 부분을 되돌리므로 출력에는
+        코드 블록이 통째로 들어가거나 전혀 들어가지 않는다.
+
+        Args:
+            file_path (str): 읽을 파일 경로
+            outfile (MergeOutput): 출력 파일
+            ext (str): 파일 확장자 (코드 블록 언어 표시용)
+            encoding (str): 파일 인코딩
+
+        Returns:
+            bool: 성공 여부, 지정한 인코딩으로 읽을 수 없으면 False
+        """
+        metrics = self.file_manager.metrics
+        if not outfile.seekable():
+            # 되돌릴 수 없는 출력이면 먼저 디코딩 가능 여부만 확인
+            if not self._validate_encoding(file_path, encoding):
+                return False
+
+        start = outfile.tell() if outfile.seekable() else None
+        read_time = write_time = 0.0
+        try:
+            with open(file_path, 'r', encoding=encoding) as infile:
+                try:
+                    outfile.write(f"```{ext[1:] if ext else ''}\n")  # 확장자에 따른 코드 블록
+                    while True:
+                        started = time.perf_counter()
+                        chunk = infile.read(self.CHUNK_SIZE)
+                        read_time += time.perf_counter() - started
+                        if not chunk:
+                            break
+                        started = time.perf_counter()
+                        outfile.write(chunk)
+                        write_time += time.perf_counter() - started
+                        if self._progress is not None:
+                            self._progress.check()
+                finally:
+                    metrics.add('bytes_read', infile.buffer.tell())
+                    metrics.add_time('read', read_time)
+                    metrics.add_time('write', write_time)
+            outfile.write("\n```\n\n")
+            return True
+        except UnicodeDecodeError:
+            if start is None:
+                raise  # 검증 이후 파일이 바뀐 경우
+            outfile.seek(start)
+            outfile.truncate()
+            return False
+
+    def _validate_encoding(self, file_path: str, encoding: str) -> bool:
+        """파일 전체를 버퍼링하지 않고 디코딩 가능 여부만 확인
+
+        Args:
+            file_path (str): 검사할 파일 경로
+            encoding (str): 파일 인코딩
+
+        Returns:
+            bool: 디코딩 가능하면 True
+        """
+        with self.file_manager.metrics.phase('read'):
+            try:
+                with open(file_path, 'r', encoding=encoding) as infile:
+                    while infile.read(self.CHUNK_SIZE):
+                        pass
+                return True
+            except UnicodeDecodeError:
+                return False
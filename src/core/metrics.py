@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from src.utils.helpers import format_size
+
+# 단계 이름 → 표시 이름 (표시 순서)
+PHASE_LABELS: Dict[str, str] = {
+    'analyze': '확장자 분석',
+    'count': '파일 수',
+    'file_list': '파일 목록',
+    'estimate': '크기 예측',
+    'tree': '트리',
+    'merge': '병합',
+    'scan': '병렬 스캔',
+    'walk': '탐색',
+    'gitignore': 'gitignore',
+    'read': '읽기/디코딩',
+    'write': '쓰기',
+}
+
+# 카운터 이름 → 표시 이름 (표시 순서)
+COUNTER_LABELS: Dict[str, str] = {
+    'dirs_visited': '폴더',
+    'files_visited': '파일',
+    'ignored_gitignore': 'gitignore 제외',
+    'excluded_folder': '제외 폴더',
+    'excluded_file': '제외 파일',
+    'filtered_extension': '확장자 제외',
+    'files_merged': '병합한 파일',
+    'bytes_read': '읽은 바이트',
+    'bytes_written': '쓴 바이트',
+    'decode_failures': '디코딩 실패',
+    'unreadable_files': '읽지 못한 파일',
+}
+
+_BYTE_COUNTERS = ('bytes_read', 'bytes_written')
+
+
+class Metrics:
+    """작업 단계별 소요 시간과 카운터
+
+    호출마다 기록을 남기지 않고 이름별 합계만 누적하므로 항상 켜 두어도 부담이 작다.
+    병합의 미리 읽기 스레드에서도 기록하므로 모든 갱신은 잠금 안에서 한다.
+    (여러 스레드에서 잰 시간은 스레드별 시간의 합이다)
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, value: int = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 누적"""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 단계 시간에 누적"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def reset(self) -> None:
+        """기록 초기화 (작업 단위로 측정할 때 사용)"""
+        with self._lock:
+            self.phases.clear()
+            self.counters.clear()
+
+    @property
+    def empty(self) -> bool:
+        """기록된 내용이 없는지 여부"""
+        return not self.phases and not self.counters
+
+    def to_dict(self, syscalls: Optional[Dict[str, int]] = None) -> Dict[str, Dict[str, float]]:
+        """JSON 으로 내보낼 사전
+
+        Args:
+            syscalls (Optional[Dict[str, int]], optional): 함께 기록할 파일 시스템 호출 수
+
+        Returns:
+            Dict[str, Dict[str, float]]: phases(초), counters, syscalls
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, float]] = {
+                'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+                'counters': dict(self.counters),
+            }
+        if syscalls is not None:
+            result['syscalls'] = dict(syscalls)
+        return result
+
+    def to_json(self, syscalls: Optional[Dict[str, int]] = None) -> str:
+        """JSON 문자열"""
+        return json.dumps(self.to_dict(syscalls), ensure_ascii=False, indent=2)
+
+    def summary(self) -> str:
+        """상태바/표준 에러에 표시할 한 줄 요약"""
+        with self._lock:
+            phases = dict(self.phases)
+            counters = dict(self.counters)
+
+        parts = []
+        timed = [f"{label} {phases[name]:.2f}s" for name, label in PHASE_LABELS.items() if name in phases]
+        if timed:
+            parts.append(", ".join(timed))
+        counted = []
+        for name, label in COUNTER_LABELS.items():
+            value = counters.get(name)
+            if not value:
+                continue
+            counted.append(f"{label} {format_size(value) if name in _BYTE_COUNTERS else value}")
+        if counted:
+            parts.append(", ".join(counted))
+        return " | ".join(parts)
@@ -0,0 +1,79 @@
+from typing import Dict, Iterable, Optional
+
+
+class TrieNode:
+    """경로 구성 요소 하나에 해당하는 트라이 노드"""
+
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self):
+        self.children: Dict[str, 'TrieNode'] = {}
+        self.terminal = False  # 이 경로 자체가 제외 대상인지 여부
+
+    def child(self, name: str) -> Optional['TrieNode']:
+        """하위 구성 요소 노드 반환 (없으면 그 아래에는 제외 대상이 없음)"""
+        return self.children.get(name)
+
+
+class FolderTrie:
+    """제외할 폴더 목록을 경로 구성 요소 단위로 저장하는 트라이
+
+    문자열 접두사 비교와 달리 'src/a' 를 제외해도 'src/ab' 는 제외되지 않으며,
+    제외 폴더 수와 관계없이 경로 깊이만큼만 비교한다. 디렉토리를 재귀로
+    내려가는 쪽은 현재 노드를 함께 넘기고 child() 로 한 단계씩 이동하면
+    항목마다 전체 경로를 다시 비교할 필요가 없다.
+    """
+
+    def __init__(self, folders: Optional[Iterable[str]] = None):
+        """초기화
+
+        Args:
+            folders (Optional[Iterable[str]], optional): 루트 기준 상대 경로 목록
+        """
+        self.root = TrieNode()
+        self._size = 0
+        for folder in folders or []:
+            self.add(folder)
+
+    @staticmethod
+    def _split(path: str) -> list:
+        """경로를 구성 요소 목록으로 분리 ('\\' 와 앞뒤 '/' 허용)"""
+        return [part for part in path.replace('\\', '/').split('/') if part and part != '.']
+
+    def add(self, folder: str) -> None:
+        """제외할 폴더 추가
+
+        Args:
+            folder (str): 루트 기준 상대 경로 (예: 'src/build')
+        """
+        parts = self._split(folder)
+        if not parts:
+            return
+
+        node = self.root
+        for part in parts:
+            node = node.children.setdefault(part, TrieNode())
+        if not node.terminal:
+            node.terminal = True
+            self._size += 1
+
+    def contains(self, rel_path: str) -> bool:
+        """경로가 제외 폴더이거나 그 하위에 있는지 확인
+
+        Args:
+            rel_path (str): 루트 기준 상대 경로
+
+        Returns:
+            bool: 제외 대상이면 True
+        """
+        node = self.root
+        for part in self._split(rel_path):
+            node = node.children.get(part)
+            if node is None:
+                return False
+            if node.terminal:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Optional
+from src.utils.helpers import format_size
+
+
+class OperationCancelled(Exception):
+    """사용자가 작업을 취소했을 때 발생하는 예외"""
+
+
+class Progress:
+    """긴 작업의 진행 상황과 취소 요청을 스레드 간에 전달하는 객체
+
+    작업 스레드는 카운터를 갱신하고 주기적으로 check() 를 호출하며,
+    GUI 스레드는 summary() 로 진행 상황을 읽고 cancel() 로 중단을 요청한다.
+    """
+
+    def __init__(self):
+        self.files_scanned = 0
+        self.dirs_scanned = 0
+        self.files_written = 0
+        self.bytes_written = 0
+        self.total_bytes: Optional[int] = None  # 알 수 있을 때만 설정 (남은 시간 계산용)
+        self.started_at = time.monotonic()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """작업 취소 요청"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancelled.is_set()
+
+    def check(self) -> None:
+        """취소 요청이 있으면 OperationCancelled 발생
+
+        Raises:
+            OperationCancelled: 취소 요청이 있는 경우
+        """
+        if self._cancelled.is_set():
+            raise OperationCancelled()
+
+    def add_directory(self, file_count: int) -> None:
+        """디렉토리 하나를 탐색했음을 기록하고 취소 여부 확인
+
+        Args:
+            file_count (int): 디렉토리 안의 파일 수
+        """
+        self.dirs_scanned += 1
+        self.files_scanned += file_count
+        self.check()
+
+    def add_written(self, byte_count: int) -> None:
+        """파일 하나를 출력에 기록했음을 기록하고 취소 여부 확인
+
+        Args:
+            byte_count (int): 기록한 원본 파일 크기
+        """
+        self.files_written += 1
+        self.bytes_written += byte_count
+        self.check()
+
+    @property
+    def elapsed(self) -> float:
+        """경과 시간 (초)"""
+        return time.monotonic() - self.started_at
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초), 계산할 수 없으면 None"""
+        if not self.total_bytes or not self.bytes_written:
+            return None
+        rate = self.bytes_written / max(self.elapsed, 1e-6)
+        return max(self.total_bytes - self.bytes_written, 0) / rate
+
+    def summary(self) -> str:
+        """진행 상황 요약 문자열"""
+        parts = [f"폴더 {self.dirs_scanned}개, 파일 {self.files_scanned}개 탐색"]
+        if self.files_written:
+            parts.append(f"파일 {self.files_written}개 ({format_size(self.bytes_written)}) 기록")
+        eta = self.eta
+        if eta is not None:
+            parts.append(f"남은 시간 약 {eta:.0f}초")
+        return ", ".join(parts)
+
@@ -0,0 +1,566 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from .metrics import Metrics
+from .progress import Progress
+from .sniffer import is_binary_content, read_head
+
+# traverse() 가 생성하는 이벤트 종류
+ENTRY = 'entry'  # 항목 하나 (파일 또는 폴더)
+ENTER = 'enter'  # 방금 ENTRY 로 나온 폴더의 하위로 내려감
+LEAVE = 'leave'  # 폴더 처리 끝 (하위로 내려가지 않은 폴더도 생성됨)
+
+TraverseEvent = Tuple[str, 'ScanEntry', int, bool]
+
+# POSIX 에서는 DirEntry.stat() 이 항상 시스템 호출이고, Windows 에서는
+# 디렉토리 목록을 읽을 때 함께 받은 정보를 쓰므로 심볼릭 링크가 아니면 무료다.
+_STAT_IS_SYSCALL = os.name != 'nt'
+
+
+class ScanEntry:
+    """스캔된 파일/폴더 하나의 메타데이터"""
+
+    __slots__ = ('name', 'path', 'rel_path', 'is_dir', 'is_symlink', 'size', 'mtime', 'extension',
+                 'binary', 'head')
+
+    def __init__(self, name: str, path: str, rel_path: str,
+                 is_dir: bool, size: int, mtime: float, is_symlink: bool = False):
+        self.name = name
+        self.path = path
+        self.rel_path = rel_path
+        self.is_dir = is_dir
+        self.is_symlink = is_symlink
+        self.size = size
+        self.mtime = mtime
+        self.extension = '' if is_dir else os.path.splitext(name)[1]
+        self.binary: Optional[bool] = None  # 바이너리 여부 (DirectorySnapshot.is_binary 로 확인 시 채워짐)
+        # 바이너리 확인 때 읽은 앞부분 (keep_head 로 요청한 경우만, 인코딩 감지에 쓴 뒤 비움)
+        self.head: Optional[bytes] = None
+
+    def __repr__(self) -> str:
+        return f"ScanEntry({self.rel_path!r}, is_dir={self.is_dir})"
+
+
+class SnapshotDelta:
+    """apply_changes() 로 스냅샷에 반영된 변경 내역"""
+
+    __slots__ = ('added', 'removed', 'modified', 'removed_dirs')
+
+    def __init__(self):
+        self.added: List[ScanEntry] = []
+        self.removed: List[ScanEntry] = []
+        self.modified: List[ScanEntry] = []  # 크기나 수정 시각이 바뀐 파일
+        self.removed_dirs: List[str] = []  # 캐시에서 버린 디렉토리 (사라진 폴더와 그 하위)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    @property
+    def gitignore_changed(self) -> bool:
+        """.gitignore 파일이 추가/삭제/수정되었는지 여부"""
+        return any(entry.name == '.gitignore'
+                   for entry in self.added + self.removed + self.modified)
+
+    def summary(self) -> str:
+        """변경 내역 요약 문자열"""
+        return f"추가 {len(self.added)}, 삭제 {len(self.removed)}, 수정 {len(self.modified)}"
+
+
+class DirectorySnapshot:
+    """디렉토리 트리의 메모리 스냅샷
+
+    각 디렉토리는 처음 조회될 때 한 번만 os.scandir 로 읽히고 이후에는
+    캐시된 목록이 재사용된다. FileManager, FileMerger, TreeGenerator,
+    StatusBar 가 같은 스냅샷을 조회하므로 폴더 하나를 선택해도 파일 시스템은
+    한 번만 탐색된다. 파일 시스템이 바뀌면 invalidate()/refresh() 로 갱신하거나,
+    감시기(watcher)가 알려준 디렉토리만 apply_changes() 로 다시 읽는다.
+    """
+
+    def __init__(self, root_path: str):
+        """초기화
+
+        Args:
+            root_path (str): 스캔할 루트 경로
+        """
+        self.root_path = Path(root_path)
+        self._root = str(self.root_path)
+        self._children: Dict[str, List[ScanEntry]] = {}
+        self._complete = False
+        # 파일 시스템 호출 횟수 (네트워크 드라이브에서는 호출마다 왕복 지연 발생)
+        self.scandir_calls = 0
+        self.stat_calls = 0
+        self.sniff_calls = 0  # 바이너리 판별을 위해 파일 앞부분을 읽은 횟수
+        # 단계별 시간과 카운터 (이 스냅샷을 공유하는 FileManager/병합기/트리 생성기가 함께 기록)
+        self.metrics = Metrics()
+        # 순회 옵션 (스캔 결과 캐시와 무관하게 순회할 때 적용됨)
+        self.max_depth: Optional[int] = None  # None 이면 제한 없음, 0 이면 루트 항목만
+        self.follow_symlinks = True  # False 면 심볼릭 링크 항목을 건너뜀
+        self._identities: Dict[str, Optional[Tuple[int, int]]] = {}  # 순환 확인용 (st_dev, st_ino)
+
+    def set_traversal_options(self, max_depth: Optional[int] = None,
+                              follow_symlinks: bool = True) -> None:
+        """순회 옵션 설정
+
+        Args:
+            max_depth (Optional[int], optional): 루트 아래로 내려갈 최대 폴더 깊이.
+                None 이면 제한 없음, 0 이면 루트의 항목만 순회. Defaults to None.
+            follow_symlinks (bool, optional): 폴더 심볼릭 링크를 따라갈지 여부.
+                True 면 순환하는 링크만 내려가지 않고, False 면 링크 항목을 모두 건너뜀.
+        """
+        self.max_depth = max_depth
+        self.follow_symlinks = follow_symlinks
+        self._complete = False
+
+    @property
+    def syscall_count(self) -> int:
+        """이 스냅샷이 지금까지 실행한 scandir/stat/파일 앞부분 읽기 호출 수"""
+        return self.scandir_calls + self.stat_calls + self.sniff_calls
+
+    def reset_counters(self) -> None:
+        """시스템 호출 카운터 초기화 (작업 단위로 측정할 때 사용)"""
+        self.scandir_calls = 0
+        self.stat_calls = 0
+        self.sniff_calls = 0
+
+    def abs_path(self, rel_dir: str) -> str:
+        """상대 경로를 절대 경로로 변환"""
+        return os.path.join(self._root, rel_dir) if rel_dir else self._root
+
+    def _scan_directory(self, rel_dir: str) -> List[ScanEntry]:
+        """디렉토리 하나를 scandir 로 읽어 정렬된 항목 목록 생성
+
+        Args:
+            rel_dir (str): 루트 기준 상대 경로 ('' 는 루트)
+
+        Returns:
+            List[ScanEntry]: (폴더 우선, 이름순) 정렬된 항목 목록
+        """
+        entries, stat_calls = self._read_directory(rel_dir)
+        self.scandir_calls += 1
+        self.stat_calls += stat_calls
+        return entries
+
+    def _read_directory(self, rel_dir: str) -> Tuple[List[ScanEntry], int]:
+        """디렉토리 하나를 읽어 정렬된 항목 목록 생성 (스냅샷 상태를 바꾸지 않아 스레드에서 호출 가능)
+
+        Args:
+            rel_dir (str): 루트 기준 상대 경로 ('' 는 루트)
+
+        Returns:
+            Tuple[List[ScanEntry], int]: ((폴더 우선, 이름순) 정렬된 항목 목록, stat 호출 수)
+        """
+        entries = []
+        stat_calls = 0
+        try:
+            with os.scandir(self.abs_path(rel_dir)) as it:
+                for dir_entry in it:
+                    # DirEntry 의 메타데이터는 여기서 한 번만 읽고 이후에는 ScanEntry 만 사용
+                    try:
+                        is_symlink = dir_entry.is_symlink()
+                        is_dir = dir_entry.is_dir()
+                        if is_symlink:
+                            stat_calls += 1  # 링크 대상 확인
+                        if is_dir:
+                            size, mtime = 0, 0.0
+                        else:
+                            stat = dir_entry.stat()
+                            if _STAT_IS_SYSCALL and not is_symlink:
+                                stat_calls += 1
+                            size, mtime = stat.st_size, stat.st_mtime
+                    except OSError:
+                        continue  # 읽는 도중 사라진 항목 등은 무시
+
+                    rel_path = f"{rel_dir}/{dir_entry.name}" if rel_dir else dir_entry.name
+                    entries.append(ScanEntry(dir_entry.name, dir_entry.path, rel_path,
+                                             is_dir, size, mtime, is_symlink))
+        except OSError:
+            pass  # 권한이 없거나 사라진 디렉토리는 빈 폴더로 취급
+
+        entries.sort(key=lambda e: (not e.is_dir, e.name.lower()))
+        return entries, stat_calls
+
+    def children(self, rel_dir: str = '') -> List[ScanEntry]:
+        """디렉토리의 하위 항목 목록 반환 (필요할 때만 스캔)
+
+        Args:
+            rel_dir (str, optional): 루트 기준 상대 경로. Defaults to ''.
+
+        Returns:
+            List[ScanEntry]: (폴더 우선, 이름순) 정렬된 항목 목록
+        """
+        entries = self._children.get(rel_dir)
+        if entries is None:
+            entries = self._scan_directory(rel_dir)
+            self._children[rel_dir] = entries
+        return entries
+
+    def is_binary(self, entry: ScanEntry, keep_head: bool = False) -> bool:
+        """파일이 바이너리인지 확인 (앞부분만 읽으며 결과는 항목에 캐시됨)
+
+        Args:
+            entry (ScanEntry): 파일 항목
+            keep_head (bool, optional): 읽은 앞부분을 entry.head 에 남길지 여부.
+                인코딩 감지 등에 다시 쓸 때만 켜고, 쓴 뒤에는 호출한 쪽에서 비운다.
+                Defaults to False.
+
+        Returns:
+            bool: 바이너리로 보이면 True (폴더와 빈 파일은 False, 읽을 수 없는 파일도 False)
+        """
+        if entry.binary is None:
+            if entry.is_dir or entry.size == 0:
+                entry.binary = False
+            else:
+                self.sniff_calls += 1
+                try:
+                    head, _ = read_head(entry.path)
+                except OSError:
+                    head = b''
+                entry.binary = is_binary_content(head)
+                if keep_head:
+                    entry.head = head
+        return entry.binary
+
+    def _dir_identity(self, rel_dir: str) -> Optional[Tuple[int, int]]:
+        """링크를 따라간 실제 디렉토리의 (st_dev, st_ino), 확인할 수 없으면 None"""
+        if rel_dir not in self._identities:
+            self.stat_calls += 1
+            try:
+                stat = os.stat(self.abs_path(rel_dir))
+                self._identities[rel_dir] = (stat.st_dev, stat.st_ino)
+            except OSError:
+                self._identities[rel_dir] = None
+        return self._identities[rel_dir]
+
+    def _is_cycle(self, entry: ScanEntry) -> bool:
+        """폴더 심볼릭 링크가 자신의 상위 폴더를 가리키는지 확인 (inode 비교)"""
+        target = self._dir_identity(entry.rel_path)
+        if target is None:
+            return True  # 대상을 확인할 수 없으면 내려가지 않음
+        parts = entry.rel_path.split('/')
+        return any(self._dir_identity('/'.join(parts[:i])) == target
+                   for i in range(len(parts)))
+
+    def _skips(self, entry: ScanEntry) -> bool:
+        """순회 옵션에 따라 항목 자체를 건너뛰는지 확인"""
+        return entry.is_symlink and not self.follow_symlinks
+
+    def can_descend(self, entry: ScanEntry, depth: int) -> bool:
+        """순회 옵션(최대 깊이, 심볼릭 링크 순환)상 폴더 하위로 내려갈 수 있는지 확인
+
+        Args:
+            entry (ScanEntry): 폴더 항목
+            depth (int): 항목의 깊이 (루트의 항목이 0)
+
+        Returns:
+            bool: 내려갈 수 있으면 True
+        """
+        if self.max_depth is not None and depth >= self.max_depth:
+            return False
+        return not (entry.is_symlink and self._is_cycle(entry))
+
+    def visible_children(self,
+                         rel_dir: str,
+                         prune: Optional[Callable[[ScanEntry], bool]] = None,
+                         progress: Optional[Progress] = None) -> List[ScanEntry]:
+        """순회 옵션과 prune 을 적용한 하위 항목 목록 (방문한 폴더로 기록됨)
+
+        Args:
+            rel_dir (str): 루트 기준 상대 경로 ('' 는 루트)
+            prune (Optional[Callable[[ScanEntry], bool]], optional): True 를 반환하는 항목은 제외
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            List[ScanEntry]: (폴더 우선, 이름순) 정렬된 항목 목록
+        """
+        entries = [entry for entry in self.children(rel_dir)
+                   if not self._skips(entry) and not (prune and prune(entry))]
+        file_count = sum(1 for entry in entries if not entry.is_dir)
+        self.metrics.add('dirs_visited')
+        self.metrics.add('files_visited', file_count)
+        if progress is not None:
+            progress.add_directory(file_count)
+        return entries
+
+    def walk(self,
+             rel_dir: str = '',
+             prune: Optional[Callable[[ScanEntry], bool]] = None,
+             progress: Optional[Progress] = None
+             ) -> Iterator[Tuple[str, List[ScanEntry], List[ScanEntry]]]:
+        """os.walk 와 같은 형태로 스냅샷을 순회
+
+        Args:
+            rel_dir (str, optional): 시작 디렉토리. Defaults to ''.
+            prune (Optional[Callable[[ScanEntry], bool]], optional):
+                True 를 반환하는 항목은 결과에서 빠지고, 폴더라면 하위로 내려가지 않음
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Yields:
+            Tuple[str, List[ScanEntry], List[ScanEntry]]: (상대 경로, 폴더 목록, 파일 목록).
+                최대 깊이나 링크 순환으로 내려가지 않는 폴더도 폴더 목록에는 포함된다.
+        """
+        stack = [(rel_dir, 0)]
+        while stack:
+            current, depth = stack.pop()
+            dirs, files = [], []
+            for entry in self.visible_children(current, prune, progress):
+                (dirs if entry.is_dir else files).append(entry)
+            yield current, dirs, files
+
+            # 정렬 순서대로 방문하도록 역순으로 스택에 추가
+            for entry in reversed(dirs):
+                if self.can_descend(entry, depth):
+                    stack.append((entry.rel_path, depth + 1))
+
+    def traverse(self,
+                 rel_dir: str = '',
+                 prune: Optional[Callable[[ScanEntry], bool]] = None,
+                 descend: Optional[Callable[[ScanEntry], bool]] = None,
+                 progress: Optional[Progress] = None) -> Iterator[TraverseEvent]:
+        """트리 출력처럼 깊이 우선 순서가 필요한 순회 (재귀 없이 스택 사용)
+
+        각 항목마다 (ENTRY, 항목, 깊이, 마지막 여부) 를 생성하고, 폴더라면 하위로
+        내려갈 때 ENTER 를, 하위 항목을 모두 생성한 뒤(또는 내려가지 않기로 한 직후)
+        LEAVE 를 생성한다. 깊이는 시작 디렉토리의 항목이 0 이다.
+
+        Args:
+            rel_dir (str, optional): 시작 디렉토리. Defaults to ''.
+            prune (Optional[Callable[[ScanEntry], bool]], optional):
+                True 를 반환하는 항목은 생성하지 않음 (마지막 여부 계산 전에 제외)
+            descend (Optional[Callable[[ScanEntry], bool]], optional):
+                폴더의 ENTRY 를 처리한 뒤 호출되어 False 면 하위로 내려가지 않음
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Yields:
+            TraverseEvent: (이벤트 종류, 항목, 깊이, 형제 중 마지막 여부)
+        """
+        # 스택 원소: [항목 목록, 다음 인덱스, 깊이, 소유 폴더 이벤트]
+        stack: list = [[self.visible_children(rel_dir, prune, progress), 0, 0, None]]
+        while stack:
+            frame = stack[-1]
+            entries, index, depth, owner = frame
+            if index >= len(entries):
+                stack.pop()
+                if owner is not None:
+                    yield owner
+                continue
+
+            frame[1] = index + 1
+            entry = entries[index]
+            is_last = index == len(entries) - 1
+            yield ENTRY, entry, depth, is_last
+
+            if entry.is_dir:
+                leave = (LEAVE, entry, depth, is_last)
+                if self.can_descend(entry, depth) and (descend is None or descend(entry)):
+                    yield ENTER, entry, depth, is_last
+                    children = self.visible_children(entry.rel_path, prune, progress)
+                    stack.append([children, 0, depth + 1, leave])
+                else:
+                    yield leave
+
+    def _queue_uncached(self,
+                        rel_dir: str,
+                        depth: int,
+                        prune: Optional[Callable[[ScanEntry], bool]],
+                        queue: Deque[Tuple[str, int]]) -> None:
+        """캐시된 디렉토리를 따라 내려가며 아직 읽지 않은 하위 디렉토리를 대기열에 추가
+
+        Args:
+            rel_dir (str): 시작 디렉토리
+            depth (int): 시작 디렉토리 항목의 깊이 (루트의 항목이 0)
+            prune (Optional[Callable[[ScanEntry], bool]]): True 를 반환하는 폴더는 내려가지 않음
+            queue (Deque[Tuple[str, int]]): (읽을 디렉토리, 항목 깊이) 대기열
+        """
+        stack = [(rel_dir, depth)]
+        while stack:
+            current, current_depth = stack.pop()
+            entries = self._children.get(current)
+            if entries is None:
+                queue.append((current, current_depth))
+                continue
+            for entry in entries:
+                if (entry.is_dir and not self._skips(entry) and not (prune and prune(entry))
+                        and self.can_descend(entry, current_depth)):
+                    stack.append((entry.rel_path, current_depth + 1))
+
+    def prefetch(self,
+                 rel_dir: str = '',
+                 workers: int = 8,
+                 prune: Optional[Callable[[ScanEntry], bool]] = None,
+                 progress: Optional[Progress] = None) -> int:
+        """하위 디렉토리 목록을 스레드 풀로 동시에 읽어 캐시를 채움
+
+        네트워크 드라이브처럼 scandir 한 번이 왕복 지연인 경우를 위한 것으로,
+        디렉토리를 읽는 작업만 스레드에서 실행하고 캐시 저장, prune, 순회 옵션 확인은
+        호출한 스레드에서 한다. 이후 walk/traverse 는 정렬된 캐시를 읽으므로
+        결과 순서는 순차 스캔과 같다.
+
+        Args:
+            rel_dir (str, optional): 시작 디렉토리. Defaults to ''.
+            workers (int, optional): 동시에 읽을 최대 디렉토리 수. Defaults to 8.
+            prune (Optional[Callable[[ScanEntry], bool]], optional):
+                True 를 반환하는 폴더는 읽지 않음 (순회할 때와 같은 조건을 주어야 함)
+            progress (Optional[Progress], optional): 취소 확인용 객체
+
+        Returns:
+            int: 새로 읽은 디렉토리 수
+
+        Raises:
+            OperationCancelled: progress 로 취소된 경우 (그때까지 읽은 디렉토리는 캐시에 남음)
+        """
+        queue: Deque[Tuple[str, int]] = deque()
+        self._queue_uncached(rel_dir, 0, prune, queue)
+        if not queue:
+            return 0
+
+        scanned = 0
+        running: Dict[Future, Tuple[str, int]] = {}
+        # 대기 중인 작업이 너무 많이 쌓이지 않도록 스레드 수의 몇 배까지만 제출
+        max_running = max(1, workers) * 4
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            try:
+                while queue or running:
+                    while queue and len(running) < max_running:
+                        current, depth = queue.popleft()
+                        running[pool.submit(self._read_directory, current)] = (current, depth)
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        current, depth = running.pop(future)
+                        entries, stat_calls = future.result()
+                        self.scandir_calls += 1
+                        self.stat_calls += stat_calls
+                        self._children.setdefault(current, entries)
+                        scanned += 1
+                        self._queue_uncached(current, depth, prune, queue)
+
+                    if progress is not None:
+                        progress.check()
+            except BaseException:
+                # 취소 또는 오류 시 아직 시작하지 않은 작업은 버림
+                for future in running:
+                    future.cancel()
+                raise
+        return scanned
+
+    def scan(self) -> None:
+        """트리 전체를 한 번에 스캔 (이미 스캔된 디렉토리는 건너뜀)"""
+        if self._complete:
+            return
+        for _ in self.walk():
+            pass
+        self._complete = True
+
+    def count(self,
+              extensions: Optional[List[str]] = None,
+              prune: Optional[Callable[[ScanEntry], bool]] = None,
+              progress: Optional[Progress] = None) -> Tuple[int, int]:
+        """파일 수와 폴더 수 계산
+
+        Args:
+            extensions (Optional[List[str]], optional): 셀 파일 확장자 목록. Defaults to None.
+            prune (Optional[Callable[[ScanEntry], bool]], optional): 건너뛸 항목 판정 함수
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            Tuple[int, int]: (파일 수, 폴더 수)
+        """
+        file_count = 0
+        folder_count = 0
+        for _, dirs, files in self.walk(prune=prune, progress=progress):
+            folder_count += len(dirs)
+            if not extensions:
+                file_count += len(files)
+                continue
+            for entry in files:
+                if entry.extension in extensions or (
+                        entry.extension == '' and 'No Extension' in extensions):
+                    file_count += 1
+        if prune is None:
+            self._complete = True
+        return file_count, folder_count
+
+    def cached_directories(self) -> List[str]:
+        """이미 읽어 캐시에 있는 디렉토리 목록 (감시 대상)"""
+        return list(self._children)
+
+    def _drop_subtree(self, rel_dir: str, delta: SnapshotDelta) -> None:
+        """사라진 폴더와 그 하위의 캐시를 버리고 캐시에 있던 항목을 삭제로 기록"""
+        prefix = f"{rel_dir}/"
+        for key in [k for k in self._children if k == rel_dir or k.startswith(prefix)]:
+            delta.removed.extend(self._children.pop(key))
+            delta.removed_dirs.append(key)
+
+    def apply_changes(self, rel_dirs: Iterable[str]) -> SnapshotDelta:
+        """바뀐 디렉토리만 다시 읽어 캐시에 반영
+
+        캐시에 없는 디렉토리는 나중에 조회될 때 읽히므로 건너뛴다. 크기와 수정 시각이
+        같은 항목은 기존 객체를 그대로 두어 바이너리 판별 결과 등을 유지하고,
+        사라진 폴더는 하위 캐시까지 버린다.
+
+        Args:
+            rel_dirs (Iterable[str]): 내용이 바뀐 디렉토리의 루트 기준 상대 경로
+
+        Returns:
+            SnapshotDelta: 추가/삭제/수정된 항목
+        """
+        delta = SnapshotDelta()
+        # 상위 폴더를 먼저 처리해야 함께 사라진 하위 폴더를 다시 읽지 않음
+        for rel_dir in sorted(set(rel_dirs)):
+            old = self._children.get(rel_dir)
+            if old is None:
+                continue
+
+            previous = {entry.name: entry for entry in old}
+            entries = self._scan_directory(rel_dir)
+            for i, entry in enumerate(entries):
+                before = previous.pop(entry.name, None)
+                if before is None:
+                    delta.added.append(entry)
+                elif before.is_dir != entry.is_dir or before.is_symlink != entry.is_symlink:
+                    # 같은 이름의 다른 종류 항목으로 바뀐 경우
+                    previous[entry.name] = before
+                    delta.added.append(entry)
+                elif before.size == entry.size and before.mtime == entry.mtime:
+                    entries[i] = before
+                else:
+                    delta.modified.append(entry)
+
+            for before in previous.values():
+                delta.removed.append(before)
+                if before.is_dir:
+                    self._drop_subtree(before.rel_path, delta)
+            self._children[rel_dir] = entries
+
+        if any(entry.is_dir for entry in delta.added + delta.removed):
+            self._identities.clear()  # 폴더 링크 대상이 바뀌었을 수 있음
+        return delta
+
+    def invalidate(self, rel_dir: Optional[str] = None, recursive: bool = True) -> None:
+        """캐시된 목록을 무효화
+
+        Args:
+            rel_dir (Optional[str], optional): 무효화할 디렉토리.
+                None 이면 전체를 무효화. Defaults to None.
+            recursive (bool, optional): 하위 디렉토리까지 무효화할지 여부. Defaults to True.
+        """
+        self._complete = False
+        self._identities.clear()
+        if rel_dir is None:
+            self._children.clear()
+            return
+
+        if not recursive:
+            self._children.pop(rel_dir, None)
+            return
+
+        prefix = f"{rel_dir}/" if rel_dir else ''
+        for key in [k for k in self._children if k == rel_dir or k.startswith(prefix)]:
+            del self._children[key]
+
+    def refresh(self) -> None:
+        """스냅샷을 버리고 트리 전체를 다시 스캔"""
+        self.invalidate()
+        self.scan()
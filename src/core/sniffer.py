@@ -0,0 +1,186 @@
+import codecs
+from typing import Optional, Sequence, Tuple
+
+# 파일 종류를 판단할 때 읽는 앞부분 크기
+SNIFF_SIZE = 8192
+
+# 인코딩 자동 감지 시 BOM 다음으로 시도할 기본 인코딩 순서
+DEFAULT_ENCODINGS: Tuple[str, ...] = ('utf-8', 'cp949')
+
+# BOM 과 그에 맞는 코덱 (UTF-32 LE 의 BOM 이 UTF-16 LE 로 시작하므로 UTF-32 먼저 확인)
+_BOM_ENCODINGS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 텍스트 파일의 BOM (있으면 NUL 바이트가 있어도 텍스트로 취급)
+TEXT_BOMS: Tuple[bytes, ...] = (
+    codecs.BOM_UTF8,
+    codecs.BOM_UTF32_LE,
+    codecs.BOM_UTF32_BE,
+    codecs.BOM_UTF16_LE,
+    codecs.BOM_UTF16_BE,
+)
+
+# 자주 보이는 바이너리 형식의 시그니처
+MAGIC_NUMBERS: Tuple[bytes, ...] = (
+    b'\x89PNG\r\n\x1a\n',       # PNG
+    b'\xff\xd8\xff',            # JPEG
+    b'GIF87a', b'GIF89a',       # GIF
+    b'%PDF-',                   # PDF
+    b'PK\x03\x04', b'PK\x05\x06',  # ZIP, docx/xlsx/jar 등
+    b'\x1f\x8b',                # gzip
+    b'BZh',                     # bzip2
+    b'\xfd7zXZ\x00',            # xz
+    b'7z\xbc\xaf\x27\x1c',      # 7z
+    b'Rar!\x1a\x07',            # RAR
+    b'\x7fELF',                 # ELF 실행 파일
+    b'\xca\xfe\xba\xbe',        # Java class
+    b'SQLite format 3\x00',     # SQLite
+    b'\x00\x00\x01\x00',        # ICO
+    b'OggS', b'fLaC',           # 오디오
+    b'RIFF',                    # WAV/AVI/WEBP
+)
+
+# 텍스트에 거의 나오지 않는 제어 문자 (탭, 줄바꿈, 폼피드, ESC 등은 제외)
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in (8, 9, 10, 12, 13, 27))
+_CONTROL_RATIO = 0.3
+
+
+def detect_bom(head: bytes) -> Optional[str]:
+    """BOM 으로 인코딩 확인
+
+    Args:
+        head (bytes): 파일 앞부분
+
+    Returns:
+        Optional[str]: BOM 에 맞는 코덱 이름 (BOM 은 디코딩 시 제거됨), 없으면 None
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def guess_utf16(head: bytes) -> Optional[str]:
+    """BOM 없는 UTF-16 텍스트인지 NUL 바이트 위치로 추정
+
+    영문/코드 위주의 UTF-16 텍스트는 한쪽 바이트 자리에만 NUL 이 몰려 있다.
+
+    Args:
+        head (bytes): 파일 앞부분
+
+    Returns:
+        Optional[str]: 'utf-16-le' 또는 'utf-16-be', 아니면 None
+    """
+    sample = head[:len(head) // 2 * 2]
+    if len(sample) < 4:
+        return None
+    half = len(sample) // 2
+    even_nuls = sample[0::2].count(0)
+    odd_nuls = sample[1::2].count(0)
+    if odd_nuls > half * 0.4 and even_nuls < half * 0.05:
+        encoding = 'utf-16-le'
+    elif even_nuls > half * 0.4 and odd_nuls < half * 0.05:
+        encoding = 'utf-16-be'
+    else:
+        return None
+    try:
+        sample.decode(encoding)
+    except UnicodeDecodeError:
+        return None
+    return encoding
+
+
+def detect_encoding(head: bytes, candidates: Sequence[str], complete: bool = False) -> Optional[str]:
+    """파일 앞부분으로 인코딩 감지 (BOM → BOM 없는 UTF-16 → 후보 순서대로 디코딩 시도)
+
+    Args:
+        head (bytes): 파일 앞부분
+        candidates (Sequence[str]): 시도할 인코딩 순서
+        complete (bool, optional): head 가 파일 전체인지 여부.
+            False 면 끝에서 잘린 멀티바이트 문자는 오류로 보지 않는다.
+
+    Returns:
+        Optional[str]: 앞부분을 디코딩할 수 있는 첫 인코딩, 없으면 None
+    """
+    encoding = detect_bom(head) or guess_utf16(head)
+    if encoding:
+        return encoding
+
+    for candidate in candidates:
+        try:
+            codecs.getincrementaldecoder(candidate)().decode(head, final=complete)
+            return candidate
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return None
+
+
+def is_binary_content(head: bytes) -> bool:
+    """파일 앞부분으로 바이너리 여부 판단
+
+    BOM → 시그니처 → NUL 바이트(BOM 없는 UTF-16 제외) → UTF-8 디코딩 시도 → 제어 문자 비율 순으로 확인한다.
+    UTF-8 이 아닌 텍스트(CP949 등)는 제어 문자가 적으므로 텍스트로 판단된다.
+
+    Args:
+        head (bytes): 파일 앞부분 (보통 SNIFF_SIZE 바이트)
+
+    Returns:
+        bool: 바이너리로 보이면 True
+    """
+    if not head:
+        return False
+    if head.startswith(TEXT_BOMS):
+        return False
+    if head.startswith(MAGIC_NUMBERS):
+        return True
+    if b'\x00' in head:
+        # BOM 없는 UTF-16 텍스트가 아니면 바이너리
+        return guess_utf16(head) is None
+
+    # 잘린 멀티바이트 문자가 끝에 있어도 실패하지 않도록 점진적 디코더 사용
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return False
+    except UnicodeDecodeError:
+        pass
+
+    control_count = len(head) - len(head.translate(None, _CONTROL_BYTES))
+    return control_count / len(head) > _CONTROL_RATIO
+
+
+def read_head(path: str) -> Tuple[bytes, bool]:
+    """파일 앞부분 읽기
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        Tuple[bytes, bool]: (앞부분, 파일 전체를 읽었는지 여부)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_SIZE + 1)
+    return head[:SNIFF_SIZE], len(head) <= SNIFF_SIZE
+
+
+def sniff_binary(path: str) -> bool:
+    """파일 앞부분만 읽어 바이너리 여부 판단
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        bool: 바이너리로 보이면 True (읽을 수 없는 파일은 False)
+    """
+    try:
+        head, _ = read_head(path)
+    except OSError:
+        return False
+    return is_binary_content(head)
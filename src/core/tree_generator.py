@@ -1,105 +1,331 @@
-from typing import Generator, Optional, List
+from typing import Generator, Iterable, Iterator, Optional, List, TextIO, Tuple
 from pathlib import Path
-import os
-from .gitignore_parser import GitignoreParser
 from src.core.file_manager import FileManager
+from src.core.path_trie import FolderTrie, TrieNode
+from src.core.progress import Progress
+from src.core.snapshot import ENTRY, LEAVE, ScanEntry
+
+# `tree /F` 출력에서 펼칠 폴더: (상대 경로, 하위 줄 접두사, 깊이, 제외 폴더 트라이 노드)
+_GraphFolder = Tuple[str, str, int, Optional[TrieNode]]
 
 class TreeGenerator:
     """파일 트리 구조를 생성하는 클래스"""
 
+    # 스트리밍 출력 시 한 번에 write() 할 줄 수
+    WRITE_BATCH_LINES = 1000
+
     def __init__(self, root_path: str, file_manager: FileManager):
         self.root_path = Path(root_path)
         self.file_manager = file_manager
+        self.mark_binary = False  # True 면 파일 앞부분을 읽어 바이너리 파일에 표시
 
     def generate_ascii_tree(self,
                             allowed_extensions: Optional[List[str]] = None,
                             exclude_files: Optional[List[str]] = None,
-                            exclude_folders: Optional[List[str]] = None) -> str:
+                            exclude_folders: Optional[List[str]] = None,
+                            progress: Optional[Progress] = None) -> str:
         """ASCII 아트 형식의 트리 구조를 생성
 
         Args:
             allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
             exclude_files (Optional[List[str]], optional): 제외할 파일 목록
             exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
 
         Returns:
             str: 생성된 트리 구조 문자열
         """
-        tree_content = self._walk(
-            self.root_path,
+        with self.file_manager.metrics.phase('tree'):
+            return "\n".join(self.iter_ascii_tree(allowed_extensions, exclude_files,
+                                                  exclude_folders, progress))
+
+    def iter_ascii_tree(self,
+                        allowed_extensions: Optional[List[str]] = None,
+                        exclude_files: Optional[List[str]] = None,
+                        exclude_folders: Optional[List[str]] = None,
+                        progress: Optional[Progress] = None) -> Iterator[str]:
+        """ASCII 아트 형식의 트리 구조를 한 줄씩 생성
+
+        Args:
+            allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            Iterator[str]: 트리 구조의 각 줄 (줄바꿈 문자 없음)
+        """
+        return self._walk(
+            '',
             allowed_extensions,
             exclude_files or [],
-            exclude_folders or []
+            FolderTrie(exclude_folders).root,
+            progress=progress
         )
-        return "\n".join(tree_content)
+
+    def write_ascii_tree(self,
+                         outfile: TextIO,
+                         allowed_extensions: Optional[List[str]] = None,
+                         exclude_files: Optional[List[str]] = None,
+                         exclude_folders: Optional[List[str]] = None,
+                         progress: Optional[Progress] = None) -> int:
+        """ASCII 아트 형식의 트리 구조를 파일 객체에 바로 기록
+
+        전체 트리를 문자열로 모으지 않고 WRITE_BATCH_LINES 줄씩 모아 기록하므로
+        항목이 수백만 개인 트리도 일정한 메모리로 출력할 수 있다.
+
+        Args:
+            outfile (TextIO): 기록할 텍스트 파일 객체 (sys.stdout 가능)
+            allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            int: 기록한 줄 수
+        """
+        return self._write_lines(outfile, self.iter_ascii_tree(allowed_extensions, exclude_files,
+                                                               exclude_folders, progress))
+
+    def generate_graph_tree(self,
+                            allowed_extensions: Optional[List[str]] = None,
+                            exclude_files: Optional[List[str]] = None,
+                            exclude_folders: Optional[List[str]] = None,
+                            progress: Optional[Progress] = None) -> str:
+        """Windows `tree /F` 형식의 트리 구조를 생성
+
+        Args:
+            allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            str: 생성된 트리 구조 문자열
+        """
+        with self.file_manager.metrics.phase('tree'):
+            return "\n".join(self.iter_graph_tree(allowed_extensions, exclude_files,
+                                                  exclude_folders, progress))
+
+    def iter_graph_tree(self,
+                        allowed_extensions: Optional[List[str]] = None,
+                        exclude_files: Optional[List[str]] = None,
+                        exclude_folders: Optional[List[str]] = None,
+                        progress: Optional[Progress] = None) -> Iterator[str]:
+        """Windows `tree /F` 형식의 트리 구조를 한 줄씩 생성
+
+        첫 줄은 루트 경로이고, 폴더마다 파일을 먼저 나열한 뒤 하위 폴더를
+        ├─── / └─── 로 연결한다. 셸 명령을 실행하지 않으므로 운영체제와 관계없이
+        같은 결과가 나오며 .gitignore 와 제외 조건도 ASCII 트리와 같게 적용된다.
+
+        Args:
+            allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            Iterator[str]: 트리 구조의 각 줄 (줄바꿈 문자 없음)
+        """
+        return self._walk_graph(allowed_extensions, exclude_files or [],
+                                FolderTrie(exclude_folders).root, progress)
+
+    def write_graph_tree(self,
+                         outfile: TextIO,
+                         allowed_extensions: Optional[List[str]] = None,
+                         exclude_files: Optional[List[str]] = None,
+                         exclude_folders: Optional[List[str]] = None,
+                         progress: Optional[Progress] = None) -> int:
+        """Windows `tree /F` 형식의 트리 구조를 파일 객체에 바로 기록
+
+        Args:
+            outfile (TextIO): 기록할 텍스트 파일 객체 (sys.stdout 가능)
+            allowed_extensions (Optional[List[str]], optional): 허용할 확장자 목록
+            exclude_files (Optional[List[str]], optional): 제외할 파일 목록
+            exclude_folders (Optional[List[str]], optional): 제외할 폴더 목록
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Returns:
+            int: 기록한 줄 수
+        """
+        return self._write_lines(outfile, self.iter_graph_tree(allowed_extensions, exclude_files,
+                                                               exclude_folders, progress))
+
+    def _write_lines(self, outfile: TextIO, lines: Iterable[str]) -> int:
+        """줄을 WRITE_BATCH_LINES 개씩 모아 기록
+
+        Args:
+            outfile (TextIO): 기록할 텍스트 파일 객체
+            lines (Iterable[str]): 기록할 줄 (줄바꿈 문자 없음)
+
+        Returns:
+            int: 기록한 줄 수
+        """
+        line_count = 0
+        batch: List[str] = []
+        with self.file_manager.metrics.phase('tree'):
+            for line in lines:
+                batch.append(line)
+                if len(batch) >= self.WRITE_BATCH_LINES:
+                    outfile.write("\n".join(batch) + "\n")
+                    line_count += len(batch)
+                    batch.clear()
+            if batch:
+                outfile.write("\n".join(batch) + "\n")
+                line_count += len(batch)
+        return line_count
+
+    def _is_listed(self,
+                   entry: ScanEntry,
+                   allowed_extensions: Optional[List[str]],
+                   exclude_files: List[str]) -> bool:
+        """파일을 트리에 표시할지 확인 (제외 파일과 확장자 조건, 제외된 수를 기록)"""
+        if entry.name in exclude_files:
+            self.file_manager.metrics.add('excluded_file')
+            return False
+
+        ext = entry.extension
+        if allowed_extensions is not None:
+            if not (ext in allowed_extensions or (ext == '' and 'No Extension' in allowed_extensions)):
+                self.file_manager.metrics.add('filtered_extension')
+                return False
+        return True
+
+    def _file_label(self, entry: ScanEntry) -> str:
+        """파일 이름 (mark_binary 가 켜져 있으면 바이너리 표시 포함)"""
+        if self.mark_binary and self.file_manager.snapshot.is_binary(entry):
+            return f"{entry.name} (바이너리)"
+        return entry.name
+
+    def _walk_graph(self,
+                    allowed_extensions: Optional[List[str]],
+                    exclude_files: List[str],
+                    excluded: Optional[TrieNode],
+                    progress: Optional[Progress] = None) -> Generator[str, None, None]:
+        """`tree /F` 형식으로 폴더를 하나씩 읽으며 트리 구조를 생성
+
+        폴더의 파일을 하위 폴더보다 먼저 출력하므로 traverse 대신 폴더 단위로 읽는다.
+        스택에는 (폴더 줄, 펼칠 폴더) 를 넣어 폴더 줄 바로 뒤에 그 내용이 오게 한다.
+
+        Args:
+            allowed_extensions (Optional[List[str]]): 허용할 확장자 목록
+            exclude_files (List[str]): 제외할 파일 목록
+            excluded (Optional[TrieNode]): 루트에 해당하는 제외 폴더 트라이 노드
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
+
+        Yields:
+            Generator[str, None, None]: 트리 구조의 각 줄
+        """
+        snapshot = self.file_manager.snapshot
+        metrics = self.file_manager.metrics
+        yield str(self.root_path)
+        if excluded is not None and excluded.terminal:
+            return
+
+        # 스택 원소: (출력할 폴더 줄, 펼칠 폴더 또는 None)
+        stack: List[Tuple[Optional[str], Optional[_GraphFolder]]] = [(None, ('', '', 0, excluded))]
+        while stack:
+            line, folder = stack.pop()
+            if line is not None:
+                yield line
+            if folder is None:
+                continue
+
+            rel_dir, prefix, depth, node = folder
+            entries = snapshot.visible_children(rel_dir, prune=self.file_manager.is_ignored,
+                                                progress=progress)
+            dirs = [entry for entry in entries if entry.is_dir]
+            files = [entry for entry in entries
+                     if not entry.is_dir and self._is_listed(entry, allowed_extensions, exclude_files)]
+
+            # 하위 폴더가 있으면 파일 앞에 세로선을 이어 그림
+            indent = prefix + ("│   " if dirs else "    ")
+            for entry in files:
+                yield indent + self._file_label(entry)
+            if files:
+                yield indent
+
+            children: List[Tuple[Optional[str], Optional[_GraphFolder]]] = []
+            for index, entry in enumerate(dirs):
+                is_last = index == len(dirs) - 1
+                child_line = prefix + ("└───" if is_last else "├───") + entry.name
+                child_node = node.child(entry.name) if node is not None else None
+                if child_node is not None and child_node.terminal:
+                    # 제외 폴더는 표시만 하고 하위로 내려가지 않음
+                    metrics.add('excluded_folder')
+                    children.append((child_line, None))
+                elif snapshot.can_descend(entry, depth):
+                    child_prefix = prefix + ("    " if is_last else "│   ")
+                    children.append((child_line, (entry.rel_path, child_prefix, depth + 1, child_node)))
+                else:
+                    children.append((child_line, None))
+            # 정렬 순서대로 출력하도록 역순으로 스택에 추가
+            stack.extend(reversed(children))
 
     def _walk(self,
-              path: Path,
+              rel_dir: str,
               allowed_extensions: Optional[List[str]],
               exclude_files: List[str],
-              exclude_folders: List[str],
-              prefix: str = "",
-              is_last: bool = False) -> Generator[str, None, None]:
-        """재귀적으로 디렉토리를 순회하며 트리 구조를 생성
+              excluded: Optional[TrieNode],
+              progress: Optional[Progress] = None) -> Generator[str, None, None]:
+        """스냅샷의 깊이 우선 순회(traverse)를 따라가며 트리 구조를 생성
+
+        재귀 대신 스냅샷의 스택 기반 순회를 사용하므로 트리 깊이에 제한이 없다.
 
         Args:
-            path (Path): 현재 경로
+            rel_dir (str): 루트 기준 시작 디렉토리 상대 경로 ('' 는 루트)
             allowed_extensions (Optional[List[str]]): 허용할 확장자 목록
             exclude_files (List[str]): 제외할 파일 목록
-            exclude_folders (List[str]): 제외할 폴더 목록
-            prefix (str, optional): 현재 깊이의 접두사
-            is_last (bool, optional): 현재 항목이 마지막인지 여부
+            excluded (Optional[TrieNode]): 시작 디렉토리에 해당하는 제외 폴더 트라이 노드
+                (None 이면 하위에 제외 폴더 없음)
+            progress (Optional[Progress], optional): 진행 상황 기록 및 취소 확인용 객체
 
         Yields:
             Generator[str, None, None]: 트리 구조의 각 줄
         """
-        # .gitignore 규칙 확인
-        if self.file_manager.should_ignore(str(path)):
-            return
-
         # 제외 폴더 확인
-        rel_path = path.relative_to(self.root_path)
-        str_rel_path = str(rel_path).replace('\\', '/')
-        if any(str_rel_path.startswith(f) for f in exclude_folders):
+        if excluded is not None and excluded.terminal:
             return
 
-        entries = sorted(os.scandir(path), key=lambda e: (not e.is_dir(), e.name.lower()))
-        entries = [e for e in entries if not self.file_manager.should_ignore(e.path)]
+        # 깊이별 접두사와 제외 폴더 트라이 노드 (인덱스 d 는 깊이 d 항목의 부모 기준)
+        prefixes = [""]
+        nodes = [excluded]
+        metrics = self.file_manager.metrics
 
-        if not entries:
-            return
+        def descend(entry) -> bool:
+            # 방금 추가한 폴더의 노드가 제외 대상이면 하위로 내려가지 않음
+            node = nodes[-1]
+            if node is not None and node.terminal:
+                metrics.add('excluded_folder')
+                return False
+            return True
 
-        for i, entry in enumerate(entries):
-            is_last_entry = (i == len(entries) - 1)
+        for event, entry, depth, is_last_entry in self.file_manager.snapshot.traverse(
+                rel_dir, prune=self.file_manager.is_ignored, descend=descend, progress=progress):
+            prefix = prefixes[depth]
 
-            # 파일인 경우 확장자 확인
-            if not entry.is_dir():
-                if entry.name in exclude_files:
-                    continue
+            if event == LEAVE:
+                # 마지막 항목이 아닐 경우 구분선 추가
+                if not is_last_entry:
+                    yield prefix + "│"
+                continue
+            if event != ENTRY:
+                continue
 
-                _, ext = os.path.splitext(entry.name)
-                if allowed_extensions is not None:
-                    if not (ext in allowed_extensions or (ext == '' and 'No Extension' in allowed_extensions)):
-                        continue
+            # 파일인 경우 확장자 확인
+            if not entry.is_dir and not self._is_listed(entry, allowed_extensions, exclude_files):
+                continue
 
             # 현재 항목의 라인 생성
             connector = "└─" if is_last_entry else "├─"
-            icon = "📁" if entry.is_dir() else "📄"
-            yield f"{prefix}{connector}{icon} {entry.name}{'/' if entry.is_dir() else ''}"
-
-            # 디렉토리인 경우 재귀 호출
-            if entry.is_dir():
-                # 새로운 prefix 계산
-                new_prefix = prefix + ("   " if is_last_entry else "│  ")
-                yield from self._walk(
-                    Path(entry.path),
-                    allowed_extensions,
-                    exclude_files,
-                    exclude_folders,
-                    new_prefix,
-                    is_last_entry
-                )
+            icon = "📁" if entry.is_dir else "📄"
+            label = f"{entry.name}/" if entry.is_dir else self._file_label(entry)
+            yield f"{prefix}{connector}{icon} {label}"
 
-                # 마지막 항목이 아닐 경우 구분선 추가
-                if not is_last_entry:
-                    yield prefix + "│"
\ No newline at end of file
+            if entry.is_dir:
+                # 하위 항목용 prefix 와 제외 폴더 노드 계산
+                del prefixes[depth + 1:]
+                del nodes[depth + 1:]
+                prefixes.append(prefix + ("   " if is_last_entry else "│  "))
+                parent = nodes[depth]
+                nodes.append(parent.child(entry.name) if parent is not None else None)
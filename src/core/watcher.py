@@ -0,0 +1,262 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Optional, Set
+from .snapshot import DirectorySnapshot
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+# 디렉토리 목록이나 파일 크기/수정 시각을 바꾸는 이벤트만 감시
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+               IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# struct inotify_event 의 고정 길이 부분: wd, mask, cookie, len (뒤에 len 바이트의 이름)
+_EVENT = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+class PollingWatcher:
+    """디렉토리 수정 시각(mtime)을 주기적으로 확인하는 감시기
+
+    스냅샷에 캐시된 디렉토리만 stat 하고, 수정 시각이 바뀐 디렉토리만
+    다시 읽도록 알려준다. 디렉토리의 수정 시각은 항목이 추가/삭제/이름 변경될 때
+    바뀌므로, 파일 내용만 제자리에서 바뀐 경우는 감지하지 못한다.
+
+    감시기는 스냅샷 데이터를 읽지 않으므로(sync 에 목록을 넘긴 경우) 스냅샷을 쓰는
+    작업 스레드와 별도의 스레드에서 poll() 할 수 있다. 단, 감시기 자체의 메서드는
+    한 스레드에서만 호출해야 한다.
+    """
+
+    backend = 'polling'
+
+    def __init__(self, snapshot: DirectorySnapshot):
+        """초기화
+
+        Args:
+            snapshot (DirectorySnapshot): 감시할 스냅샷
+        """
+        self.snapshot = snapshot
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self._pending: Set[str] = set()  # 다음 poll() 에서 무조건 다시 읽을 디렉토리
+        self._started = False
+        # 감시에 쓴 stat 호출 수 (다른 스레드에서 poll() 하므로 스냅샷 카운터와 따로 셈)
+        self.stat_calls = 0
+
+    def _stat_mtime(self, rel_dir: str) -> Optional[int]:
+        """디렉토리 수정 시각 (나노초), 사라졌으면 None"""
+        self.stat_calls += 1
+        try:
+            return os.stat(self.snapshot.abs_path(rel_dir)).st_mtime_ns
+        except OSError:
+            return None
+
+    def _watch(self, rel_dir: str) -> None:
+        """디렉토리 하나를 감시 대상에 추가"""
+        self._mtimes[rel_dir] = self._stat_mtime(rel_dir)
+
+    def _unwatch(self, rel_dir: str) -> None:
+        """디렉토리 하나를 감시 대상에서 제거"""
+        self._mtimes.pop(rel_dir, None)
+
+    def is_watching(self, rel_dir: str) -> bool:
+        """디렉토리를 감시 중인지 확인"""
+        return rel_dir in self._mtimes
+
+    def sync(self, rel_dirs: Optional[Iterable[str]] = None) -> int:
+        """스냅샷에 새로 캐시된 디렉토리를 감시 대상에 추가
+
+        처음 호출 이후에 추가된 디렉토리는 스캔과 감시 시작 사이의 변경을 놓치지 않도록
+        다음 poll() 에서 한 번 더 읽게 한다.
+
+        Args:
+            rel_dirs (Optional[Iterable[str]], optional): 캐시된 디렉토리 목록.
+                작업 스레드가 쉬는 동안 미리 받아 두면 다른 스레드에서 호출할 수 있다.
+                Defaults to snapshot.cached_directories().
+
+        Returns:
+            int: 새로 감시를 시작한 디렉토리 수
+        """
+        added = 0
+        if rel_dirs is None:
+            rel_dirs = self.snapshot.cached_directories()
+        for rel_dir in rel_dirs:
+            if not self.is_watching(rel_dir):
+                self._watch(rel_dir)
+                if self._started:
+                    self._pending.add(rel_dir)
+                added += 1
+        self._started = True
+        return added
+
+    def forget(self, rel_dirs: Iterable[str]) -> None:
+        """스냅샷에서 사라진 디렉토리의 감시 중단
+
+        Args:
+            rel_dirs (Iterable[str]): 캐시에서 버려진 디렉토리 (SnapshotDelta.removed_dirs)
+        """
+        for rel_dir in rel_dirs:
+            self._unwatch(rel_dir)
+            self._pending.discard(rel_dir)
+
+    def poll(self) -> Set[str]:
+        """마지막 확인 이후 바뀐 디렉토리 목록
+
+        Returns:
+            Set[str]: 다시 읽어야 할 디렉토리 (DirectorySnapshot.apply_changes 에 전달)
+        """
+        changed, self._pending = self._pending, set()
+        for rel_dir, mtime in list(self._mtimes.items()):
+            current = self._stat_mtime(rel_dir)
+            if current != mtime:
+                self._mtimes[rel_dir] = current
+                changed.add(rel_dir)
+        return changed
+
+    def close(self) -> None:
+        """감시 종료"""
+        self._mtimes.clear()
+        self._pending.clear()
+
+
+def _load_libc() -> ctypes.CDLL:
+    """inotify 함수가 있는 C 라이브러리 로드
+
+    Raises:
+        OSError: inotify 를 사용할 수 없는 경우
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if not hasattr(libc, 'inotify_init1'):
+        raise OSError("inotify 를 지원하지 않는 C 라이브러리입니다.")
+    libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    libc.inotify_rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+    return libc
+
+
+class InotifyWatcher(PollingWatcher):
+    """Linux inotify 로 디렉토리 변경 이벤트를 받는 감시기
+
+    디렉토리마다 watch 를 하나씩 등록하므로 파일 내용 변경까지 감지하며, poll() 은
+    쌓인 이벤트만 읽으므로 변경이 없으면 시스템 호출이 거의 없다. watch 수 한도
+    (fs.inotify.max_user_watches)를 넘은 디렉토리는 mtime 폴링으로 감시한다.
+    """
+
+    backend = 'inotify'
+
+    def __init__(self, snapshot: DirectorySnapshot):
+        """초기화
+
+        Args:
+            snapshot (DirectorySnapshot): 감시할 스냅샷
+
+        Raises:
+            OSError: inotify 를 사용할 수 없는 경우
+        """
+        super().__init__(snapshot)
+        self._libc = _load_libc()
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd: Optional[int] = fd
+        # 폴더 링크로 같은 디렉토리가 여러 경로에 보이면 watch 하나를 공유함
+        self._wds: Dict[int, Set[str]] = {}
+        self._dirs: Dict[str, int] = {}
+
+    def _watch(self, rel_dir: str) -> None:
+        path = os.fsencode(self.snapshot.abs_path(rel_dir))
+        wd = self._libc.inotify_add_watch(self._fd, path, _WATCH_MASK)
+        if wd < 0:
+            # watch 한도 초과 등으로 등록할 수 없으면 이 디렉토리만 폴링
+            super()._watch(rel_dir)
+            return
+        self._wds.setdefault(wd, set()).add(rel_dir)
+        self._dirs[rel_dir] = wd
+
+    def _unwatch(self, rel_dir: str) -> None:
+        wd = self._dirs.pop(rel_dir, None)
+        if wd is None:
+            super()._unwatch(rel_dir)
+            return
+        paths = self._wds.get(wd)
+        if paths is not None:
+            paths.discard(rel_dir)
+            if not paths:
+                del self._wds[wd]
+                # 이름이 바뀐 폴더는 watch 가 남아 있으므로 직접 해제
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _drop_wd(self, wd: int) -> None:
+        """커널이 해제한 watch 정리 (IN_IGNORED)"""
+        for rel_dir in self._wds.pop(wd, ()):
+            self._dirs.pop(rel_dir, None)
+
+    def is_watching(self, rel_dir: str) -> bool:
+        return rel_dir in self._dirs or super().is_watching(rel_dir)
+
+    def poll(self) -> Set[str]:
+        # 폴링으로 감시하는 디렉토리와 새로 추가된 디렉토리
+        changed = super().poll()
+        if self._fd is None:
+            return changed
+
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    # 이벤트가 넘쳐 유실되었으면 감시 중인 디렉토리를 모두 다시 읽음
+                    changed.update(self._dirs)
+                    continue
+                changed.update(self._wds.get(wd, ()))
+                if mask & IN_IGNORED:
+                    self._drop_wd(wd)
+        return changed
+
+    def close(self) -> None:
+        super().close()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._wds.clear()
+        self._dirs.clear()
+
+
+def create_watcher(snapshot: DirectorySnapshot, prefer_native: bool = True) -> PollingWatcher:
+    """사용할 수 있는 감시기를 만들고 캐시된 디렉토리 감시 시작
+
+    Args:
+        snapshot (DirectorySnapshot): 감시할 스냅샷 (먼저 스캔해 두어야 함)
+        prefer_native (bool, optional): 가능하면 inotify 를 사용할지 여부. Defaults to True.
+
+    Returns:
+        PollingWatcher: inotify 감시기, 사용할 수 없으면 mtime 폴링 감시기
+    """
+    watcher: Optional[PollingWatcher] = None
+    if prefer_native and sys.platform.startswith('linux'):
+        try:
+            watcher = InotifyWatcher(snapshot)
+        except (OSError, AttributeError):
+            watcher = None
+    if watcher is None:
+        watcher = PollingWatcher(snapshot)
+    watcher.sync()
+    return watcher
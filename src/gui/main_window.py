@@ -1,21 +1,37 @@
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
+from src.core.estimator import MergeEstimator
 from src.core.file_manager import FileManager
 from src.core.merger import FileMerger
+from src.core.progress import Progress
+from src.core.snapshot import SnapshotDelta
+from src.core.sniffer import DEFAULT_ENCODINGS
+from src.core.watcher import PollingWatcher, create_watcher
 from src.gui.widgets.folder_frame import FolderFrame
 from src.gui.widgets.extensions import ExtensionsFrame
 from src.gui.widgets.file_tree import FileTreeFrame
+from src.gui.widgets.virtual_output import VirtualOutput
 from src.gui.widgets.exclude_frame import ExcludeFrame
 from src.gui.status_bar import StatusBar
+from src.gui.task_runner import TaskRunner
 
 
 class MainWindow:
     """메인 윈도우 클래스"""
 
+    # 선택한 폴더의 변경 사항을 확인하는 간격 (최소/최대)
+    WATCH_INTERVAL_MS = 2000
+    MAX_WATCH_INTERVAL_MS = 30000
+    # 확인 간격은 한 번 확인하는 데 걸린 시간의 이 배수 이상으로 늘림 (감시 부하를 약 5% 이하로)
+    WATCH_COST_FACTOR = 20
+
     def __init__(self, master):
         self.master = master
         self.master.title("File Manager without CMD v25.1.1")
@@ -25,16 +41,36 @@ class MainWindow:
         # 스타일 설정
         self._setup_styles()
 
+        # 백그라운드 작업 실행기 (스캔/병합 중에도 창이 멈추지 않도록)
+        self.task_runner = TaskRunner(self.master, self._on_task_progress, self._on_task_idle)
+        self._cancel_requested = False
+        self._scan_progress: Optional[Progress] = None  # 진행 중인 폴더 분석
+
         # 컴포넌트 생성
         self._create_widgets()
 
         # 상태바 생성
         self.status_bar = StatusBar(self.master)
+        self.status_bar.set_cancel_command(self._cancel_tasks)
 
         # 파일 관리자 (초기값 None)
         self.file_manager = None
         self.merger = None
 
+        # 선택한 폴더의 변경 감시기 (스냅샷에 변경분만 반영)
+        # 변경이 없을 때의 확인은 사용자 작업 대기열을 막지 않도록 별도 스레드에서 실행
+        self._watcher: Optional[PollingWatcher] = None
+        self._watch_job: Optional[str] = None
+        self._watch_interval = self.WATCH_INTERVAL_MS
+        self._watch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='file-manager-watch')
+
+        # 변경분만 더해 갱신할 수 있도록 마지막으로 센 확장자별 파일 수와 상태바 파일/폴더 수
+        self._extension_counts: Dict[str, int] = {}
+        self._counts: Optional[Tuple[int, int]] = None
+        self._counts_selection: Tuple[str, ...] = ()  # _counts 를 셀 때의 확장자 선택
+
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _setup_styles(self):
         """스타일 설정"""
         self.style = ttk.Style()
@@ -89,11 +125,11 @@ class MainWindow:
         # 오른쪽 출력 영역
         self.output_frame = ttk.Frame(bottom_frame)
         self.output_frame.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
-        self.output = scrolledtext.ScrolledText(self.output_frame, wrap=tk.WORD)
+        self.output = VirtualOutput(self.output_frame)
         self.output.pack(fill=tk.BOTH, expand=True)
 
         # 파일 트리 기능 초기화
-        self.file_tree = FileTreeFrame(self.output)
+        self.file_tree = FileTreeFrame(self.output, self.task_runner)
 
         # 버튼 영역
         button_frame = ttk.Frame(container, padding="0")
@@ -116,6 +152,8 @@ class MainWindow:
                    command=lambda: self.file_tree.custom_tree(
                        self.extensions_frame.get_selected_extensions()
                    )).pack(fill=tk.X, pady=1)
+        ttk.Button(button_frame, text="트리 그래프 파일로 저장",
+                   command=self._save_custom_tree).pack(fill=tk.X, pady=1)
 
         # .gitignore 토글 체크박스
         self.gitignore_var = tk.BooleanVar(value=False)  # 기본값 False로 변경
@@ -127,6 +165,16 @@ class MainWindow:
             style="Transparent.TCheckbutton"
         ).pack(fill=tk.X, pady=(5, 0))
 
+        # 바이너리 파일 표시 체크박스 (파일마다 앞부분을 읽으므로 기본값은 꺼짐)
+        self.mark_binary_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            button_frame,
+            text="트리에 바이너리 파일 표시",
+            variable=self.mark_binary_var,
+            command=lambda: self.file_tree.set_mark_binary(self.mark_binary_var.get()),
+            style="Transparent.TCheckbutton"
+        ).pack(fill=tk.X)
+
         # Extensions 프레임도 container 안에 배치
         self.extensions_frame = ExtensionsFrame(
             container,
@@ -145,22 +193,143 @@ class MainWindow:
             command=self._merge_files
         )
         self.merge_button.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(
+            container,
+            text="병합 크기 예측",
+            command=self._estimate_merge,
+            style='Small.TButton'
+        ).pack(fill=tk.X, pady=(2, 0))
+
+    def _estimate_merge(self):
+        """선택한 조건으로 병합할 때의 크기를 파일을 읽지 않고 추정"""
+        if not self.file_manager:
+            messagebox.showwarning("경고", "폴더를 선택해주세요.")
+            return
+
+        selected_extensions = self.extensions_frame.get_selected_extensions()
+        if not selected_extensions:
+            messagebox.showwarning("경고", "병합할 파일 확장자를 선택해주세요.")
+            return
+
+        exclude_files, exclude_folders = self.exclude_frame.get_exclude_lists()
+        estimator = MergeEstimator(self.file_manager)
+        self.task_runner.run(
+            lambda progress: estimator.estimate(
+                selected_extensions, exclude_files, exclude_folders, progress=progress).format(),
+            self.file_tree.update_output,
+            self._on_task_error,
+            "병합 크기 예측 중"
+        )
+
+    def _save_custom_tree(self):
+        """커스텀 트리 그래프를 파일로 저장"""
+        if not self.file_manager:
+            messagebox.showwarning("경고", "폴더를 선택해주세요.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            initialfile=f"{datetime.now().strftime('%y%m%d-%H%M')}-tree.txt",
+            filetypes=[("텍스트 파일", "*.txt"), ("모든 파일", "*.*")]
+        )
+        if file_path:
+            self.file_tree.save_custom_tree(file_path, self.extensions_frame.get_selected_extensions())
+
+    def _on_close(self):
+        """창을 닫을 때 진행 중인 작업 취소"""
+        self._stop_watching()
+        self._watch_executor.shutdown(wait=False)
+        self.task_runner.shutdown()
+        self.master.destroy()
+
+    def _on_task_progress(self, description: str, progress: Progress):
+        """백그라운드 작업 진행 상황 표시"""
+        self.status_bar.show_progress(description, progress)
+
+    def _on_task_idle(self):
+        """모든 백그라운드 작업이 끝났을 때 호출"""
+        self.status_bar.hide_progress()
+        self.merge_button.state(['!disabled'])
+        # 이번에 끝난 작업들의 단계별 시간과 카운터를 표시하고 다음 작업을 위해 초기화
+        if self.file_manager is not None and not self.file_manager.metrics.empty:
+            self.status_bar.show_metrics(self.file_manager.metrics)
+            self.file_manager.reset_metrics()
+        if self._watcher is not None and self._watch_job is None:
+            self._schedule_watch()
+        if self._cancel_requested:
+            self._cancel_requested = False
+            self.status_bar.show_message("작업이 취소되었습니다.")
+
+    def _on_task_error(self, error: Exception):
+        """백그라운드 작업 중 오류 처리"""
+        messagebox.showerror("오류", f"작업 중 오류가 발생했습니다: {str(error)}")
+
+    def _cancel_tasks(self):
+        """취소 버튼 클릭 시 진행 중인 작업 취소"""
+        self._cancel_requested = True
+        self.task_runner.cancel_all()
+
+    def _refresh_status(self, selected_extensions=None, delta: Optional[SnapshotDelta] = None):
+        """상태바 파일/폴더 수를 백그라운드에서 다시 계산
+
+        Args:
+            selected_extensions (Optional[List[str]], optional): 파일 수를 셀 확장자 목록
+            delta (Optional[SnapshotDelta], optional): 함께 표시할 감시기의 변경 내역
+        """
+        file_manager = self.file_manager
+        if not file_manager:
+            self.status_bar.update_status(None)
+            return
+
+        def apply(counts):
+            self._set_counts(selected_extensions, counts)
+            if delta is None:
+                self.status_bar.set_counts(*counts)
+            else:
+                self.status_bar.show_changes(delta, *counts)
+
+        self.task_runner.run(
+            lambda progress: file_manager.count(selected_extensions, progress),
+            apply,
+            self._on_task_error,
+            "파일 수 계산 중"
+        )
+
+    def _set_counts(self, selected_extensions: Optional[List[str]], counts: Tuple[int, int]) -> None:
+        """상태바에 표시한 파일/폴더 수와 그 확장자 선택 기록"""
+        self._counts = counts
+        self._counts_selection = tuple(sorted(selected_extensions or ()))
+
+    def _set_extension_counts(self, extension_counts: Dict[str, int]) -> None:
+        """확장자별 파일 수를 기록하고 확장자 목록 갱신"""
+        self._extension_counts = {ext: count for ext, count in extension_counts.items() if count > 0}
+        extensions: Set[str] = {ext for ext in self._extension_counts if ext}
+        self.extensions_frame.update_extensions(extensions, '' in self._extension_counts)
 
     def _on_gitignore_toggle(self):
         """gitignore 적용 상태 변경 시 호출"""
         use_gitignore = self.gitignore_var.get()
+        file_manager = self.file_manager
+        if not file_manager:
+            return
 
-        # 파일 매니저에 상태 전달
-        if self.file_manager:
-            self.file_manager.set_use_gitignore(use_gitignore)
+        selected_extensions = self.extensions_frame.get_selected_extensions()
 
+        def analyze(progress: Progress):
+            # 파일 매니저에 상태 전달 (트리 생성기와 병합기도 같은 인스턴스를 공유)
+            file_manager.set_use_gitignore(use_gitignore)
+            return (file_manager.extension_counts(progress),
+                    file_manager.count(selected_extensions, progress))
+
+        def apply(result):
+            extension_counts, counts = result
             # 파일 확장자 목록 업데이트
-            extensions, has_no_extension = self.file_manager.analyze_extensions()
-            self.extensions_frame.update_extensions(extensions, has_no_extension)
+            self._set_extension_counts(extension_counts)
+            # 상태바 파일 수도 규칙 적용 여부에 맞춰 갱신
+            self._set_counts(selected_extensions, counts)
+            self.status_bar.set_counts(*counts)
 
-        # 트리 생성기에 상태 전달
-        if self.file_tree:
-            self.file_tree.set_use_gitignore(use_gitignore)
+        self.task_runner.run(analyze, apply, self._on_task_error, ".gitignore 규칙 적용 중")
 
     def _on_folder_select(self, folder_path: str):
         """폴더 선택 시 호출되는 콜백
@@ -171,31 +340,187 @@ class MainWindow:
         if not folder_path:
             return
 
-        # 하나의 FileManager 인스턴스 생성
-        self.file_manager = FileManager(folder_path)
+        # 이전 경로에 대한 분석은 결과가 필요 없으므로 취소 (병합 등 다른 작업은 유지)
+        if self._scan_progress is not None:
+            self._scan_progress.cancel()
+
+        # 하나의 FileManager 인스턴스 생성 (gitignore 상태 먼저 설정)
+        file_manager = FileManager(folder_path)
+        file_manager.set_use_gitignore(self.gitignore_var.get())
+
+        def scan(progress: Progress):
+            # 확장자 분석과 파일 수 계산이 같은 스냅샷을 공유하므로 폴더는 한 번만 탐색됨
+            return (file_manager.extension_counts(progress),
+                    file_manager.count(None, progress))
+
+        def apply(result):
+            # 그 사이 다른 경로가 선택되었다면 오래된 결과는 버림
+            if progress is not self._scan_progress:
+                return
+            self._scan_progress = None
+            extension_counts, counts = result
+
+            # 각 컴포넌트에 동일한 FileManager 전달
+            self.file_manager = file_manager
+            self.merger = FileMerger(folder_path, file_manager)
+            self.file_tree.initialize(folder_path, file_manager)
+
+            # 제외 프레임 초기화
+            self.exclude_frame.set_base_folder(folder_path)
+
+            # 확장자 목록 및 상태바 업데이트
+            self._set_extension_counts(extension_counts)
+            self._set_counts(None, counts)
+            self.status_bar.set_counts(*counts)
+
+            # 이후 변경 사항은 다시 스캔하지 않고 감시기로 반영
+            self._start_watching(file_manager)
+
+        progress = self.task_runner.run(scan, apply, self._on_task_error, "폴더 분석 중")
+        self._scan_progress = progress
+
+    def _start_watching(self, file_manager: FileManager):
+        """선택한 폴더의 변경 감시 시작 (이전 감시기는 정리)
+
+        Args:
+            file_manager (FileManager): 스캔이 끝난 파일 관리자
+        """
+        self._stop_watching()
+
+        def started(watcher: PollingWatcher):
+            # 그 사이 다른 폴더가 선택되었다면 버림
+            if file_manager is not self.file_manager:
+                watcher.close()
+                return
+            self._watcher = watcher
+
+        self.task_runner.run(
+            lambda progress: create_watcher(file_manager.snapshot),
+            started,
+            lambda error: None,  # 감시를 시작할 수 없어도 수동 작업은 그대로 동작
+            "변경 감시 준비 중"
+        )
+
+    def _stop_watching(self):
+        """변경 감시 중단"""
+        if self._watch_job is not None:
+            self.master.after_cancel(self._watch_job)
+            self._watch_job = None
+        self._watch_interval = self.WATCH_INTERVAL_MS
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            # 감시 스레드에서 poll() 중일 수 있으므로 같은 스레드에서 닫음
+            self._watch_executor.submit(watcher.close)
+
+    def _schedule_watch(self):
+        """다음 변경 확인 예약"""
+        self._watch_job = self.master.after(self._watch_interval, self._check_changes)
+
+    def _check_changes(self):
+        """감시 스레드에서 변경된 디렉토리 확인
+
+        작업 스레드가 쉬고 있을 때만 새로 캐시된 디렉토리 목록을 넘겨 감시 대상에 추가한다
+        (진행 중인 작업이 스냅샷을 바꾸는 동안에는 읽지 않음).
+        """
+        self._watch_job = None
+        watcher, file_manager = self._watcher, self.file_manager
+        if watcher is None or file_manager is None:
+            return
+
+        rel_dirs = None if self.task_runner.busy else file_manager.snapshot.cached_directories()
 
-        # 각 컴포넌트에 동일한 FileManager 전달
-        self.merger = FileMerger(folder_path, self.file_manager)
-        self.file_tree.initialize(folder_path, self.file_manager)
+        def poll():
+            if rel_dirs is not None:
+                watcher.sync(rel_dirs)
+            started = time.perf_counter()
+            changed = watcher.poll()
+            return changed, time.perf_counter() - started
 
-        # 제외 프레임 초기화
-        self.exclude_frame.set_base_folder(folder_path)
+        future = self._watch_executor.submit(poll)
+        self._watch_job = self.master.after(TaskRunner.POLL_INTERVAL_MS, self._on_watch_polled, watcher, future)
 
-        # gitignore 상태 먼저 설정
-        self._on_gitignore_toggle()
+    def _on_watch_polled(self, watcher: PollingWatcher, future: Future):
+        """감시 스레드의 확인 결과 처리 (변경이 있을 때만 작업 대기열에 반영 작업 추가)"""
+        self._watch_job = None
+        if watcher is not self._watcher:
+            return
+        if not future.done():
+            self._watch_job = self.master.after(TaskRunner.POLL_INTERVAL_MS,
+                                                self._on_watch_polled, watcher, future)
+            return
 
-        # 확장자 분석 및 업데이트 (gitignore 상태 적용 후)
-        extensions, has_no_extension = self.file_manager.analyze_extensions()
-        self.extensions_frame.update_extensions(extensions, has_no_extension)
+        try:
+            changed, elapsed = future.result()
+        except Exception:
+            # 감시에 실패해도 수동 작업은 그대로 동작하므로 다음 확인만 예약
+            self._schedule_watch()
+            return
 
-        # 상태바 업데이트
-        self.status_bar.update_status(folder_path)
+        # 디렉토리가 많아 확인이 오래 걸리면 간격을 늘림
+        self._watch_interval = min(self.MAX_WATCH_INTERVAL_MS,
+                                   max(self.WATCH_INTERVAL_MS, int(elapsed * 1000 * self.WATCH_COST_FACTOR)))
+        if not changed:
+            self._schedule_watch()
+            return
+        # 반영 작업이 끝나면 _on_task_idle 에서 다음 확인이 예약됨
+        self._apply_changes(watcher, changed)
+
+    def _apply_changes(self, watcher: PollingWatcher, changed: Set[str]):
+        """바뀐 디렉토리를 스냅샷에 반영하고 변경 내역만으로 확장자 목록과 상태바 갱신
+
+        Args:
+            watcher (PollingWatcher): 변경을 알려준 감시기
+            changed (Set[str]): 다시 읽을 디렉토리 목록
+        """
+        file_manager = self.file_manager
+        selected_extensions = self.extensions_frame.get_selected_extensions()
+
+        def check(progress: Progress):
+            delta = file_manager.apply_changes(changed)
+            if not delta:
+                # 변경이 없으면 측정값도 남기지 않음 (마지막 작업의 요약 유지)
+                file_manager.reset_metrics()
+                return delta, None
+            # 추가/삭제된 항목만 세므로 새로 생긴 폴더 외에는 파일 시스템을 읽지 않음
+            changes = file_manager.count_changes(delta, selected_extensions, progress)
+            if changes is not None:
+                return delta, (True,) + changes
+            # .gitignore 가 바뀌면 규칙이 적용되는 범위가 달라지므로 다시 셈
+            return delta, (False, file_manager.extension_counts(progress),
+                           *file_manager.count(selected_extensions, progress))
+
+        def apply(outcome):
+            delta, result = outcome
+            if watcher is not self._watcher:
+                return
+            if delta.removed_dirs:
+                self._watch_executor.submit(watcher.forget, delta.removed_dirs)
+            if result is None:
+                return
+
+            incremental, extension_counts, file_count, folder_count = result
+            if incremental:
+                for ext, count in self._extension_counts.items():
+                    extension_counts[ext] = extension_counts.get(ext, 0) + count
+            self._set_extension_counts(extension_counts)
+
+            if not incremental:
+                counts = (file_count, folder_count)
+            elif (self._counts is not None
+                  and self._counts_selection == tuple(sorted(selected_extensions or ()))):
+                counts = (self._counts[0] + file_count, self._counts[1] + folder_count)
+            else:
+                # 그 사이 확장자 선택이 바뀌어 더할 기준이 없으면 다시 셈
+                self._refresh_status(selected_extensions, delta)
+                return
+            self._set_counts(selected_extensions, counts)
+            self.status_bar.show_changes(delta, *counts)
+
+        self.task_runner.run(check, apply, lambda error: None, "변경 사항 반영 중")
 
     def _on_extension_selection_change(self):
         """확장자 선택 변경 시 호출되는 콜백"""
-        folder_path = self.folder_frame.folder_path.get()
-        selected_extensions = self.extensions_frame.get_selected_extensions()
-        self.status_bar.update_status(folder_path, selected_extensions)
+        self._refresh_status(self.extensions_frame.get_selected_extensions())
 
     def _merge_files(self):
         """파일 병합 실행"""
@@ -209,20 +534,28 @@ class MainWindow:
             return
 
         exclude_files, exclude_folders = self.exclude_frame.get_exclude_lists()
-
-        output_path = self.merger.merge_files(
-            selected_extensions,
-            exclude_files,
-            exclude_folders
-        )
-
-        if output_path:
-            self.file_tree.update_output(
-                f"병합된 파일이 {output_path}에 저장되었습니다."
+        merger = self.merger
+
+        def merge(progress: Progress):
+            return merger.merge_files(
+                selected_extensions,
+                exclude_files,
+                exclude_folders,
+                fallback_encodings=DEFAULT_ENCODINGS[1:],
+                use_cache=True,
+                progress=progress
             )
-            self.status_bar.update_status(
-                self.folder_frame.folder_path.get(),
-                selected_extensions
-            )
-        else:
-            messagebox.showerror("오류", "파일 병합 중 오류가 발생했습니다.")
\ No newline at end of file
+
+        def done(output_path):
+            if output_path:
+                message = f"병합된 파일이 {output_path}에 저장되었습니다."
+                if merger.last_cache_stats:
+                    message += f"\n{merger.last_cache_stats}"
+                self.file_tree.update_output(message)
+                self._refresh_status(selected_extensions)
+            else:
+                messagebox.showerror("오류", "파일 병합 중 오류가 발생했습니다.")
+
+        # 병합이 끝날 때까지 중복 실행 방지
+        self.merge_button.state(['disabled'])
+        self.task_runner.run(merge, done, self._on_task_error, "파일 병합 중")
@@ -1,8 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
-import os
-from typing import List, Optional, Tuple
-from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from src.core.file_manager import FileManager
+from src.core.metrics import Metrics
+from src.core.progress import Progress
+from src.core.snapshot import SnapshotDelta
 
 
 class StatusBar(ttk.Frame):
@@ -15,6 +17,8 @@ class StatusBar(ttk.Frame):
             master: 부모 위젯
         """
         super().__init__(master, relief=tk.SUNKEN, padding=(2, 2))
+        # 작업 진행 표시가 끝나면 되돌릴 상태 텍스트
+        self._status_text = ""
 
         # UI 초기화
         self._create_widgets()
@@ -25,6 +29,17 @@ class StatusBar(ttk.Frame):
         # 왼쪽 상태 텍스트 (파일/폴더 수 표시)
         self._status_left = ttk.Label(self, anchor=tk.W)
 
+        # 작업 취소 버튼 (작업 중에만 표시)
+        self._cancel_button = ttk.Button(
+            self,
+            text="취소",
+            width=6,
+            style='Small.TButton'
+        )
+
+        # 마지막 작업의 단계별 소요 시간과 카운터 요약
+        self._status_metrics = ttk.Label(self, anchor=tk.E)
+
         # 오른쪽 상태 텍스트 (GitHub 링크)
         self._status_right = ttk.Label(
             self,
@@ -37,41 +52,33 @@ class StatusBar(ttk.Frame):
         # 레이블 배치
         self._status_left.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self._status_right.pack(side=tk.RIGHT)
+        self._status_metrics.pack(side=tk.RIGHT, padx=(0, 10))
 
         # 프레임을 윈도우 하단에 배치
         self.pack(side=tk.BOTTOM, fill=tk.X)
 
     def _count_files_and_folders(self,
-                                 folder_path: str,
+                                 file_manager: FileManager,
                                  selected_extensions: Optional[List[str]] = None) -> Tuple[int, int]:
         """파일과 폴더 수 계산
 
         Args:
-            folder_path (str): 폴더 경로
+            file_manager (FileManager): 스냅샷을 공유하는 파일 관리자
             selected_extensions (Optional[List[str]], optional): 선택된 확장자 목록. Defaults to None.
 
         Returns:
             Tuple[int, int]: (파일 수, 폴더 수)
         """
         try:
-            file_count = 0
-            folder_count = 0
-
-            for root, dirs, files in os.walk(folder_path):
-                folder_count += len(dirs)
-
-                if selected_extensions:
-                    for file in files:
-                        _, ext = os.path.splitext(file)
-                        if ext in selected_extensions or (ext == '' and "No Extension" in selected_extensions):
-                            file_count += 1
-                else:
-                    file_count += len(files)
-
-            return file_count, folder_count
+            return file_manager.count(selected_extensions)
         except Exception:
             return 0, 0
 
+    def _set_status(self, text: str) -> None:
+        """왼쪽 상태 텍스트를 표시하고 진행 표시 후 되돌릴 수 있도록 기억"""
+        self._status_text = text
+        self._status_left.config(text=text)
+
     def _format_status_text(self, file_count: int, folder_count: int) -> str:
         """상태 텍스트 포맷팅
 
@@ -86,23 +93,77 @@ class StatusBar(ttk.Frame):
 
     # Public Interface Methods
     def update_status(self, folder_path: Optional[str] = None,
-                      selected_extensions: Optional[List[str]] = None) -> None:
+                      selected_extensions: Optional[List[str]] = None,
+                      file_manager: Optional[FileManager] = None) -> None:
         """상태 정보 업데이트
 
         Args:
             folder_path (Optional[str], optional): 선택된 폴더 경로. Defaults to None.
             selected_extensions (Optional[List[str]], optional): 선택된 확장자 목록. Defaults to None.
+            file_manager (Optional[FileManager], optional): 스냅샷을 공유하는 파일 관리자.
+                없으면 폴더를 새로 스캔. Defaults to None.
         """
         if not folder_path:
-            self._status_left.config(text="폴더를 선택해주세요")
+            self._set_status("폴더를 선택해주세요")
             return
 
         file_count, folder_count = self._count_files_and_folders(
-            folder_path,
+            file_manager or FileManager(folder_path),
             selected_extensions
         )
-        status_text = self._format_status_text(file_count, folder_count)
-        self._status_left.config(text=status_text)
+        self._set_status(self._format_status_text(file_count, folder_count))
+
+    def set_counts(self, file_count: int, folder_count: int) -> None:
+        """미리 계산된 파일/폴더 수 표시
+
+        Args:
+            file_count (int): 파일 수
+            folder_count (int): 폴더 수
+        """
+        self._set_status(self._format_status_text(file_count, folder_count))
+
+    def show_changes(self, delta: SnapshotDelta, file_count: int, folder_count: int) -> None:
+        """감시기가 반영한 변경 내역과 갱신된 파일/폴더 수 표시
+
+        Args:
+            delta (SnapshotDelta): 스냅샷에 반영된 변경 내역
+            file_count (int): 파일 수
+            folder_count (int): 폴더 수
+        """
+        text = self._format_status_text(file_count, folder_count)
+        self._set_status(f"{text} (변경 감지: {delta.summary()})")
+
+    def show_metrics(self, metrics: Metrics) -> None:
+        """마지막 작업의 단계별 소요 시간과 카운터 요약 표시
+
+        Args:
+            metrics (Metrics): 작업 중 기록된 측정값
+        """
+        self._status_metrics.config(text=metrics.summary())
+
+    def show_progress(self, description: str, progress: Progress) -> None:
+        """작업 진행 상황 표시
+
+        Args:
+            description (str): 작업 설명
+            progress (Progress): 진행 상황
+        """
+        self._status_left.config(text=f"{description}... {progress.summary()}")
+        if not self._cancel_button.winfo_ismapped():
+            self._cancel_button.pack(side=tk.RIGHT, padx=(0, 10), before=self._status_metrics)
+
+    def hide_progress(self) -> None:
+        """작업 취소 버튼을 숨기고 진행 표시 전의 상태 텍스트로 되돌림"""
+        self._cancel_button.pack_forget()
+        self._status_left.config(text=self._status_text)
+
+    def set_cancel_command(self, command: Callable[[], None]) -> None:
+        """취소 버튼을 눌렀을 때 호출될 함수 설정
+
+        Args:
+            command (Callable[[], None]): 취소 콜백
+        """
+        self._cancel_button.config(command=command)
 
     def show_message(self, message: str) -> None:
         """임시 메시지 표시
@@ -110,8 +171,9 @@ class StatusBar(ttk.Frame):
         Args:
             message (str): 표시할 메시지
         """
-        self._status_left.config(text=message)
+        self._set_status(message)
 
     def clear_status(self) -> None:
         """상태바 초기화"""
-        self._status_left.config(text="")
\ No newline at end of file
+        self._set_status("")
+        self._status_metrics.config(text="")
\ No newline at end of file
@@ -0,0 +1,129 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+from src.core.progress import OperationCancelled, Progress
+
+
+class _Task:
+    """실행 대기 중이거나 실행 중인 작업 하나"""
+
+    __slots__ = ('future', 'progress', 'on_done', 'on_error', 'description')
+
+    def __init__(self, future: Future, progress: Progress,
+                 on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[Exception], None]],
+                 description: str):
+        self.future = future
+        self.progress = progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.description = description
+
+
+class TaskRunner:
+    """스캔/병합 같은 긴 작업을 백그라운드 스레드에서 실행하는 클래스
+
+    작업은 스레드 하나에서 제출 순서대로 실행되므로 FileManager 와 스냅샷에
+    동시에 접근하지 않는다. 진행 상황과 결과는 Tk 의 after() 폴링으로
+    메인 스레드에서 전달된다.
+    """
+
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, master,
+                 on_progress: Callable[[str, Progress], None],
+                 on_idle: Callable[[], None]):
+        """초기화
+
+        Args:
+            master: after() 를 호출할 Tk 위젯
+            on_progress (Callable[[str, Progress], None]): 실행 중인 작업의 (설명, 진행 상황) 전달 콜백
+            on_idle (Callable[[], None]): 모든 작업이 끝났을 때 호출될 콜백
+        """
+        self._master = master
+        self._on_progress = on_progress
+        self._on_idle = on_idle
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='file-manager-task')
+        self._tasks: List[_Task] = []
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        """실행 중이거나 대기 중인 작업이 있는지 여부"""
+        return bool(self._tasks)
+
+    def run(self,
+            func: Callable[[Progress], Any],
+            on_done: Callable[[Any], None],
+            on_error: Optional[Callable[[Exception], None]] = None,
+            description: str = "작업 중") -> Progress:
+        """작업을 백그라운드에서 실행
+
+        Args:
+            func (Callable[[Progress], Any]): 작업 스레드에서 실행할 함수. Tk 위젯에 접근하면 안 됨
+            on_done (Callable[[Any], None]): 작업 결과를 받아 메인 스레드에서 호출될 콜백
+            on_error (Optional[Callable[[Exception], None]], optional): 예외 발생 시 호출될 콜백
+            description (str, optional): 상태바에 표시할 작업 설명
+
+        Returns:
+            Progress: 작업의 진행 상황 객체 (cancel() 로 개별 취소 가능)
+        """
+        progress = Progress()
+        future = self._executor.submit(self._execute, func, progress)
+        self._tasks.append(_Task(future, progress, on_done, on_error, description))
+        self._schedule_poll()
+        return progress
+
+    @staticmethod
+    def _execute(func: Callable[[Progress], Any], progress: Progress) -> Any:
+        """작업 스레드에서 실행 (시작 전에 취소된 작업은 건너뜀)"""
+        progress.check()
+        return func(progress)
+
+    def cancel_all(self) -> None:
+        """실행 중인 작업과 대기 중인 작업을 모두 취소"""
+        for task in self._tasks:
+            task.progress.cancel()
+
+    def shutdown(self) -> None:
+        """남은 작업을 취소하고 작업 스레드 종료"""
+        self.cancel_all()
+        self._executor.shutdown(wait=False)
+
+    def _schedule_poll(self) -> None:
+        """폴링이 멈춰 있으면 다시 시작"""
+        if not self._polling:
+            self._polling = True
+            self._master.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """끝난 작업의 콜백을 제출 순서대로 호출하고 진행 상황 갱신"""
+        try:
+            while self._tasks and self._tasks[0].future.done():
+                task = self._tasks.pop(0)
+                self._dispatch(task)
+        finally:
+            # 콜백에서 예외가 나도 폴링은 계속되어야 함
+            if self._tasks:
+                current = self._tasks[0]
+                self._on_progress(current.description, current.progress)
+                self._master.after(self.POLL_INTERVAL_MS, self._poll)
+            else:
+                self._polling = False
+                self._on_idle()
+
+    @staticmethod
+    def _dispatch(task: _Task) -> None:
+        """끝난 작업의 결과를 콜백으로 전달 (취소된 작업의 결과는 버림)"""
+        if task.progress.cancelled:
+            return
+        try:
+            result = task.future.result()
+        except OperationCancelled:
+            return
+        except Exception as e:
+            if task.on_error:
+                task.on_error(e)
+            else:
+                raise
+            return
+        task.on_done(result)
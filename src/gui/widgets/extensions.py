@@ -166,6 +166,11 @@ class ExtensionsFrame(ttk.Frame):
             has_no_extension (bool): 확장자 없는 파일 존재 여부
         """
         try:
+            # 확장자 구성이 그대로면 체크박스를 다시 만들지 않음 (변경 감시로 자주 호출됨)
+            current = set(extensions) | ({"No Extension"} if has_no_extension else set())
+            if self._toggle_var is not None and current == set(self._extension_vars):
+                return
+
             # 이전 선택 상태 저장
             previous_selections = {
                 ext: var.get()
@@ -1,15 +1,24 @@
-import tkinter as tk
-from tkinter import ttk
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 from src.core.tree_generator import TreeGenerator
 from src.core.command_executor import CommandExecutor
 from src.core.file_manager import FileManager
+from src.core.progress import Progress
+from src.gui.task_runner import TaskRunner
+from src.gui.widgets.virtual_output import VirtualOutput
 
 class FileTreeFrame:
-    def __init__(self, output):
+    def __init__(self, output: VirtualOutput, task_runner: TaskRunner):
         self._output = output
+        self._task_runner = task_runner
         self._tree_generator = None
         self._command_executor = None
+        self._mark_binary = False
+
+    def set_mark_binary(self, mark_binary: bool) -> None:
+        """트리 그래프에 바이너리 파일을 표시할지 설정 (켜면 파일마다 앞부분을 읽음)"""
+        self._mark_binary = mark_binary
+        if self._tree_generator:
+            self._tree_generator.mark_binary = mark_binary
 
     def set_use_gitignore(self, use_gitignore: bool) -> None:
         """gitignore 규칙 적용 여부 설정"""
@@ -21,47 +30,95 @@ class FileTreeFrame:
     def initialize(self, root_path: str, file_manager: FileManager) -> None:
         """트리 생성기와 명령어 실행기 초기화"""
         self._tree_generator = TreeGenerator(root_path, file_manager)
+        self._tree_generator.mark_binary = self._mark_binary
         self._command_executor = CommandExecutor(root_path, file_manager)
 
-    def ps_tree(self) -> None:
-        """PowerShell 트리 출력"""
-        if self._command_executor:
-            stdout, stderr = self._command_executor.ps_tree()
+    def _run_command(self, command: Callable[[Progress], Tuple[str, str]], description: str) -> None:
+        """(표준 출력, 표준 에러) 를 반환하는 명령을 백그라운드에서 실행하고 결과 표시"""
+        def show(result: Tuple[str, str]) -> None:
+            stdout, stderr = result
             if stderr:
                 self._show_error(stderr)
             else:
                 self.update_output(stdout)
 
+        self._task_runner.run(command, show, lambda e: self._show_error(str(e)), description)
+
+    def ps_tree(self) -> None:
+        """PowerShell 트리 출력"""
+        if self._command_executor:
+            executor = self._command_executor
+            self._run_command(executor.ps_tree, "파일 트리 리스트 생성 중")
+
     def cmd_tree(self) -> None:
-        """CMD 트리 출력"""
+        """CMD `tree /F` 형식 트리 출력 (만들어지는 대로 출력 영역에 이어 붙임)"""
         if self._command_executor:
-            stdout, stderr = self._command_executor.cmd_tree()
-            if stderr:
-                self._show_error(stderr)
-            else:
-                self.update_output(stdout)
+            executor = self._command_executor
+            mark_binary = self._mark_binary
+            stream = self._output.open_stream()
+
+            def write(progress: Progress) -> int:
+                # 취소되거나 실패해도 출력 영역이 스트림을 계속 기다리지 않도록 닫음
+                try:
+                    return executor.cmd_tree(stream, progress, mark_binary)
+                finally:
+                    stream.close()
+
+            stream.progress = self._task_runner.run(
+                write,
+                lambda line_count: None,
+                lambda e: self._show_error(str(e)),
+                "파일 트리 그래프 생성 중"
+            )
 
     def ps_tree_extensions(self, extensions: List[str] = None) -> None:
         """확장자 기반 PowerShell 트리 출력"""
         if self._command_executor:
-            stdout, stderr = self._command_executor.ps_tree_extensions(extensions)
-            if stderr:
-                self._show_error(stderr)
-            else:
-                self.update_output(stdout)
+            executor = self._command_executor
+            self._run_command(
+                lambda progress: executor.ps_tree_extensions(extensions, progress),
+                "파일 트리 리스트 생성 중"
+            )
 
     def custom_tree(self, allowed_extensions: List[str] = None) -> None:
         """커스텀 트리 출력"""
         if self._tree_generator:
-            tree = self._tree_generator.generate_ascii_tree(allowed_extensions)
-            self.update_output(tree)
+            generator = self._tree_generator
+            self._task_runner.run(
+                lambda progress: list(generator.iter_ascii_tree(allowed_extensions, progress=progress)),
+                self.update_output,
+                lambda e: self._show_error(str(e)),
+                "파일 트리 그래프 생성 중"
+            )
+
+    def save_custom_tree(self, file_path: str, allowed_extensions: List[str] = None) -> None:
+        """커스텀 트리를 출력 영역을 거치지 않고 파일로 저장"""
+        if self._tree_generator:
+            generator = self._tree_generator
+
+            def save(progress: Progress) -> int:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    return generator.write_ascii_tree(f, allowed_extensions, progress=progress)
+
+            self._task_runner.run(
+                save,
+                lambda line_count: self.update_output(
+                    f"트리 구조({line_count}줄)가 {file_path}에 저장되었습니다."),
+                lambda e: self._show_error(str(e)),
+                "파일 트리 그래프 저장 중"
+            )
+
+    def update_output(self, content: Union[str, Iterable[str]]) -> None:
+        """출력 영역 업데이트
 
-    def update_output(self, text: str) -> None:
-        """출력 영역 업데이트"""
-        self._output.delete(1.0, tk.END)
-        self._output.insert(tk.END, text)
+        Args:
+            content (Union[str, Iterable[str]]): 표시할 텍스트 또는 줄 목록
+        """
+        if isinstance(content, str):
+            self._output.set_text(content)
+        else:
+            self._output.set_lines(content)
 
     def _show_error(self, error_message: str) -> None:
         """에러 메시지 표시"""
-        self._output.delete(1.0, tk.END)
-        self._output.insert(tk.END, f"Error: {error_message}")
\ No newline at end of file
+        self._output.set_text(f"Error: {error_message}")
\ No newline at end of file
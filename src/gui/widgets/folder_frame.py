@@ -13,6 +13,9 @@ from src.core.command_executor import CommandExecutor
 class FolderFrame(ttk.Frame):
     """폴더 선택 및 관리를 위한 프레임 클래스"""
 
+    # 경로 입력이 멈춘 뒤 폴더를 분석하기까지 기다리는 시간 (밀리초)
+    DEBOUNCE_MS = 400
+
     def __init__(self, master, on_folder_select: Callable[[str], None]):
         """초기화
 
@@ -32,6 +35,10 @@ class FolderFrame(ttk.Frame):
         self.folder_path = tk.StringVar()
         self.folder_path.trace_add('write', self._on_path_change)
 
+        # 예약된 경로 변경 처리 (after id) 와 마지막으로 전달한 경로
+        self._pending_change: Optional[str] = None
+        self._last_selected: Optional[str] = None
+
         # UI 초기화
         self._create_widgets()
         self._setup_layout()
@@ -82,6 +89,8 @@ class FolderFrame(ttk.Frame):
             folder = filedialog.askdirectory()
             if folder:
                 self.folder_path.set(folder)
+                # 대화상자로 고른 경로는 기다리지 않고 바로 (같은 폴더라도 다시) 분석
+                self._apply_path_change(force=True)
         except Exception as e:
             messagebox.showerror("오류", f"폴더 선택 중 오류 발생: {str(e)}")
 
@@ -110,11 +119,35 @@ class FolderFrame(ttk.Frame):
             messagebox.showerror("오류", f"웹사이트를 여는 중 오류 발생: {str(e)}")
 
     def _on_path_change(self, *args) -> None:
-        """경로 변경 시 호출되는 콜백"""
+        """경로 변경 시 호출되는 콜백
+
+        입력 중인 경로의 중간 단계(C:\\, C:\\src ...)마다 폴더 전체를 분석하지 않도록
+        입력이 DEBOUNCE_MS 동안 멈춘 뒤에 한 번만 처리한다.
+        """
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+        self._pending_change = self.after(self.DEBOUNCE_MS, self._apply_path_change)
+
+    def _apply_path_change(self, force: bool = False) -> None:
+        """예약된 경로 변경을 처리
+
+        Args:
+            force (bool, optional): 직전과 같은 경로여도 다시 분석할지 여부. Defaults to False.
+        """
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+            self._pending_change = None
+
         try:
             path = self.folder_path.get()
-            if path and Path(path).exists():
-                self._on_folder_select_callback(path)
+            if not path or not Path(path).is_dir():
+                return
+
+            normalized = os.path.normcase(os.path.normpath(path))
+            if not force and normalized == self._last_selected:
+                return
+            self._last_selected = normalized
+            self._on_folder_select_callback(path)
         except Exception as e:
             messagebox.showerror("오류", f"경로 변경 처리 중 오류 발생: {str(e)}")
 
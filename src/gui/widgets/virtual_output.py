@@ -0,0 +1,313 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional
+from src.core.progress import Progress
+
+
+class OutputStream:
+    """작업 스레드에서 write() 한 텍스트를 출력 영역에 이어 붙이는 파일 객체
+
+    write() 와 close() 는 작업 스레드에서 호출하고, 쌓인 텍스트는 VirtualOutput 이
+    메인 스레드에서 주기적으로 가져가 줄 단위로 추가한다.
+    """
+
+    def __init__(self):
+        self._chunks: Deque[str] = deque()
+        self.closed = False
+        # 스트림에 쓰는 작업의 진행 상황 (시작 전에 취소되어 닫히지 않아도 기다리지 않도록)
+        self.progress: Optional[Progress] = None
+
+    def write(self, text: str) -> int:
+        """텍스트 추가 (줄바꿈 문자로 줄을 나눔)"""
+        self._chunks.append(text)
+        return len(text)
+
+    def close(self) -> None:
+        """더 이상 쓰지 않음을 표시 (남은 텍스트는 출력 영역이 마저 가져감)"""
+        self.closed = True
+
+    def drain(self) -> str:
+        """지금까지 쓴 텍스트를 꺼내 반환"""
+        parts = []
+        while self._chunks:
+            parts.append(self._chunks.popleft())
+        return "".join(parts)
+
+
+class VirtualOutput(ttk.Frame):
+    """화면에 보이는 줄만 Text 위젯에 넣는 가상화된 출력 영역
+
+    전체 결과는 줄 목록(또는 필요할 때만 읽는 제너레이터)으로 보관하고,
+    Text 위젯에는 현재 보이는 범위만 넣는다. 결과가 수십만 줄이어도
+    Tk 가 관리하는 텍스트 양은 창 높이만큼으로 일정하다.
+    """
+
+    # 제너레이터에서 한 번에 더 읽어 둘 줄 수
+    FETCH_BATCH = 1000
+    # 스트림에 쓰인 줄을 가져오는 간격
+    STREAM_INTERVAL_MS = 100
+
+    def __init__(self, master):
+        """초기화
+
+        Args:
+            master: 부모 위젯
+        """
+        super().__init__(master)
+        self._lines: List[str] = []
+        self._source: Optional[Iterator[str]] = None  # 아직 다 읽지 않은 줄 제너레이터
+        self._stream: Optional[OutputStream] = None   # 작업 스레드가 아직 쓰고 있는 스트림
+        self._partial = ""          # 스트림에서 아직 줄바꿈이 오지 않은 마지막 조각
+        self._first = 0             # 화면 첫 줄의 인덱스
+        self._highlight: Optional[int] = None  # 검색으로 찾은 줄
+
+        # UI 초기화
+        self._create_widgets()
+        self._setup_layout()
+        self._setup_event_bindings()
+
+    def _create_widgets(self) -> None:
+        """위젯 생성"""
+        # 검색/이동 도구 모음
+        self._toolbar = ttk.Frame(self)
+        self._search_var = tk.StringVar()
+        self._search_entry = ttk.Entry(self._toolbar, textvariable=self._search_var, width=30)
+        self._search_button = ttk.Button(self._toolbar, text="찾기", command=self.find_next,
+                                         style='Small.TButton')
+        self._goto_var = tk.StringVar()
+        self._goto_entry = ttk.Entry(self._toolbar, textvariable=self._goto_var, width=8)
+        self._goto_button = ttk.Button(self._toolbar, text="줄 이동", command=self._goto_line,
+                                       style='Small.TButton')
+        self._copy_button = ttk.Button(self._toolbar, text="전체 복사", command=self.copy_all,
+                                       style='Small.TButton')
+        self._position_label = ttk.Label(self._toolbar, anchor=tk.E)
+
+        # 출력 영역
+        self._text = tk.Text(self, wrap=tk.NONE, state=tk.DISABLED)
+        self._text.tag_configure('highlight', background='#fff2a8')
+        self._line_height = max(tkfont.Font(font=self._text.cget('font')).metrics('linespace'), 1)
+        self._vscroll = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._hscroll = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._text.xview)
+        self._text.configure(xscrollcommand=self._hscroll.set)
+
+    def _setup_layout(self) -> None:
+        """레이아웃 설정"""
+        self._toolbar.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 2))
+        self._search_entry.pack(side=tk.LEFT)
+        self._search_button.pack(side=tk.LEFT, padx=(2, 10))
+        self._goto_entry.pack(side=tk.LEFT)
+        self._goto_button.pack(side=tk.LEFT, padx=(2, 10))
+        self._copy_button.pack(side=tk.LEFT)
+        self._position_label.pack(side=tk.RIGHT)
+
+        self._text.grid(row=1, column=0, sticky="nsew")
+        self._vscroll.grid(row=1, column=1, sticky="ns")
+        self._hscroll.grid(row=2, column=0, sticky="ew")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    def _setup_event_bindings(self) -> None:
+        """이벤트 바인딩 설정"""
+        self._text.bind("<Configure>", lambda event: self._render())
+        self._text.bind("<MouseWheel>", self._on_mousewheel)
+        self._text.bind("<Button-4>", lambda event: self._scroll_by(-3))  # Linux 휠
+        self._text.bind("<Button-5>", lambda event: self._scroll_by(3))
+        self._text.bind("<Prior>", lambda event: self._scroll_by(-self._visible_rows()))
+        self._text.bind("<Next>", lambda event: self._scroll_by(self._visible_rows()))
+        self._text.bind("<Control-Home>", lambda event: self.scroll_to(0))
+        self._text.bind("<Control-End>", lambda event: self.scroll_to(self._fetch_all()))
+        self._search_entry.bind("<Return>", lambda event: self.find_next())
+        self._goto_entry.bind("<Return>", lambda event: self._goto_line())
+
+    # 줄 데이터 관리
+    def _fetch(self, count: int) -> bool:
+        """제너레이터에서 줄을 더 읽어 count 줄 이상 확보
+
+        Args:
+            count (int): 확보할 전체 줄 수
+
+        Returns:
+            bool: count 줄 이상 확보했으면 True
+        """
+        while self._source is not None and len(self._lines) < count:
+            batch = []
+            for line in self._source:
+                batch.append(line)
+                if len(batch) >= self.FETCH_BATCH:
+                    break
+            else:
+                self._source = None  # 다 읽음
+            self._lines.extend(batch)
+        return len(self._lines) >= count
+
+    def _fetch_all(self) -> int:
+        """남은 줄을 모두 읽고 마지막 줄 인덱스 반환"""
+        if self._source is not None:
+            self._lines.extend(self._source)
+            self._source = None
+        return max(len(self._lines) - 1, 0)
+
+    # 화면 갱신
+    def _visible_rows(self) -> int:
+        """현재 창 높이에 들어가는 줄 수"""
+        return max(self._text.winfo_height() // self._line_height, 1)
+
+    def _render(self) -> None:
+        """현재 위치에 보이는 줄만 Text 위젯에 다시 넣기"""
+        rows = self._visible_rows()
+        self._fetch(self._first + rows + self.FETCH_BATCH)
+        total = len(self._lines)
+        self._first = max(min(self._first, total - rows), 0)
+        visible = self._lines[self._first:self._first + rows]
+
+        self._text.configure(state=tk.NORMAL)
+        self._text.delete("1.0", tk.END)
+        self._text.insert("1.0", "\n".join(visible))
+        if self._highlight is not None and self._first <= self._highlight < self._first + rows:
+            row = self._highlight - self._first + 1
+            self._text.tag_add('highlight', f"{row}.0", f"{row}.end")
+        self._text.configure(state=tk.DISABLED)
+
+        # 스크롤바는 (아직 다 읽지 않았다면 지금까지 읽은) 전체 줄 수 기준
+        if total:
+            self._vscroll.set(self._first / total, min((self._first + rows) / total, 1.0))
+        else:
+            self._vscroll.set(0.0, 1.0)
+        more = "+" if self._source is not None or self._stream is not None else ""
+        self._position_label.config(
+            text=f"{self._first + 1 if total else 0}-{self._first + len(visible)} / {total}{more} 줄")
+
+    def _on_scrollbar(self, *args) -> None:
+        """스크롤바 조작 처리"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self._lines)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._visible_rows()
+            self._scroll_by(amount)
+
+    def _on_mousewheel(self, event) -> str:
+        """마우스 휠 이벤트 처리"""
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _scroll_by(self, amount: int) -> str:
+        """현재 위치에서 amount 줄만큼 이동"""
+        self.scroll_to(self._first + amount)
+        return "break"
+
+    def _goto_line(self) -> None:
+        """입력한 줄 번호로 이동"""
+        try:
+            line = int(self._goto_var.get()) - 1
+        except ValueError:
+            return
+        self._fetch(line + 1)
+        self._highlight = min(max(line, 0), max(len(self._lines) - 1, 0))
+        self.scroll_to(self._highlight)
+
+    def _drain_stream(self, stream: OutputStream) -> None:
+        """스트림에 쓰인 텍스트를 줄로 나눠 추가하고, 닫힐 때까지 다시 예약"""
+        if stream is not self._stream:
+            return  # 다른 내용으로 바뀜
+        # 닫힌 뒤에는 더 쓰지 않으므로 먼저 확인하고 가져감
+        closed = stream.closed or (stream.progress is not None and stream.progress.cancelled)
+        text = self._partial + stream.drain()
+        lines = text.split("\n")
+        self._partial = lines.pop()
+        if closed:
+            if self._partial:
+                lines.append(self._partial)
+            self._partial = ""
+            self._stream = None
+        else:
+            self.after(self.STREAM_INTERVAL_MS, self._drain_stream, stream)
+        if lines or closed:
+            self._lines.extend(lines)
+            self._render()
+
+    # Public Interface Methods
+    def open_stream(self) -> OutputStream:
+        """작업 스레드에서 결과를 써 넣을 스트림을 열고 출력 영역을 비움
+
+        Returns:
+            OutputStream: write() 한 줄이 도착하는 대로 표시되는 파일 객체
+        """
+        stream = OutputStream()
+        self.set_lines([])
+        self._stream = stream
+        self.after(self.STREAM_INTERVAL_MS, self._drain_stream, stream)
+        return stream
+
+    def set_lines(self, lines: Iterable[str]) -> None:
+        """표시할 줄 설정
+
+        Args:
+            lines (Iterable[str]): 줄 목록 또는 제너레이터 (제너레이터는 스크롤하는 만큼만 읽음)
+        """
+        if isinstance(lines, list):
+            self._lines, self._source = lines, None
+        else:
+            self._lines, self._source = [], iter(lines)
+        self._stream, self._partial = None, ""
+        self._first = 0
+        self._highlight = None
+        self._render()
+
+    def set_text(self, text: str) -> None:
+        """표시할 텍스트 설정
+
+        Args:
+            text (str): 표시할 텍스트
+        """
+        self.set_lines(text.split("\n"))
+
+    def scroll_to(self, line: int) -> None:
+        """지정한 줄이 화면 첫 줄이 되도록 이동
+
+        Args:
+            line (int): 0부터 시작하는 줄 인덱스
+        """
+        self._first = max(line, 0)
+        self._render()
+
+    def find_next(self) -> bool:
+        """검색어가 포함된 다음 줄로 이동 (끝에 도달하면 처음부터 다시 검색)
+
+        Returns:
+            bool: 찾았으면 True
+        """
+        keyword = self._search_var.get()
+        if not keyword:
+            return False
+
+        start = self._highlight + 1 if self._highlight is not None else self._first
+        index = start
+        while True:
+            if index >= len(self._lines) and not self._fetch(index + 1):
+                break
+            if keyword in self._lines[index]:
+                self._highlight = index
+                self.scroll_to(max(index - self._visible_rows() // 2, 0))
+                return True
+            index += 1
+
+        for index in range(0, min(start, len(self._lines))):
+            if keyword in self._lines[index]:
+                self._highlight = index
+                self.scroll_to(max(index - self._visible_rows() // 2, 0))
+                return True
+        return False
+
+    def get_text(self) -> str:
+        """전체 텍스트 반환 (다 읽지 않은 줄도 모두 읽음)"""
+        self._fetch_all()
+        return "\n".join(self._lines)
+
+    def copy_all(self) -> None:
+        """전체 텍스트를 클립보드에 복사"""
+        self.clipboard_clear()
+        self.clipboard_append(self.get_text())
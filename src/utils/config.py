@@ -0,0 +1,28 @@
+import os
+import sys
+from pathlib import Path
+
+# 캐시 디렉토리 위치를 바꾸고 싶을 때 사용하는 환경 변수
+CACHE_DIR_ENV = 'FILE_MERGER_CACHE_DIR'
+
+
+def get_cache_dir() -> Path:
+    """애플리케이션 캐시 디렉토리 경로 반환
+
+    환경 변수가 없으면 OS 별 사용자 캐시 위치 아래의 file-merger 폴더를 사용한다.
+
+    Returns:
+        Path: 캐시 디렉토리 경로 (존재 여부는 보장하지 않음)
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or str(Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base = str(Path.home() / 'Library' / 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+
+    return Path(base) / 'file-merger'
@@ -27,6 +27,41 @@ def get_file_extension(filename: str) -> str:
     return os.path.splitext(filename)[1]
 
 
+def format_size(size: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환
+
+    Args:
+        size (int): 바이트 수
+
+    Returns:
+        str: 예) '512 B', '1.5 MB'
+    """
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ('KB', 'MB', 'GB'):
+        value /= 1024
+        if value < 1024 or unit == 'GB':
+            break
+    return f"{value:.1f} {unit}"
+
+
+# 토큰 수를 어림할 때 쓰는 토큰당 평균 문자(바이트) 수
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(length: int) -> int:
+    """문자 수(또는 바이트 수)로 대략적인 토큰 수 추정
+
+    Args:
+        length (int): 문자 수 또는 바이트 수
+
+    Returns:
+        int: 추정 토큰 수 (올림)
+    """
+    return -(-length // CHARS_PER_TOKEN)
+
+
 def get_relative_path(path: Union[str, Path], base_path: Union[str, Path]) -> Optional[str]:
     """기준 경로에 대한 상대 경로 반환
 